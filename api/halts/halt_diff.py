@@ -0,0 +1,69 @@
+# ===============================================
+# 📁 FILE: halt_diff.py
+# 📍 LOCATION: api/halts/halt_diff.py
+# 🎯 PURPOSE: Diff engine between two halt snapshots (added / resumed / changed)
+# 👥 Author: Captain & Chatman
+# ===============================================
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+
+# ✅ Natural key of a halt — one symbol can be halted several times a day
+def halt_key(record: dict) -> Tuple[str, str]:
+    return (record["symbol"], record["halt_time"] or "")
+
+
+def key_dict(key: Tuple[str, str]) -> dict:
+    return {"symbol": key[0], "halt_time": key[1] or None}
+
+
+# ✅ Result of comparing two snapshots
+@dataclass(frozen=True)
+class HaltDelta:
+    added: tuple = ()
+    resumed: tuple = ()
+    changed: tuple = ()
+    removed: tuple = ()
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.resumed or self.changed or self.removed)
+
+    def as_dict(self) -> dict:
+        return {
+            "added": [dict(r) for r in self.added],
+            "resumed": [dict(r) for r in self.resumed],
+            "changed": [dict(r) for r in self.changed],
+            "removed": [key_dict(k) for k in self.removed],
+        }
+
+
+# ✅ Compare keyed snapshots
+def diff_halts(old: Dict[tuple, dict], new: Dict[tuple, dict]) -> HaltDelta:
+    """
+    added   → key only in `new`
+    resumed → resumption trade time appeared since `old`
+    changed → any other field difference
+    removed → key dropped out of the upstream feed
+    """
+    added, resumed, changed = [], [], []
+
+    for key, record in new.items():
+        previous = old.get(key)
+        if previous is None:
+            added.append(record)
+        elif previous != record:
+            if record["resume_trade_time"] and not previous["resume_trade_time"]:
+                resumed.append(record)
+            else:
+                changed.append(record)
+
+    removed = [key for key in old if key not in new]
+
+    return HaltDelta(
+        added=tuple(added),
+        resumed=tuple(resumed),
+        changed=tuple(changed),
+        removed=tuple(removed),
+    )
@@ -0,0 +1,103 @@
+# ===============================================
+# 📁 FILE: halt_feed.py
+# 📍 LOCATION: api/halts/halt_feed.py
+# 🎯 PURPOSE: Normalize the Nasdaq halted-securities payload into flat records
+# 👥 Author: Captain & Chatman
+# ===============================================
+
+import logging
+from datetime import datetime
+from typing import List, Optional
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+# ✅ Nasdaq publishes halt times as New York wall-clock values
+EXCHANGE_TZ = ZoneInfo("America/New_York")
+
+DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d")
+TIME_FORMATS = ("%H:%M:%S", "%H:%M:%S.%f", "%H:%M")
+
+
+# ✅ Locate the row list inside the (occasionally reshaped) upstream payload
+def extract_rows(payload) -> list:
+    if isinstance(payload, list):
+        return payload
+    if not isinstance(payload, dict):
+        return []
+
+    data = payload.get("data") or {}
+    if isinstance(data, list):
+        return data
+    if "rows" in data:
+        return data.get("rows") or []
+
+    halted = data.get("HaltedSecurities") or data.get("haltedSecurities") or {}
+    return halted.get("rows") or []
+
+
+# ✅ Combine upstream date + time strings into an ISO-8601 ET timestamp
+def parse_exchange_time(date_str: Optional[str], time_str: Optional[str]):
+    date_str = (date_str or "").strip()
+    time_str = (time_str or "").strip()
+    if not date_str or not time_str:
+        return None
+
+    for date_fmt in DATE_FORMATS:
+        for time_fmt in TIME_FORMATS:
+            try:
+                parsed = datetime.strptime(
+                    f"{date_str} {time_str}", f"{date_fmt} {time_fmt}"
+                )
+            except ValueError:
+                continue
+            return parsed.replace(tzinfo=EXCHANGE_TZ).isoformat()
+    return None
+
+
+def _clean(value) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+# ✅ Normalize one upstream row (returns None for rows without a symbol)
+def normalize_halt(row: dict) -> Optional[dict]:
+    symbol = _clean(row.get("issueSymbol") or row.get("symbol"))
+    if not symbol:
+        return None
+
+    halt_date = row.get("haltDate")
+    resume_date = row.get("resumptionDate") or halt_date
+
+    return {
+        "symbol": symbol.upper(),
+        "name": _clean(row.get("issueName") or row.get("name")),
+        "market": _clean(row.get("market")),
+        "reason_code": _clean(row.get("reasonCode")),
+        "halt_time": parse_exchange_time(halt_date, row.get("haltTime")),
+        "resume_quote_time": parse_exchange_time(
+            resume_date, row.get("resumptionQuoteTime")
+        ),
+        "resume_trade_time": parse_exchange_time(
+            resume_date, row.get("resumptionTradeTime")
+        ),
+        "pause_threshold_price": _clean(row.get("pauseThresholdPrice")),
+    }
+
+
+# ✅ Normalize the full payload, newest halts first
+def normalize_halts(payload) -> List[dict]:
+    records = []
+    for row in extract_rows(payload):
+        if not isinstance(row, dict):
+            continue
+        record = normalize_halt(row)
+        if record is None:
+            logger.debug("⚠ Skipping halt row without symbol: %s", row)
+            continue
+        records.append(record)
+
+    records.sort(key=lambda r: (r["halt_time"] or "", r["symbol"]), reverse=True)
+    return records
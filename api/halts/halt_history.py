@@ -0,0 +1,300 @@
+# ===============================================
+# 📁 FILE: halt_history.py
+# 📍 LOCATION: api/halts/halt_history.py
+# 🎯 PURPOSE: Persist halt history — batched COPY into a stage table + upsert merge
+# 👥 Author: Captain & Chatman
+# ===============================================
+
+import asyncio
+import base64
+import json
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+
+from api.halts.halt_feed import EXCHANGE_TZ
+from api.halts.halt_metrics import halt_metrics
+from api.halts.halt_store import HaltSnapshot, HaltStore, halt_store
+from control_console.config import (
+    HALT_HISTORY_BATCH_SIZE,
+    HALT_HISTORY_FLUSH_INTERVAL,
+    HALT_HISTORY_MAX_BUFFER,
+)
+from control_console.migrations import HALT_EVENTS_DDL, HALT_EVENTS_INDEXES
+
+logger = logging.getLogger(__name__)
+
+# ✅ Columns the history API returns — all INCLUDEd in the halt_events indexes
+#    (control_console/migrations.py), so pages come from index-only scans
+HISTORY_COLUMNS = (
+    "id",
+    "symbol",
+    "halt_time",
+    "market",
+    "reason_code",
+    "resume_quote_time",
+    "resume_trade_time",
+)
+
+# ✅ Session-local stage table; rows vanish at commit, the table is reused
+STAGE_DDL = """
+    CREATE TEMP TABLE IF NOT EXISTS halt_events_stage (
+        seq INTEGER,
+        symbol TEXT,
+        halt_time TIMESTAMPTZ,
+        name TEXT,
+        market TEXT,
+        reason_code TEXT,
+        resume_quote_time TIMESTAMPTZ,
+        resume_trade_time TIMESTAMPTZ,
+        pause_threshold_price TEXT
+    ) ON COMMIT DELETE ROWS
+"""
+
+STAGE_COLUMNS = (
+    "seq",
+    "symbol",
+    "halt_time",
+    "name",
+    "market",
+    "reason_code",
+    "resume_quote_time",
+    "resume_trade_time",
+    "pause_threshold_price",
+)
+
+# ✅ Latest staged row per natural key wins (DISTINCT ON … seq DESC)
+MERGE_SQL = """
+    INSERT INTO halt_events (
+        symbol, halt_time, name, market, reason_code,
+        resume_quote_time, resume_trade_time, pause_threshold_price
+    )
+    SELECT DISTINCT ON (symbol, halt_time)
+        symbol, halt_time, name, market, reason_code,
+        resume_quote_time, resume_trade_time, pause_threshold_price
+    FROM halt_events_stage
+    ORDER BY symbol, halt_time, seq DESC
+    ON CONFLICT (symbol, halt_time) DO UPDATE SET
+        name = EXCLUDED.name,
+        market = EXCLUDED.market,
+        reason_code = EXCLUDED.reason_code,
+        resume_quote_time = EXCLUDED.resume_quote_time,
+        resume_trade_time = EXCLUDED.resume_trade_time,
+        pause_threshold_price = EXCLUDED.pause_threshold_price,
+        last_seen = NOW()
+"""
+
+
+# ✅ Table + indexes (also migration 002 — for scripts that skip migrate())
+async def ensure_halt_events_table(db):
+    await db.execute(HALT_EVENTS_DDL)
+    for ddl in HALT_EVENTS_INDEXES:
+        await db.execute(ddl)
+
+
+def _ts(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+# ✅ Normalized record → COPY tuple (None for rows without a halt time)
+def to_stage_row(seq: int, record: dict):
+    if not record.get("halt_time"):
+        return None
+    return (
+        seq,
+        record["symbol"],
+        _ts(record["halt_time"]),
+        record.get("name"),
+        record.get("market"),
+        record.get("reason_code"),
+        _ts(record.get("resume_quote_time")),
+        _ts(record.get("resume_trade_time")),
+        record.get("pause_threshold_price"),
+    )
+
+
+async def copy_merge(db, records: List[dict]) -> int:
+    """
+    Writes one batch: binary COPY into the stage table, then one set-based
+    upsert into halt_events. Returns the number of staged rows.
+    """
+    rows = [r for r in (to_stage_row(i, rec) for i, rec in enumerate(records)) if r]
+    if not rows:
+        return 0
+    async with db.transaction():
+        await db.execute(STAGE_DDL)
+        await db.copy_records_to_table(
+            "halt_events_stage", records=rows, columns=STAGE_COLUMNS
+        )
+        await db.execute(MERGE_SQL)
+    return len(rows)
+
+
+# ✅ Writer — listens to snapshot swaps, buffers, flushes by size or interval
+class HaltHistoryWriter:
+    def __init__(
+        self,
+        db_pool=None,
+        store: HaltStore = halt_store,
+        batch_size: int = HALT_HISTORY_BATCH_SIZE,
+        flush_interval: float = HALT_HISTORY_FLUSH_INTERVAL,
+        max_buffer: int = HALT_HISTORY_MAX_BUFFER,
+    ):
+        self.db_pool = db_pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.written = 0
+        self.dropped = 0
+        self._buffer: List[dict] = []
+        self._wake = asyncio.Event()
+        self._task = None
+        store.add_listener(self.on_snapshot)
+
+    # ✅ Snapshot listener — only rows that actually changed are queued
+    def on_snapshot(self, snapshot: HaltSnapshot):
+        delta = snapshot.delta
+        self.enqueue(delta.added + delta.resumed + delta.changed)
+
+    def enqueue(self, records):
+        self._buffer.extend(records)
+        overflow = len(self._buffer) - self.max_buffer
+        if overflow > 0:
+            del self._buffer[:overflow]
+            self.dropped += overflow
+            logger.warning("⚠ Halt history buffer full, dropped %d rows", overflow)
+        if len(self._buffer) >= self.batch_size:
+            self._wake.set()
+
+    # ✅ Lifecycle
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="halt-history")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("❌ Halt history flush failed: %s", e)
+
+    async def flush(self):
+        while self._buffer and self.db_pool is not None:
+            batch = self._buffer[: self.batch_size]
+            del self._buffer[: len(batch)]
+            try:
+                async with self.db_pool.acquire() as db:
+                    with halt_metrics.timed("persist"):
+                        count = await copy_merge(db, batch)
+            except BaseException:
+                self._buffer[:0] = batch  # Put back for the next attempt
+                raise
+            self.written += count
+
+
+# ✅ Opaque keyset cursor: last (halt_time, id) of the previous page
+def encode_cursor(halt_time: datetime, row_id: int) -> str:
+    raw = f"{halt_time.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    padded = cursor + "=" * (-len(cursor) % 4)
+    halt_time, row_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|")
+    return datetime.fromisoformat(halt_time), int(row_id)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=EXCHANGE_TZ)
+
+
+# ✅ Build the seek query — no OFFSET, ever
+def history_query(
+    symbol: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    reason_code: Optional[str] = None,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    limit: int = 1000,
+):
+    clauses, args = [], []
+
+    def add(clause: str, value):
+        args.append(value)
+        clauses.append(clause.format(f"${len(args)}"))
+
+    if symbol:
+        add("symbol = {}", symbol.upper())
+    if reason_code:
+        add("reason_code = {}", reason_code.upper())
+    if start:
+        add("halt_time >= {}", _day_start(start))
+    if end:
+        add("halt_time < {}", _day_start(end + timedelta(days=1)))  # end inclusive
+    if cursor:
+        after_time, after_id = decode_cursor(cursor)
+        args.extend([after_time, after_id])
+        op = "<" if descending else ">"
+        clauses.append(f"(halt_time, id) {op} (${len(args) - 1}, ${len(args)})")
+
+    direction = "DESC" if descending else "ASC"
+    args.append(limit)
+    query = f"""
+        SELECT {", ".join(HISTORY_COLUMNS)}
+        FROM halt_events
+        WHERE {" AND ".join(clauses) or "TRUE"}
+        ORDER BY halt_time {direction}, id {direction}
+        LIMIT ${len(args)}
+    """
+    return query, args
+
+
+def _history_line(row) -> dict:
+    item = dict(row)
+    for column in ("halt_time", "resume_quote_time", "resume_trade_time"):
+        if item[column] is not None:
+            item[column] = item[column].astimezone(EXCHANGE_TZ).isoformat()
+    return item
+
+
+async def stream_history(db_pool, query: str, args: list, limit: int, chunk=65536):
+    """
+    Yields NDJSON chunks straight from a server-side cursor, so memory stays
+    flat regardless of the date range. A final {"next_cursor": ...} line is
+    emitted when the page was full.
+    """
+    buffer, count, last = [], 0, None
+    size = 0
+    async with db_pool.acquire() as db:
+        async with db.transaction(readonly=True):
+            async for row in db.cursor(query, *args, prefetch=1000):
+                line = json.dumps(_history_line(row), separators=(",", ":")) + "\n"
+                buffer.append(line)
+                size += len(line)
+                count += 1
+                last = row
+                if size >= chunk:
+                    yield "".join(buffer).encode("utf-8")
+                    buffer, size = [], 0
+
+    if count == limit and last is not None:
+        next_cursor = encode_cursor(last["halt_time"], last["id"])
+        buffer.append(json.dumps({"next_cursor": next_cursor}) + "\n")
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
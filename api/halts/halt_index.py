@@ -0,0 +1,170 @@
+# ===============================================
+# 📁 FILE: halt_index.py
+# 📍 LOCATION: api/halts/halt_index.py
+# 🎯 PURPOSE: Compact halt records + symbol / halt-time indexes for one snapshot
+# 👥 Author: Captain & Chatman
+# ===============================================
+
+import json
+import sys
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from api.halts.halt_feed import EXCHANGE_TZ
+
+# ✅ Same fields (and order) normalize_halt produces
+HALT_FIELDS = (
+    "symbol",
+    "name",
+    "market",
+    "reason_code",
+    "halt_time",
+    "resume_quote_time",
+    "resume_trade_time",
+    "pause_threshold_price",
+)
+
+# Low-cardinality strings shared by many records
+_INTERNED = ("symbol", "market", "reason_code")
+
+
+# ✅ One halt — slots instead of a per-record dict, still readable like one
+class HaltRecord:
+    __slots__ = HALT_FIELDS
+
+    def __init__(self, **fields):
+        for name in HALT_FIELDS:
+            value = fields.get(name)
+            if name in _INTERNED and isinstance(value, str):
+                value = sys.intern(value)
+            setattr(self, name, value)
+
+    @classmethod
+    def from_dict(cls, record) -> "HaltRecord":
+        if isinstance(record, cls):
+            return record
+        return cls(**record)
+
+    # Mapping-style access keeps diff / history / stream code unchanged
+    def __getitem__(self, name: str):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def get(self, name: str, default=None):
+        return getattr(self, name, default)
+
+    def keys(self):
+        return HALT_FIELDS
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in HALT_FIELDS}
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, HaltRecord):
+            return all(getattr(self, n) == getattr(other, n) for n in HALT_FIELDS)
+        if isinstance(other, dict):
+            return self.as_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"HaltRecord({self.as_dict()!r})"
+
+
+def _encode_row(record: HaltRecord) -> bytes:
+    return json.dumps(record.as_dict(), separators=(",", ":")).encode("utf-8")
+
+
+def to_epoch(value) -> Optional[float]:
+    """ISO string or datetime → epoch seconds (naive values are exchange time)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=EXCHANGE_TZ)
+    return value.timestamp()
+
+
+# ✅ Read-only index over one snapshot, built once per version
+class HaltIndex:
+    """
+    records   → snapshot order (newest first)
+    body      → the whole snapshot encoded once; rows are sliced out of it by
+                offset, so filtered responses are a join with no re-encoding
+    symbol    → hash index: symbol → positions (O(1) lookup)
+    halt time → epochs sorted ascending + matching positions (bisect range scans)
+    """
+
+    __slots__ = ("records", "_body", "_bounds", "_by_symbol", "_epochs", "_by_time")
+
+    def __init__(self, records: Iterable[HaltRecord] = ()):
+        self.records: Tuple[HaltRecord, ...] = tuple(records)
+
+        chunks, bounds, offset = [b"["], array("Q"), 1
+        for position, record in enumerate(self.records):
+            row = _encode_row(record)
+            if position:
+                chunks.append(b",")
+                offset += 1
+            chunks.append(row)
+            bounds.append(offset)
+            offset += len(row)
+            bounds.append(offset)
+        chunks.append(b"]")
+        self._body = b"".join(chunks)
+        self._bounds = bounds
+
+        by_symbol: Dict[str, List[int]] = {}
+        timed = []
+        for position, record in enumerate(self.records):
+            by_symbol.setdefault(record.symbol, []).append(position)
+            epoch = to_epoch(record.halt_time)
+            if epoch is not None:
+                timed.append((epoch, position))
+        timed.sort()
+
+        self._by_symbol = {s: tuple(p) for s, p in by_symbol.items()}
+        self._epochs = array("d", (epoch for epoch, _ in timed))
+        self._by_time = array("I", (position for _, position in timed))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def row(self, position: int) -> memoryview:
+        bounds = self._bounds
+        return memoryview(self._body)[bounds[2 * position] : bounds[2 * position + 1]]
+
+    def body(self, positions: Optional[Iterable[int]] = None) -> bytes:
+        if positions is None:
+            return self._body
+        return b"[" + b",".join(self.row(p) for p in positions) + b"]"
+
+    def symbol(self, symbol: str) -> Tuple[int, ...]:
+        return self._by_symbol.get(symbol.upper(), ())
+
+    def after(self, epoch: float) -> List[int]:
+        """Positions halted strictly after `epoch`, newest first."""
+        start = bisect_right(self._epochs, epoch)
+        return self._by_time[start:][::-1].tolist()
+
+    def select(self, symbol: Optional[str] = None, after=None) -> List[int]:
+        after_epoch = to_epoch(after)
+        if symbol:
+            positions = self.symbol(symbol)
+            if after_epoch is None:
+                return list(positions)
+            # A symbol has a handful of halts — filter its short list
+            return [
+                p
+                for p in positions
+                if (to_epoch(self.records[p].halt_time) or 0) > after_epoch
+            ]
+        if after_epoch is not None:
+            return self.after(after_epoch)
+        return list(range(len(self.records)))
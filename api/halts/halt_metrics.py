@@ -0,0 +1,72 @@
+# ===============================================
+# 📁 FILE: halt_metrics.py
+# 📍 LOCATION: api/halts/halt_metrics.py
+# 🎯 PURPOSE: Per-stage latency samples for the halt pipeline (fetch → publish)
+# 👥 Author: Captain & Chatman
+# ===============================================
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict
+
+# ✅ Stages in pipeline order
+STAGES = ("fetch", "parse", "diff", "publish", "persist")
+
+SAMPLES_PER_STAGE = 4096
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[rank]
+
+
+# ✅ Rolling window of recent samples per stage — cheap enough to leave on
+class StageMetrics:
+    def __init__(self, samples: int = SAMPLES_PER_STAGE):
+        self._samples: Dict[str, deque] = {
+            stage: deque(maxlen=samples) for stage in STAGES
+        }
+        self.counts: Dict[str, int] = dict.fromkeys(STAGES, 0)
+
+    def observe(self, stage: str, seconds: float):
+        if stage not in self._samples:
+            self._samples[stage] = deque(maxlen=SAMPLES_PER_STAGE)
+            self.counts[stage] = 0
+        self._samples[stage].append(seconds)
+        self.counts[stage] += 1
+
+    @contextmanager
+    def timed(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def reset(self):
+        for stage in list(self._samples):
+            self._samples[stage].clear()
+            self.counts[stage] = 0
+
+    def summary(self) -> Dict[str, dict]:
+        """p50 / p90 / p99 / max in milliseconds for every stage with samples."""
+        report = {}
+        for stage, samples in self._samples.items():
+            if not samples:
+                continue
+            values = sorted(samples)
+            report[stage] = {
+                "count": self.counts[stage],
+                "p50_ms": round(percentile(values, 50) * 1000, 3),
+                "p90_ms": round(percentile(values, 90) * 1000, 3),
+                "p99_ms": round(percentile(values, 99) * 1000, 3),
+                "max_ms": round(values[-1] * 1000, 3),
+            }
+        return report
+
+
+# ✅ Shared instance
+halt_metrics = StageMetrics()
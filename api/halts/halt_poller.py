@@ -0,0 +1,193 @@
+# ===============================================
+# 📁 FILE: halt_poller.py
+# 📍 LOCATION: api/halts/halt_poller.py
+# 🎯 PURPOSE: Background asyncio task that ingests the Nasdaq halt feed
+# 👥 Author: Captain & Chatman
+# ===============================================
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from api.halts.halt_feed import normalize_halts
+from api.halts.halt_metrics import StageMetrics, halt_metrics
+from api.halts.halt_store import HaltStore, halt_store
+from control_console.business import get_market_session
+from control_console.config import (
+    HALT_POLL_INTERVAL,
+    HALT_POLL_INTERVAL_EXTENDED,
+    HALT_POLL_TIMEOUT,
+    NASDAQ_API_KEY,
+    NASDAQ_HALTS_URL,
+)
+from control_console.key_scheduler import KeyScheduler, key_scheduler
+from control_console.market_calendar import market_calendar
+from control_console.market_sessions import AFTER_MARKET, MARKET_OPEN, PRE_MARKET
+from control_console.utils.http_client import UpstreamHTTP, upstream_http
+
+# ✅ Upstream answers that count against a key's circuit breaker
+KEY_FAILURE_STATUSES = {401, 403, 429}
+
+logger = logging.getLogger(__name__)
+
+HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "IonaBrand-HaltPoller/1.0",
+}
+
+
+# ✅ Poller — one upstream call per interval, never per client request;
+#    the interval follows the market session (none at all while closed)
+class HaltPoller:
+    def __init__(
+        self,
+        db_pool=None,
+        store: HaltStore = halt_store,
+        url: str = NASDAQ_HALTS_URL,
+        interval: float = HALT_POLL_INTERVAL,
+        extended_interval: float = HALT_POLL_INTERVAL_EXTENDED,
+        timeout: float = HALT_POLL_TIMEOUT,
+        scheduler: KeyScheduler = key_scheduler,
+        http: UpstreamHTTP = upstream_http,
+        metrics: StageMetrics = halt_metrics,
+    ):
+        self.db_pool = db_pool
+        self.scheduler = scheduler
+        self.http = http
+        self.metrics = metrics
+        self.store = store
+        self.url = url
+        self.interval = interval
+        self.extended_interval = extended_interval
+        self.timeout = timeout
+        self.session = None  # (status, ends_at) — cached until ends_at
+        self._calendar_version = None  # …or until the holiday calendar reloads
+        self.polls = 0
+        self.skipped = 0
+        self._task = None
+
+    # ✅ Lifecycle
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="halt-poller")
+            logger.info("🛰️ Halt poller started (%ss) → %s", self.interval, self.url)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("🛑 Halt poller stopped")
+
+    async def _run(self):
+        polled = False
+        while True:
+            status, ends_at = await self.current_session()
+            interval = self.cadence(status)
+            if interval is not None or not polled:  # Always fill the store once
+                try:
+                    await self.poll_once()
+                    polled = True
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error("❌ Halt poll failed: %s", e)
+                    if not polled:
+                        # Store still empty — don't wait out a closed session
+                        interval = interval or self.extended_interval
+            else:
+                self.skipped += 1
+
+            delay = self.next_delay(interval, ends_at)
+            self.store.next_refresh = time.time() + delay
+            await asyncio.sleep(delay)
+
+    # ✅ Cadence: fast in the regular session, slower in extended hours, off when closed
+    def cadence(self, status: str):
+        if status == MARKET_OPEN:
+            return self.interval
+        if status in (PRE_MARKET, AFTER_MARKET):
+            return self.extended_interval
+        return None
+
+    @staticmethod
+    def next_delay(interval, ends_at: datetime, now=None) -> float:
+        now = now or datetime.now(timezone.utc)
+        # Compare in UTC: same-zone aware subtraction ignores DST shifts
+        remaining = ends_at.astimezone(timezone.utc) - now.astimezone(timezone.utc)
+        until_transition = max(1.0, remaining.total_seconds())
+        return until_transition if interval is None else min(interval, until_transition)
+
+    async def current_session(self):
+        now = datetime.now(timezone.utc)
+        if (
+            self.session is not None
+            and now < self.session[1]
+            and self._calendar_version == market_calendar.version
+        ):
+            return self.session
+        try:
+            await market_calendar.ensure_fresh(self.db_pool)
+            self.session = await get_market_session(now=now)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # No calendar → behave as if open; retry the lookup next cycle
+            logger.error("❌ Market session lookup failed: %s", e)
+            return MARKET_OPEN, now + timedelta(seconds=self.interval)
+        self._calendar_version = market_calendar.version
+        logger.info("🕰️ Market session: %s until %s", self.session[0], self.session[1])
+        return self.session
+
+    # ✅ API key: scheduled DB key first (limits + circuit), env fallback second
+    async def _resolve_api_key(self):
+        budget = await self.scheduler.acquire(self.db_pool, max_wait=self.interval)
+        if budget is not None:
+            return budget.api_secret, budget.key_id
+        if self.scheduler.has_keys:
+            raise RuntimeError("No API key has budget or a closed circuit")
+        return NASDAQ_API_KEY, None
+
+    async def fetch(self):
+        api_key, key_id = await self._resolve_api_key()
+        headers = dict(HEADERS)
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+
+        health = self.scheduler.health
+        started = time.monotonic()
+        try:
+            response = await self.http.get(
+                self.url, headers=headers, timeout=self.timeout
+            )
+        except httpx.HTTPError as e:
+            if key_id is not None:
+                health.record_failure(key_id, type(e).__name__)
+            raise
+
+        latency = time.monotonic() - started
+        if key_id is not None:
+            status = response.status_code
+            if status >= 500 or status in KEY_FAILURE_STATUSES:
+                health.record_failure(key_id, f"HTTP {status}", latency)
+            else:
+                health.record_success(key_id, latency)
+
+        response.raise_for_status()
+        return response.content
+
+    # ✅ One ingestion cycle: fetch → parse → swap snapshot (diff + publish)
+    async def poll_once(self) -> int:
+        with self.metrics.timed("fetch"):
+            body = await self.fetch()
+        with self.metrics.timed("parse"):
+            records = normalize_halts(json.loads(body))
+        self.store.replace(records)
+        self.polls += 1
+        logger.debug("📥 Ingested %d halts", len(records))
+        return len(records)
@@ -0,0 +1,240 @@
+# ===============================================
+# 📁 FILE: halt_replay.py
+# 📍 LOCATION: api/halts/halt_replay.py
+# 🎯 PURPOSE: Record upstream halt responses to disk and replay them offline
+# 🧪 USAGE: python -m api.halts.halt_replay record --out day.ndjson.gz --duration 3600
+#          python -m api.halts.halt_replay synth --out synth.ndjson.gz --frames 1500
+#          python -m api.halts.halt_replay serve day.ndjson.gz --speed 10 --port 8081
+# 👥 Author: Captain & Chatman
+# ===============================================
+
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+from api.halts.halt_feed import EXCHANGE_TZ
+from api.halts.halt_poller import HEADERS
+from api.halts.nasdaq_stub import STUB_PATH, NasdaqStubServer
+from control_console.config import HALT_POLL_INTERVAL, NASDAQ_API_KEY, NASDAQ_HALTS_URL
+from control_console.utils.http_client import build_http_client
+
+logger = logging.getLogger(__name__)
+
+# Never replayed: they describe the original connection, not the payload
+HOP_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "connection"}
+
+
+# ✅ Recording file: one JSON frame per line, gzip when the name ends in .gz
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def write_frames(path: str, frames: Iterable[dict]) -> int:
+    count = 0
+    with _open(path, "w") as out:
+        for frame in frames:
+            out.write(json.dumps(frame, separators=(",", ":")) + "\n")
+            count += 1
+    return count
+
+
+def load_frames(path: str) -> List[dict]:
+    with _open(path, "r") as src:
+        return [json.loads(line) for line in src if line.strip()]
+
+
+# ✅ Recorder — same headers / API key the poller sends
+async def record(
+    path: str,
+    url: str = NASDAQ_HALTS_URL,
+    interval: float = HALT_POLL_INTERVAL,
+    duration: float = 3600,
+) -> int:
+    headers = dict(HEADERS)
+    if NASDAQ_API_KEY:
+        headers["Authorization"] = f"Bearer {NASDAQ_API_KEY}"
+
+    frames = 0
+    started = time.monotonic()
+    async with build_http_client() as client:
+        with _open(path, "w") as out:
+            while time.monotonic() - started < duration:
+                sent = time.monotonic()
+                try:
+                    response = await client.get(url, headers=headers)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error("❌ Record fetch failed: %s", e)
+                else:
+                    frame = {
+                        "t": round(sent - started, 3),
+                        "status": response.status_code,
+                        "elapsed_ms": round((time.monotonic() - sent) * 1000, 1),
+                        "headers": dict(response.headers),
+                        "body": response.text,
+                    }
+                    out.write(json.dumps(frame, separators=(",", ":")) + "\n")
+                    out.flush()
+                    frames += 1
+                    logger.info("🎙️ Frame %d (HTTP %s)", frames, response.status_code)
+                await asyncio.sleep(max(0.0, interval - (time.monotonic() - sent)))
+    return frames
+
+
+# ✅ Synthetic session — halts appear, resume and roll off like a busy day
+def synthetic_frames(
+    frames: int = 1500,
+    interval: float = HALT_POLL_INTERVAL,
+    peak_rows: int = 300,
+    seed: int = 7,
+):
+    rng = random.Random(seed)
+    clock = datetime(2025, 4, 17, 4, 0, tzinfo=EXCHANGE_TZ)
+    rows: List[dict] = []
+    for i in range(frames):
+        clock += timedelta(seconds=interval)
+        for _ in range(rng.choice((0, 0, 1, 1, 2, 5))):
+            symbol = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(4))
+            rows.append(
+                {
+                    "haltDate": clock.strftime("%m/%d/%Y"),
+                    "haltTime": clock.strftime("%H:%M:%S"),
+                    "issueSymbol": symbol,
+                    "issueName": f"{symbol} Holdings",
+                    "market": rng.choice(("NASDAQ", "NYSE", "AMEX")),
+                    "reasonCode": rng.choice(("LUDP", "T1", "T12", "H10", "M")),
+                    "pauseThresholdPrice": "",
+                    "resumptionDate": "",
+                    "resumptionQuoteTime": "",
+                    "resumptionTradeTime": "",
+                }
+            )
+        for row in rows:
+            if not row["resumptionTradeTime"] and rng.random() < 0.05:
+                row["resumptionDate"] = clock.strftime("%m/%d/%Y")
+                row["resumptionQuoteTime"] = clock.strftime("%H:%M:%S")
+                row["resumptionTradeTime"] = clock.strftime("%H:%M:%S")
+        del rows[: max(0, len(rows) - peak_rows)]
+        body = {"data": {"HaltedSecurities": {"rows": rows}}}
+        yield {
+            "t": round(i * interval, 3),
+            "status": 200,
+            "elapsed_ms": 0.0,
+            "headers": {"content-type": "application/json"},
+            "body": json.dumps(body),
+        }
+
+
+# ✅ Replay server — serves recorded frames on the stub path
+class ReplayServer(NasdaqStubServer):
+    """
+    speed > 0 → frame chosen by recorded time / speed (1 = real time, 10 = 10x)
+    speed = 0 → "max": every request gets the next frame
+    The last frame keeps being served once the recording runs out.
+    """
+
+    def __init__(
+        self, frames: List[dict], speed: float = 0, host: str = "127.0.0.1", port=0
+    ):
+        if not frames:
+            raise ValueError("❌ Recording has no frames.")
+        self.frames = frames
+        self.speed = speed
+        self.position = 0
+        self.started_at: Optional[float] = None
+        self._lock = threading.Lock()
+        super().__init__(host, port, rows=[])
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= len(self.frames) - 1
+
+    def next_frame(self) -> dict:
+        with self._lock:
+            if self.speed <= 0:
+                frame = self.frames[self.position]
+                self.position = min(self.position + 1, len(self.frames) - 1)
+                return frame
+            if self.started_at is None:
+                self.started_at = time.monotonic()
+            replay_t = (time.monotonic() - self.started_at) * self.speed
+            while (
+                self.position + 1 < len(self.frames)
+                and self.frames[self.position + 1]["t"] <= replay_t
+            ):
+                self.position += 1
+            return self.frames[self.position]
+
+    def _handler_class(self):
+        handler = super()._handler_class()
+        replay = self
+
+        class Handler(handler):
+            def do_GET(self):  # pylint: disable=invalid-name
+                replay.request_count += 1
+                replay.last_headers = dict(self.headers)
+                if self.path.split("?")[0] != STUB_PATH:
+                    self.send_error(404)
+                    return
+                frame = replay.next_frame()
+                body = frame["body"].encode("utf-8")
+                self.send_response(frame["status"])
+                for name, value in frame["headers"].items():
+                    if name.lower() not in HOP_HEADERS:
+                        self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+def _speed(value: str) -> float:
+    return 0.0 if value == "max" else float(value)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Record / replay the halt feed")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rec = commands.add_parser("record", help="capture the live upstream feed")
+    rec.add_argument("--out", required=True)
+    rec.add_argument("--url", default=NASDAQ_HALTS_URL)
+    rec.add_argument("--interval", type=float, default=HALT_POLL_INTERVAL)
+    rec.add_argument("--duration", type=float, default=3600)
+
+    synth = commands.add_parser("synth", help="write a synthetic recording")
+    synth.add_argument("--out", required=True)
+    synth.add_argument("--frames", type=int, default=1500)
+
+    serve = commands.add_parser("serve", help="replay a recording over HTTP")
+    serve.add_argument("recording")
+    serve.add_argument("--speed", type=_speed, default=1.0, help="1, 10 … or max")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8081)
+
+    args = parser.parse_args()
+    if args.command == "record":
+        total = asyncio.run(record(args.out, args.url, args.interval, args.duration))
+        logger.info("✅ Recorded %d frames → %s", total, args.out)
+    elif args.command == "synth":
+        total = write_frames(args.out, synthetic_frames(args.frames))
+        logger.info("✅ Wrote %d synthetic frames → %s", total, args.out)
+    else:
+        server = ReplayServer(
+            load_frames(args.recording), args.speed, args.host, args.port
+        )
+        logger.info("🎞️ Replaying %d frames on %s", len(server.frames), server.url)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.stop()
@@ -0,0 +1,146 @@
+# ===============================================
+# 📁 FILE: halt_store.py
+# 📍 LOCATION: api/halts/halt_store.py
+# 🎯 PURPOSE: Versioned in-memory halt snapshots (served by /api/haltdetails)
+# 👥 Author: Captain & Chatman
+# ===============================================
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from api.halts.halt_diff import HaltDelta, diff_halts, halt_key
+from api.halts.halt_index import HaltIndex, HaltRecord
+from api.halts.halt_metrics import halt_metrics
+
+logger = logging.getLogger(__name__)
+
+# ✅ How many past versions a `since=` client can be behind and still get a delta
+HISTORY_VERSIONS = 128
+
+
+def _encode(value) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+# ✅ Immutable snapshot — replaced wholesale, never mutated in place
+@dataclass(frozen=True)
+class HaltSnapshot:
+    version: int = 0
+    records: tuple = ()
+    by_key: dict = field(default_factory=dict)
+    body: bytes = b"[]"
+    fetched_at: Optional[float] = None
+    delta: HaltDelta = HaltDelta()
+    index: HaltIndex = field(default_factory=HaltIndex)
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}"'
+
+
+# ✅ Process-wide holder for the latest snapshot plus recent history
+class HaltStore:
+    def __init__(self, history: int = HISTORY_VERSIONS):
+        self._snapshot = HaltSnapshot()
+        self._history = OrderedDict({0: {}})
+        self._history_size = history
+        self._delta_cache = {}
+        self._listeners = []
+        self.next_refresh: Optional[float] = None  # Epoch seconds, set by the poller
+
+    # ✅ Listeners are called (synchronously) whenever the version moves
+    def add_listener(self, listener: Callable[[HaltSnapshot], None]):
+        self._listeners.append(listener)
+
+    @property
+    def snapshot(self) -> HaltSnapshot:
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def max_age(self) -> int:
+        """Seconds the current snapshot is guaranteed not to change (0 = unknown)."""
+        if self.next_refresh is None:
+            return 0
+        return max(0, int(self.next_refresh - time.time()))
+
+    def _next_version(self) -> int:
+        # Millisecond clock keeps versions increasing across restarts too
+        return max(self._snapshot.version + 1, int(time.time() * 1000))
+
+    def replace(self, records: List[dict]) -> HaltSnapshot:
+        """
+        Swaps in a new snapshot. The version only moves when the content
+        differs, and the JSON body is encoded once here so request
+        handlers only hand pre-built bytes to the response.
+        """
+        started = time.perf_counter()
+        current = self._snapshot
+        records = [HaltRecord.from_dict(r) for r in records]
+        by_key = {halt_key(r): r for r in records}
+        if current.version and by_key == current.by_key:
+            halt_metrics.observe("diff", time.perf_counter() - started)
+            return current
+
+        version = self._next_version()
+        index = HaltIndex(records)
+        self._snapshot = HaltSnapshot(
+            version=version,
+            records=index.records,
+            by_key=by_key,
+            body=index.body(),
+            fetched_at=time.time(),
+            delta=diff_halts(current.by_key, by_key),
+            index=index,
+        )
+
+        self._history[version] = by_key
+        while len(self._history) > self._history_size:
+            self._history.popitem(last=False)
+        self._delta_cache = {}
+        halt_metrics.observe("diff", time.perf_counter() - started)
+
+        for listener in self._listeners:
+            try:
+                listener(self._snapshot)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("❌ Halt snapshot listener failed: %s", e)
+        return self._snapshot
+
+    def delta(self, since: Optional[int]) -> Tuple[str, bytes]:
+        """
+        Returns (etag, body) describing the change from `since` to the current
+        version. Missing, unknown or expired versions fall back to a full payload.
+        Each (since, version) pair is diffed and encoded at most once.
+        """
+        snapshot = self._snapshot
+        base = self._history.get(since)
+        if since != snapshot.version and base is None:
+            since = None  # Unknown client versions all share one full payload
+
+        cached = self._delta_cache.get(since)
+        if cached is not None:
+            return cached
+
+        payload = {"version": snapshot.version, "since": since}
+        if since is None:
+            payload.update(full=True, halts=[r.as_dict() for r in snapshot.records])
+        elif since == snapshot.version:
+            payload.update(full=False, **HaltDelta().as_dict())
+        else:
+            payload.update(full=False, **diff_halts(base, snapshot.by_key).as_dict())
+
+        tag = "full" if since is None else since
+        result = (f'"{snapshot.version}-{tag}"', _encode(payload))
+        self._delta_cache[since] = result
+        return result
+
+
+# ✅ Shared instance used by the poller and the routes
+halt_store = HaltStore()
@@ -0,0 +1,203 @@
+# ===============================================
+# 📁 FILE: halt_stream.py
+# 📍 LOCATION: api/halts/halt_stream.py
+# 🎯 PURPOSE: Fan-out broadcaster pushing halt changes to SSE / WebSocket clients
+# 👥 Author: Captain & Chatman
+# ===============================================
+
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import NamedTuple, Optional
+
+from api.halts.halt_metrics import halt_metrics
+from api.halts.halt_store import HaltSnapshot, halt_store
+from control_console.config import HALT_STREAM_HEARTBEAT, HALT_STREAM_QUEUE_SIZE
+
+logger = logging.getLogger(__name__)
+
+SSE_RETRY = b"retry: 3000\n\n"
+
+
+# ✅ One event, encoded once for every transport
+class StreamEvent(NamedTuple):
+    sse: bytes
+    text: Optional[str]  # None → SSE-only frame (heartbeat)
+
+
+HEARTBEAT = StreamEvent(sse=b": ping\n\n", text=None)
+
+
+def build_event(version: int, body: bytes) -> StreamEvent:
+    return StreamEvent(
+        sse=b"id: %d\nevent: halts\ndata: %s\n\n" % (version, body),
+        text=body.decode("utf-8"),
+    )
+
+
+# ✅ Per-connection state — kept tiny so idle clients cost little memory
+class StreamSubscriber:
+    __slots__ = ("pending", "ready", "closed")
+
+    def __init__(self):
+        self.pending = deque()
+        self.ready = asyncio.Event()
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+        self.pending.clear()
+        self.ready.set()
+
+
+# ✅ Broadcaster — bounded queues, slow consumers are dropped, not waited on
+class HaltBroadcaster:
+    def __init__(
+        self,
+        queue_size: int = HALT_STREAM_QUEUE_SIZE,
+        heartbeat: float = HALT_STREAM_HEARTBEAT,
+    ):
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self.dropped = 0
+        self._subscribers = set()
+        self._heartbeat_task = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    # ✅ Lifecycle (heartbeat keeps idle connections alive through proxies)
+    def start(self):
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(
+                self._run_heartbeat(), name="halt-stream-heartbeat"
+            )
+
+    async def stop(self):
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        for subscriber in list(self._subscribers):
+            self.unsubscribe(subscriber)
+
+    async def _run_heartbeat(self):
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            self.publish(HEARTBEAT)
+
+    # ✅ Subscriptions
+    def subscribe(self) -> StreamSubscriber:
+        subscriber = StreamSubscriber()
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: StreamSubscriber):
+        self._subscribers.discard(subscriber)
+        subscriber.close()
+
+    # ✅ Fan-out — same event object (same bytes) to every subscriber
+    def publish(self, event: StreamEvent):
+        for subscriber in list(self._subscribers):
+            if len(subscriber.pending) >= self.queue_size:
+                self.dropped += 1
+                self.unsubscribe(subscriber)
+                continue
+            subscriber.pending.append(event)
+            subscriber.ready.set()
+
+    def publish_snapshot(self, snapshot: HaltSnapshot):
+        if snapshot.delta.is_empty:
+            return
+        with halt_metrics.timed("publish"):
+            payload = {"version": snapshot.version, "full": False}
+            payload.update(snapshot.delta.as_dict())
+            body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            self.publish(build_event(snapshot.version, body))
+        logger.debug(
+            "📣 Published halt v%s to %d subscribers",
+            snapshot.version,
+            len(self._subscribers),
+        )
+
+    # ✅ Catch-up event for a (re)connecting client
+    @staticmethod
+    def initial_event(since: Optional[int]) -> StreamEvent:
+        _, body = halt_store.delta(since)
+        return build_event(halt_store.version, body)
+
+    # ✅ Server-Sent Events body generator
+    async def sse_frames(
+        self, subscriber: StreamSubscriber, since: Optional[int], receive=None
+    ):
+        watcher = None
+        if receive is not None:
+            watcher = asyncio.create_task(self._watch_disconnect(receive, subscriber))
+        try:
+            yield SSE_RETRY + self.initial_event(since).sse
+            while not subscriber.closed:
+                await subscriber.ready.wait()
+                subscriber.ready.clear()
+                while subscriber.pending:
+                    yield subscriber.pending.popleft().sse
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+            self.unsubscribe(subscriber)
+
+    # ✅ Idle streams never write, so listen for the client going away
+    async def _watch_disconnect(self, receive, subscriber: StreamSubscriber):
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                self.unsubscribe(subscriber)
+                return
+
+    # ✅ WebSocket session — a reader task notices disconnects while idle; the
+    #    session ends as soon as either side finishes (or fails)
+    async def serve_websocket(self, websocket, since: Optional[int]):
+        subscriber = self.subscribe()
+        pump = asyncio.create_task(self._pump_websocket(websocket, subscriber, since))
+        reader = asyncio.create_task(self._read_until_disconnect(websocket))
+        try:
+            await asyncio.wait((pump, reader), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (pump, reader):
+                task.cancel()
+                task.add_done_callback(_retrieve_outcome)
+            self.unsubscribe(subscriber)
+
+    @staticmethod
+    async def _read_until_disconnect(websocket):
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+    async def _pump_websocket(self, websocket, subscriber, since):
+        await websocket.send_text(self.initial_event(since).text)
+        while not subscriber.closed:
+            await subscriber.ready.wait()
+            subscriber.ready.clear()
+            while subscriber.pending:
+                event = subscriber.pending.popleft()
+                if event.text is not None:
+                    await websocket.send_text(event.text)
+        await websocket.close(code=1013)  # Dropped as a slow consumer
+
+
+# ✅ Reads a finished session task's exception (e.g. a send on a socket that just
+#    closed) so asyncio never reports it as "never retrieved"
+def _retrieve_outcome(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("🔌 WebSocket session ended: %r", task.exception())
+
+
+# ✅ Shared instance, fed by every snapshot swap in the halt store
+halt_broadcaster = HaltBroadcaster()
+halt_store.add_listener(halt_broadcaster.publish_snapshot)
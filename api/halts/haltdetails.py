@@ -0,0 +1,141 @@
+# ===============================================
+# 📁 FILE: haltdetails.py
+# 📍 LOCATION: api/halts/haltdetails.py
+# 🎯 PURPOSE: Public halt endpoints — served from the in-memory snapshot only
+# 👥 Author: Captain & Chatman
+# ===============================================
+
+import binascii
+import zlib
+from datetime import date, datetime
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request, WebSocket
+from fastapi.responses import Response, StreamingResponse
+
+from api.halts.halt_history import history_query, stream_history
+from api.halts.halt_store import halt_store
+from api.halts.halt_stream import halt_broadcaster
+from control_console.utils.etag import not_modified
+
+router = APIRouter()
+
+
+# ✅ Cache until the poller's next fetch (which never crosses a session change)
+def _cache_control() -> str:
+    max_age = halt_store.max_age()
+    return f"public, max-age={max_age}" if max_age else "no-cache"
+
+
+def _version_headers(etag: str) -> dict:
+    return {
+        "ETag": etag,
+        "X-Halt-Version": str(halt_store.version),
+        "Cache-Control": _cache_control(),
+    }
+
+
+# ✅ HEAD — lets pollers compare ETag / version without a body
+@router.head("/api/haltdetails")
+async def head_halted_stocks():
+    return Response(status_code=200, headers=_version_headers(halt_store.snapshot.etag))
+
+
+# ✅ GET — full list, a filtered view, or only the delta since a known version
+@router.get("/api/haltdetails")
+async def get_halted_stocks(
+    request: Request,
+    since: Optional[int] = Query(
+        None, ge=0, description="Return only changes after this snapshot version."
+    ),
+    symbol: Optional[str] = Query(None, max_length=16),
+    after: Optional[datetime] = Query(
+        None, description="Only halts after this time (naive = US/Eastern)."
+    ),
+):
+    filtered = symbol is not None or after is not None
+    if filtered and since is not None:
+        raise HTTPException(
+            status_code=400, detail="since cannot be combined with symbol/after"
+        )
+
+    snapshot = halt_store.snapshot
+    if filtered:
+        query = f"{(symbol or '').upper()}|{after.isoformat() if after else ''}"
+        etag = f'"{snapshot.version}-q{zlib.crc32(query.encode("utf-8")):08x}"'
+    elif since is None:
+        etag = snapshot.etag
+    else:
+        etag, body = halt_store.delta(since)
+
+    headers = _version_headers(etag)
+    cached = not_modified(request, etag, headers)
+    if cached is not None:
+        return cached
+
+    if filtered:
+        body = snapshot.index.body(snapshot.index.select(symbol, after))
+    elif since is None:
+        body = snapshot.body
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _resume_version(since: Optional[int], last_event_id: Optional[str]):
+    if since is not None:
+        return since
+    if last_event_id and last_event_id.isdigit():
+        return int(last_event_id)
+    return None
+
+
+# ✅ SSE — pushes each ingested change; reconnects resume from Last-Event-ID
+@router.get("/api/haltdetails/stream")
+async def stream_halted_stocks(
+    request: Request,
+    since: Optional[int] = Query(None, ge=0),
+    last_event_id: Optional[str] = Header(None),
+):
+    subscriber = halt_broadcaster.subscribe()
+    return StreamingResponse(
+        halt_broadcaster.sse_frames(
+            subscriber, _resume_version(since, last_event_id), request.receive
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# ✅ WebSocket — same events as the SSE stream, one JSON message each
+@router.websocket("/api/haltdetails/ws")
+async def websocket_halted_stocks(
+    websocket: WebSocket, since: Optional[int] = Query(None, ge=0)
+):
+    await websocket.accept()
+    await halt_broadcaster.serve_websocket(websocket, since)
+
+
+# ✅ History — filtered, keyset-paginated, streamed as NDJSON
+@router.get("/api/haltdetails/history")
+async def get_halt_history(
+    request: Request,
+    symbol: Optional[str] = Query(None, max_length=16),
+    start: Optional[date] = Query(None, description="First ET trading date"),
+    end: Optional[date] = Query(None, description="Last ET trading date (inclusive)"),
+    reason_code: Optional[str] = Query(None, max_length=16),
+    cursor: Optional[str] = Query(None, description="next_cursor from the last page"),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    limit: int = Query(1000, ge=1, le=1_000_000),
+):
+    if start and end and end < start:
+        raise HTTPException(status_code=400, detail="end must not be before start")
+    try:
+        query, args = history_query(
+            symbol, start, end, reason_code, cursor, order == "desc", limit
+        )
+    except (ValueError, binascii.Error) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+    return StreamingResponse(
+        stream_history(request.app.state.db_pool, query, args, limit),
+        media_type="application/x-ndjson",
+    )
@@ -0,0 +1,127 @@
+# ===============================================
+# 📁 FILE: nasdaq_stub.py
+# 📍 LOCATION: api/halts/nasdaq_stub.py
+# 🎯 PURPOSE: Local stand-in for the Nasdaq halted-securities endpoint
+# 🧪 USAGE: python -m api.halts.nasdaq_stub --port 8081
+#          then NASDAQ_HALTS_URL=http://127.0.0.1:8081/api/marketmovers/halted
+# 👥 Author: Captain & Chatman
+# ===============================================
+
+import argparse
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+STUB_PATH = "/api/marketmovers/halted"
+
+# ✅ Default rows (same field names the live feed uses)
+SAMPLE_ROWS = [
+    {
+        "haltDate": "04/17/2025",
+        "haltTime": "09:45:12",
+        "issueSymbol": "ABCD",
+        "issueName": "Alpha Bravo Corp",
+        "market": "NASDAQ",
+        "reasonCode": "LUDP",
+        "pauseThresholdPrice": "",
+        "resumptionDate": "04/17/2025",
+        "resumptionQuoteTime": "09:50:12",
+        "resumptionTradeTime": "09:50:12",
+    },
+    {
+        "haltDate": "04/17/2025",
+        "haltTime": "10:02:00",
+        "issueSymbol": "WXYZ",
+        "issueName": "Whiskey Xray Holdings",
+        "market": "NYSE",
+        "reasonCode": "T1",
+        "pauseThresholdPrice": "",
+        "resumptionDate": "",
+        "resumptionQuoteTime": "",
+        "resumptionTradeTime": "",
+    },
+]
+
+
+# ✅ Stub server — rows can be swapped at runtime from test code
+class NasdaqStubServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, rows=None):
+        self.rows = list(SAMPLE_ROWS if rows is None else rows)
+        self.status_code = 200
+        self.request_count = 0
+        self.last_headers = {}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{STUB_PATH}"
+
+    def set_rows(self, rows):
+        self.rows = list(rows)
+
+    def payload(self) -> dict:
+        return {"data": {"HaltedSecurities": {"rows": self.rows}}}
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # pylint: disable=invalid-name
+                stub.request_count += 1
+                stub.last_headers = dict(self.headers)
+                if self.path.split("?")[0] != STUB_PATH:
+                    self.send_error(404)
+                    return
+                body = json.dumps(stub.payload()).encode("utf-8")
+                self.send_response(stub.status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                logger.debug("stub: " + format, *args)
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="nasdaq-stub", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Run the Nasdaq halts stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    args = parser.parse_args()
+
+    server = NasdaqStubServer(args.host, args.port)
+    logger.info("🧪 Nasdaq stub listening on %s", server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
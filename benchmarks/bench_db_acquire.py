@@ -0,0 +1,174 @@
+# ============================================================
+# ✅ bench_db_acquire.py
+# 📍 Pool pressure under mixed traffic: blanket db_middleware vs lazy per-route
+#    dependency (static, HEAD pings, cached API, streams and DB routes together)
+# 🧪 Usage: DATABASE_URL=postgresql://... python -m benchmarks.bench_db_acquire
+# 🔍 In-process ASGI — no network between client and app, only to Postgres
+# Author: Captain & Chatman
+# Version: MPA Phase II — Database Diagnostics
+# ============================================================
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import time
+from collections import defaultdict
+
+import httpx
+from dotenv import load_dotenv
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+from fastapi.staticfiles import StaticFiles
+
+from control_console import market
+from control_console.database import InstrumentedPool, create_db_pool
+from control_console.holiday_rules import generate_holidays, load_calendar
+from control_console.utils.db import DB
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# ✅ Traffic mix (path, method, weight) — roughly what the dashboard produces
+MIX = (
+    ("static", "GET", "/static/css/styles.css", 35),
+    ("ping", "HEAD", "/", 10),
+    ("cached", "GET", "/api/market/status", 30),
+    ("stream", "GET", "/stream", 5),
+    ("db", "GET", "/db", 20),
+)
+
+
+def build_app(pool: InstrumentedPool, lazy: bool, query_ms: float, stream_ms: float):
+    app = FastAPI()
+    app.state.db_pool = pool
+    app.mount("/static", StaticFiles(directory="static"), name="static")
+    app.include_router(market.router, prefix="/api/market")
+
+    if not lazy:
+        # The old main.db_middleware, verbatim in behaviour
+        @app.middleware("http")
+        async def db_middleware(request: Request, call_next):
+            connection = await pool.acquire()
+            try:
+                request.state.db = connection
+                return await call_next(request)
+            finally:
+                await pool.release(connection)
+
+    route_dependencies = [DB] if lazy else []
+
+    @app.head("/")
+    async def ping():
+        return Response(status_code=200)
+
+    @app.get("/db", dependencies=route_dependencies)
+    async def db_route(request: Request):
+        await request.state.db.execute(f"SELECT pg_sleep({query_ms / 1000})")
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def body():
+            for _ in range(5):
+                await asyncio.sleep(stream_ms / 5000)
+                yield b"{}\n"
+
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    return app
+
+
+def bucket_quantile(histogram: dict, q: float) -> str:
+    """Upper bound of the histogram bucket holding the q-quantile."""
+    total = histogram["+Inf"]
+    for bound, count in histogram.items():
+        if count >= q * total:
+            return bound
+    return "+Inf"
+
+
+def pct(values, q):
+    if not values:
+        return 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1] * 1000
+
+
+async def run(dsn, lazy, pool_size, rate, requests, query_ms, stream_ms):
+    pool = await create_db_pool(dsn, min_size=pool_size, max_size=pool_size)
+    app = build_app(pool, lazy, query_ms, stream_ms)
+    transport = httpx.ASGITransport(app=app)
+    latencies = defaultdict(list)
+    weights = [w for *_, w in MIX]
+    plan = random.Random(7).choices(MIX, weights=weights, k=requests)
+    gaps = random.Random(11)
+
+    async def send(http, kind, method, path):
+        started = time.perf_counter()
+        response = await http.request(method, path)
+        response.raise_for_status()
+        latencies[kind].append(time.perf_counter() - started)
+
+    # Open loop: Poisson arrivals at a fixed rate, whatever the app's latency
+    started = time.perf_counter()
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        tasks = []
+        for kind, method, path, _ in plan:
+            tasks.append(asyncio.create_task(send(http, kind, method, path)))
+            await asyncio.sleep(gaps.expovariate(rate))
+        await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    stats = pool.stats()
+    await pool.close()
+
+    label = "lazy dependency" if lazy else "db_middleware  "
+    logger.info(
+        "%s %6.0f req/s offered, done in %5.2fs | %5d acquisitions | "
+        "pool wait avg %6.2f ms, max %7.2f ms, p99 ≤ %s ms",
+        label,
+        rate,
+        elapsed,
+        stats["acquires"],
+        stats["wait_avg_ms"],
+        stats["wait_max_ms"],
+        bucket_quantile(stats["wait_histogram_ms"], 0.99),
+    )
+    for kind, *_ in MIX:
+        logger.info(
+            "    %-7s %5d req  p50 %7.2f ms  p99 %7.2f ms",
+            kind,
+            len(latencies[kind]),
+            pct(latencies[kind], 50),
+            pct(latencies[kind], 99),
+        )
+
+
+async def main(args):
+    dsn = os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("❌ DATABASE_URL is not set.")
+    load_calendar(generate_holidays(2020, 2035))  # /api/market/status never queries
+    for lazy in (False, True):
+        await run(
+            dsn,
+            lazy,
+            args.pool_size,
+            args.rate,
+            args.requests,
+            args.query_ms,
+            args.stream_ms,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pool pressure under mixed load")
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--rate", type=float, default=600, help="requests/s")
+    parser.add_argument("--requests", type=int, default=6000)
+    parser.add_argument("--query-ms", type=float, default=25.0)
+    parser.add_argument("--stream-ms", type=float, default=50.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,139 @@
+# ============================================================
+# ✅ bench_halt_history.py
+# 📍 Sustained rows/sec for halt_events persistence (COPY + merge vs row-by-row)
+# 🧪 Usage: DATABASE_URL=postgresql://... python -m benchmarks.bench_halt_history
+# 🔍 Works in a throwaway schema (halt_bench) which is dropped afterwards
+# Author: Captain & Chatman
+# Version: MPA Phase II — Halt History Diagnostics
+# ============================================================
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+import asyncpg
+from dotenv import load_dotenv
+
+from api.halts.halt_feed import EXCHANGE_TZ
+from api.halts.halt_history import copy_merge, ensure_halt_events_table
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+BENCH_SCHEMA = "halt_bench"
+
+ROW_BY_ROW_SQL = """
+    INSERT INTO halt_events (
+        symbol, halt_time, name, market, reason_code,
+        resume_quote_time, resume_trade_time, pause_threshold_price
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    ON CONFLICT (symbol, halt_time) DO UPDATE SET
+        resume_trade_time = EXCLUDED.resume_trade_time, last_seen = NOW()
+"""
+
+
+# ✅ Synthetic normalized records (same shape halt_feed produces)
+def make_records(count: int, resumed: bool = False):
+    base = datetime(2020, 1, 2, 9, 30, tzinfo=EXCHANGE_TZ)
+    records = []
+    for i in range(count):
+        halt_time = base + timedelta(seconds=i * 7)
+        resume = (halt_time + timedelta(minutes=5)).isoformat() if resumed else None
+        records.append(
+            {
+                "symbol": f"S{i % 5000:04d}",
+                "name": "Bench Corp",
+                "market": "NASDAQ",
+                "reason_code": "LUDP",
+                "halt_time": halt_time.isoformat(),
+                "resume_quote_time": resume,
+                "resume_trade_time": resume,
+                "pause_threshold_price": None,
+            }
+        )
+    return records
+
+
+async def bench_copy(db, records, batch_size: int, label: str):
+    start = time.perf_counter()
+    for offset in range(0, len(records), batch_size):
+        await copy_merge(db, records[offset : offset + batch_size])
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "📦 COPY+merge %-7s batch=%-6d %8d rows in %6.2fs → %9.0f rows/s",
+        label,
+        batch_size,
+        len(records),
+        elapsed,
+        len(records) / elapsed,
+    )
+
+
+async def bench_row_by_row(db, records):
+    args = [
+        (
+            r["symbol"],
+            datetime.fromisoformat(r["halt_time"]),
+            r["name"],
+            r["market"],
+            r["reason_code"],
+            None,
+            None,
+            None,
+        )
+        for r in records
+    ]
+    start = time.perf_counter()
+    async with db.transaction():
+        for row in args:
+            await db.execute(ROW_BY_ROW_SQL, *row)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "🐢 row-by-row INSERT            %8d rows in %6.2fs → %9.0f rows/s",
+        len(records),
+        elapsed,
+        len(records) / elapsed,
+    )
+
+
+async def main(rows: int, batch_sizes):
+    dsn = os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("❌ DATABASE_URL is not set.")
+
+    db = await asyncpg.connect(dsn)
+    try:
+        await db.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+        await db.execute(f"CREATE SCHEMA {BENCH_SCHEMA}")
+        await db.execute(f"SET search_path TO {BENCH_SCHEMA}")
+        await ensure_halt_events_table(db)
+
+        await bench_row_by_row(db, make_records(min(rows, 20000)))
+        await db.execute("TRUNCATE halt_events")
+
+        fresh = make_records(rows)
+        resumed = make_records(rows, resumed=True)
+        for batch_size in batch_sizes:
+            await db.execute("TRUNCATE halt_events")
+            await bench_copy(db, fresh, batch_size, "insert")
+            await bench_copy(db, resumed, batch_size, "upsert")
+
+        total = await db.fetchval("SELECT COUNT(*) FROM halt_events")
+        logger.info("✅ halt_events holds %d rows (expected %d)", total, rows)
+    finally:
+        await db.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="halt_events write throughput")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[100, 500, 2000, 10000]
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.batch_sizes))
@@ -0,0 +1,167 @@
+# ============================================================
+# ✅ bench_halt_ingest.py
+# 📍 Replays recorded (or synthetic) upstream frames through the real ingestion
+#    pipeline and reports fetch / parse / diff / publish / persist percentiles
+# 🧪 Usage: python -m benchmarks.bench_halt_ingest --speed max
+#          python -m benchmarks.bench_halt_ingest --recording day.ndjson.gz --speed 10
+#          DATABASE_URL=... python -m benchmarks.bench_halt_ingest --persist
+#          ... --budget parse=5 diff=10   (exit 1 when a stage p99 goes over, ms)
+# Author: Captain & Chatman
+# Version: MPA Phase II — Halt Ingestion Diagnostics
+# ============================================================
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+import asyncpg
+from dotenv import load_dotenv
+
+from api.halts.halt_history import HaltHistoryWriter, ensure_halt_events_table
+from api.halts.halt_metrics import STAGES, halt_metrics
+from api.halts.halt_poller import HaltPoller
+from api.halts.halt_replay import ReplayServer, load_frames, synthetic_frames
+from api.halts.halt_store import HaltStore
+from api.halts.halt_stream import HaltBroadcaster
+from control_console.utils.http_client import UpstreamHTTP
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)  # One line per frame otherwise
+
+BENCH_SCHEMA = "halt_bench_ingest"
+
+
+def _speed(value: str) -> float:
+    return 0.0 if value == "max" else float(value)
+
+
+def _budget(value: str):
+    stage, _, limit = value.partition("=")
+    return stage, float(limit)
+
+
+async def open_history(store: HaltStore):
+    dsn = os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("❌ DATABASE_URL is not set (needed for --persist).")
+    admin = await asyncpg.connect(dsn)
+    await admin.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    await admin.execute(f"CREATE SCHEMA {BENCH_SCHEMA}")
+    await admin.close()
+    pool = await asyncpg.create_pool(
+        dsn, min_size=1, max_size=2, server_settings={"search_path": BENCH_SCHEMA}
+    )
+    async with pool.acquire() as db:
+        await ensure_halt_events_table(db)
+    return pool, HaltHistoryWriter(pool, store)
+
+
+async def close_history(pool):
+    async with pool.acquire() as db:
+        await db.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    await pool.close()
+
+
+async def run(frames, speed: float, subscribers: int, persist: bool):
+    store = HaltStore()
+    broadcaster = HaltBroadcaster(queue_size=len(frames) + 1)
+    store.add_listener(broadcaster.publish_snapshot)
+    versions = []
+    store.add_listener(lambda snapshot: versions.append(snapshot.version))
+    clients = [broadcaster.subscribe() for _ in range(subscribers)]
+
+    pool, writer = (await open_history(store)) if persist else (None, None)
+    http = UpstreamHTTP()
+    server = ReplayServer(frames, speed).start()
+    poller = HaltPoller(store=store, url=server.url, http=http)
+    halt_metrics.reset()
+
+    started = time.monotonic()
+    try:
+        for frame in frames:
+            if speed > 0:
+                due = started + frame["t"] / speed
+                await asyncio.sleep(max(0.0, due - time.monotonic()))
+            try:
+                await poller.poll_once()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("⚠ Frame at t=%ss failed: %s", frame["t"], e)
+            for client in clients:
+                client.pending.clear()  # Subscribers that keep up
+            if writer is not None:
+                await writer.flush()
+    finally:
+        elapsed = time.monotonic() - started
+        server.stop()
+        await http.aclose()
+        if pool is not None:
+            await close_history(pool)
+
+    logger.info(
+        "🎞️ %d frames in %.2fs (%.0f frames/s) — %d versions, %d subscribers",
+        len(frames),
+        elapsed,
+        len(frames) / elapsed,
+        len(versions),
+        subscribers,
+    )
+    if writer is not None:
+        logger.info("🗄️ %d halt rows persisted", writer.written)
+
+
+def report(budgets) -> bool:
+    summary = halt_metrics.summary()
+    logger.info(
+        "%-8s %7s %9s %9s %9s %9s",
+        "stage",
+        "count",
+        "p50 ms",
+        "p90 ms",
+        "p99 ms",
+        "max ms",
+    )
+    for stage in STAGES:
+        row = summary.get(stage)
+        if row is None:
+            continue
+        logger.info(
+            "%-8s %7d %9.3f %9.3f %9.3f %9.3f",
+            stage,
+            row["count"],
+            row["p50_ms"],
+            row["p90_ms"],
+            row["p99_ms"],
+            row["max_ms"],
+        )
+
+    ok = True
+    for stage, limit in budgets:
+        p99 = summary.get(stage, {}).get("p99_ms", 0.0)
+        if p99 > limit:
+            logger.error("❌ %s p99 %.3f ms exceeds budget %.3f ms", stage, p99, limit)
+            ok = False
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Halt ingestion replay benchmark")
+    parser.add_argument("--recording", help="file from `halt_replay record|synth`")
+    parser.add_argument("--frames", type=int, default=1500, help="synthetic frames")
+    parser.add_argument("--speed", type=_speed, default=0.0, help="1, 10 … or max")
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--persist", action="store_true")
+    parser.add_argument("--budget", type=_budget, nargs="*", default=[])
+    args = parser.parse_args()
+
+    recorded = (
+        load_frames(args.recording)
+        if args.recording
+        else list(synthetic_frames(args.frames))
+    )
+    asyncio.run(run(recorded, args.speed, args.subscribers, args.persist))
+    sys.exit(0 if report(args.budget) else 1)
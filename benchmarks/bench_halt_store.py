@@ -0,0 +1,133 @@
+# ============================================================
+# ✅ bench_halt_store.py
+# 📍 Memory + filter latency: compact HaltIndex vs the plain dict-list snapshot
+# 🧪 Usage: python -m benchmarks.bench_halt_store --records 5000 50000
+# 🔍 Pure in-process — no database, no network
+# Author: Captain & Chatman
+# Version: MPA Phase II — Halt Store Diagnostics
+# ============================================================
+
+import argparse
+import json
+import logging
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from api.halts.halt_feed import EXCHANGE_TZ
+from api.halts.halt_index import HaltIndex, HaltRecord
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SYMBOLS = 2000
+REASONS = ("LUDP", "T1", "T12", "H10", "M")
+
+
+# ✅ Synthetic normalized records (same shape halt_feed produces)
+def make_records(count: int):
+    base = datetime(2025, 4, 17, 4, 0, tzinfo=EXCHANGE_TZ)
+    records = []
+    for i in range(count):
+        halt_time = base + timedelta(seconds=i * 3)
+        resume = (halt_time + timedelta(minutes=5)).isoformat() if i % 3 else None
+        records.append(
+            {
+                "symbol": f"S{i % SYMBOLS:04d}",
+                "name": f"Bench Corp {i % SYMBOLS}",
+                "market": "NASDAQ" if i % 2 else "NYSE",
+                "reason_code": REASONS[i % len(REASONS)],
+                "halt_time": halt_time.isoformat(),
+                "resume_quote_time": resume,
+                "resume_trade_time": resume,
+                "pause_threshold_price": None,
+            }
+        )
+    records.reverse()  # Snapshot order is newest first
+    return records
+
+
+def measure(build):
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def per_call_us(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+# ✅ Baseline — what the dict-list store has to do per filtered request
+def baseline_symbol(records, symbol):
+    return json.dumps([r for r in records if r["symbol"] == symbol]).encode("utf-8")
+
+
+def baseline_after(records, after):
+    return json.dumps(
+        [r for r in records if datetime.fromisoformat(r["halt_time"]) > after]
+    ).encode("utf-8")
+
+
+def run(count: int, calls: int):
+    raw = make_records(count)
+
+    def build_baseline():
+        records = [dict(r) for r in raw]
+        return records, json.dumps(records).encode("utf-8")
+
+    def build_compact():
+        index = HaltIndex(HaltRecord.from_dict(r) for r in raw)
+        return index, index.body()
+
+    (records, _), baseline_bytes = measure(build_baseline)
+    (index, _), compact_bytes = measure(build_compact)
+
+    symbols = [f"S{random.randrange(SYMBOLS):04d}" for _ in range(64)]
+    after = datetime.fromisoformat(raw[len(raw) // 100]["halt_time"])  # newest ~1%
+
+    rounds = max(1, calls // max(1, count // 1000))
+    timings = {
+        "symbol": (
+            per_call_us(
+                lambda: baseline_symbol(records, random.choice(symbols)), rounds
+            ),
+            per_call_us(
+                lambda: index.body(index.select(random.choice(symbols))), calls
+            ),
+        ),
+        "after": (
+            per_call_us(lambda: baseline_after(records, after), rounds),
+            per_call_us(lambda: index.body(index.select(after=after)), calls),
+        ),
+    }
+
+    logger.info("📦 %d records", count)
+    logger.info(
+        "   memory    dict-list %8.1f KiB   compact %8.1f KiB   (%.0f%%)",
+        baseline_bytes / 1024,
+        compact_bytes / 1024,
+        compact_bytes / baseline_bytes * 100,
+    )
+    for name, (slow, fast) in timings.items():
+        logger.info(
+            "   ?%-7s  dict-list %8.1f µs    compact %8.1f µs    (x%.0f)",
+            name,
+            slow,
+            fast,
+            slow / fast,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Halt store memory / latency")
+    parser.add_argument("--records", type=int, nargs="+", default=[500, 5000, 50000])
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+    for n in args.records:
+        run(n, args.calls)
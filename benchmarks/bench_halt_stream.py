@@ -0,0 +1,194 @@
+# ============================================================
+# ✅ bench_halt_stream.py
+# 📍 Memory-per-connection + fan-out benchmark for /api/haltdetails/stream
+# 🧪 Usage: python -m benchmarks.bench_halt_stream --connections 10000
+# 🔍 Spawns one uvicorn worker, opens N idle SSE clients, samples server RSS,
+#    then publishes one halt change and times delivery to every client
+# Author: Captain & Chatman
+# Version: MPA Phase II — Halt Stream Diagnostics
+# ============================================================
+
+import argparse
+import asyncio
+import logging
+import os
+import resource
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from api.halts import haltdetails
+from api.halts.halt_feed import normalize_halts
+from api.halts.halt_store import halt_store
+from api.halts.halt_stream import HaltBroadcaster, halt_broadcaster
+from api.halts.nasdaq_stub import SAMPLE_ROWS
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def _lifespan(_app):
+    halt_store.replace(normalize_halts(SAMPLE_ROWS))
+    halt_broadcaster.start()
+    yield
+    await halt_broadcaster.stop()
+
+
+# ✅ Minimal app: halt router only, plus a trigger to publish one change
+bench_app = FastAPI(lifespan=_lifespan)
+bench_app.include_router(haltdetails.router)
+
+
+@bench_app.post("/bench/publish")
+async def _publish():
+    rows = [dict(SAMPLE_ROWS[0], issueSymbol=f"B{time.time_ns() % 10**6}")]
+    halt_store.replace(normalize_halts(SAMPLE_ROWS + rows))
+    return {"subscribers": halt_broadcaster.subscriber_count}
+
+
+def _raise_fd_limit():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    return hard
+
+
+def _rss_kib(pid: int) -> int:
+    with open(f"/proc/{pid}/status", encoding="utf-8") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def _open_client(port: int):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        b"GET /api/haltdetails/stream HTTP/1.1\r\nHost: bench\r\n"
+        b"Accept: text/event-stream\r\n\r\n"
+    )
+    await writer.drain()
+    await reader.readuntil(b"\n\n")  # headers + retry + initial event
+    await reader.readuntil(b"\n\n")
+    return reader, writer
+
+
+async def _wait_event(reader):
+    while True:
+        frame = await reader.readuntil(b"\n\n")
+        if b"event: halts" in frame:
+            return time.perf_counter()
+
+
+async def _post_publish(port: int):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        b"POST /bench/publish HTTP/1.1\r\nHost: bench\r\nContent-Length: 0\r\n"
+        b"Connection: close\r\n\r\n"
+    )
+    await writer.drain()
+    await reader.read()
+    writer.close()
+
+
+# ✅ In-process fan-out cost (no sockets): publish one event to N subscribers
+def bench_fanout(count: int):
+    broadcaster = HaltBroadcaster()
+
+    async def run():
+        subscribers = [broadcaster.subscribe() for _ in range(count)]
+        snapshot = halt_store.replace(normalize_halts(SAMPLE_ROWS[:1]))
+        snapshot = halt_store.replace(normalize_halts(SAMPLE_ROWS))
+        start = time.perf_counter()
+        broadcaster.publish_snapshot(snapshot)
+        elapsed = time.perf_counter() - start
+        shared = all(s.pending[0] is subscribers[0].pending[0] for s in subscribers)
+        return elapsed, shared
+
+    elapsed, shared = asyncio.run(run())
+    logger.info(
+        "⚡ fan-out to %d subscribers: %.2f ms (%.2f µs/sub, shared bytes=%s)",
+        count,
+        elapsed * 1000,
+        elapsed * 1e6 / count,
+        shared,
+    )
+
+
+# ✅ Socket benchmark against a real uvicorn worker
+async def bench_connections(count: int, port: int):
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    server = subprocess.Popen(  # pylint: disable=consider-using-with
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "benchmarks.bench_halt_stream:bench_app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--backlog",
+            "4096",
+            "--timeout-graceful-shutdown",
+            "2",
+        ],
+        env=env,
+    )
+    try:
+        await asyncio.sleep(2)
+        warm = [await _open_client(port)]
+        base_rss = _rss_kib(server.pid)
+
+        clients = list(warm)
+        batch = 500
+        for start in range(1, count, batch):
+            size = min(batch, count - start)
+            clients += await asyncio.gather(*(_open_client(port) for _ in range(size)))
+        await asyncio.sleep(1)
+        full_rss = _rss_kib(server.pid)
+
+        per_conn = (full_rss - base_rss) / max(1, count - 1)
+        logger.info(
+            "🧠 %d idle SSE connections: RSS %.1f MiB → %.1f MiB (%.2f KiB/conn)",
+            count,
+            base_rss / 1024,
+            full_rss / 1024,
+            per_conn,
+        )
+
+        waiters = [asyncio.create_task(_wait_event(r)) for r, _ in clients]
+        start = time.perf_counter()
+        await _post_publish(port)
+        arrivals = sorted(t - start for t in await asyncio.gather(*waiters))
+        logger.info(
+            "📣 delivery to %d clients: p50 %.1f ms, p99 %.1f ms, max %.1f ms",
+            len(arrivals),
+            arrivals[len(arrivals) // 2] * 1000,
+            arrivals[int(len(arrivals) * 0.99) - 1] * 1000,
+            arrivals[-1] * 1000,
+        )
+
+        for _, writer in clients:
+            writer.close()
+        await asyncio.sleep(2)  # Let the server see every disconnect
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    limit = _raise_fd_limit()
+    if limit < args.connections + 100:
+        logger.warning("⚠ RLIMIT_NOFILE=%d may be too low for this run", limit)
+
+    bench_fanout(args.connections)
+    asyncio.run(bench_connections(args.connections, args.port))
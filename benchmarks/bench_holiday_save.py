@@ -0,0 +1,156 @@
+# ============================================================
+# ✅ bench_holiday_save.py
+# 📍 Holiday save latency: UNNEST change-set vs one UPDATE per row
+# 🧪 Usage: DATABASE_URL=postgresql://... python -m benchmarks.bench_holiday_save
+# 🔍 Works in a throwaway schema (holiday_bench) which is dropped afterwards
+# Author: Captain & Chatman
+# Version: MPA Phase II — Market Calendar Diagnostics
+# ============================================================
+
+import argparse
+import asyncio
+import logging
+import os
+import time as clock
+from datetime import date, time, timedelta
+
+import asyncpg
+from dotenv import load_dotenv
+
+from control_console.holidays import (
+    HolidayChangeSet,
+    HolidayCreate,
+    HolidayUpdate,
+    apply_holiday_changes,
+)
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+BENCH_SCHEMA = "holiday_bench"
+
+# ✅ Baseline — what /save used to issue once per holiday
+ROW_BY_ROW_SQL = """
+    UPDATE market_holidays
+    SET name = $1, date = $2, close_time = $3,
+        year = EXTRACT(YEAR FROM $2::date)::int
+    WHERE id = $4
+"""
+
+
+def make_holidays(count: int, close: time = None):
+    first = date(2000, 1, 1)
+    return [
+        HolidayCreate(
+            name=f"Holiday {i}", date=first + timedelta(days=i), close_time=close
+        )
+        for i in range(count)
+    ]
+
+
+class RoundTrips:
+    """Counts statements sent on one connection (asyncpg query logger)."""
+
+    def __init__(self, db):
+        self.count = 0
+        db.add_query_logger(self._seen)
+
+    def _seen(self, _record):
+        self.count += 1
+
+
+async def timed(label: str, rows: int, trips: RoundTrips, coro):
+    trips.count = 0
+    started = clock.perf_counter()
+    await coro
+    elapsed = (clock.perf_counter() - started) * 1000
+    logger.info(
+        "%-22s %6d rows %10.2f ms %6d statements", label, rows, elapsed, trips.count
+    )
+
+
+async def row_by_row(db, updates):
+    async with db.transaction():
+        for h in updates:
+            await db.execute(ROW_BY_ROW_SQL, h.name, h.date, h.close_time, h.id)
+
+
+async def bench_size(db, trips: RoundTrips, rows: int):
+    await db.execute("TRUNCATE market_holidays RESTART IDENTITY")
+
+    result = await apply_holiday_changes(
+        db, HolidayChangeSet(create=make_holidays(rows))
+    )
+    ids = [r["id"] for r in result["created"]]
+    updates = [
+        HolidayUpdate(id=i, **h.model_dump())
+        for i, h in zip(ids, make_holidays(rows, close=time(13, 0)))
+    ]
+
+    await timed("🐢 UPDATE per row", rows, trips, row_by_row(db, updates))
+    await timed(
+        "⚡ change-set update",
+        rows,
+        trips,
+        apply_holiday_changes(db, HolidayChangeSet(update=updates)),
+    )
+    await timed(
+        "⚡ change-set delete",
+        rows,
+        trips,
+        apply_holiday_changes(db, HolidayChangeSet(delete=ids)),
+    )
+    await timed(
+        "⚡ change-set create",
+        rows,
+        trips,
+        apply_holiday_changes(db, HolidayChangeSet(create=make_holidays(rows))),
+    )
+    ids = [r["id"] for r in await db.fetch("SELECT id FROM market_holidays")]
+    half = len(ids) // 2
+    mixed = HolidayChangeSet(
+        create=make_holidays(half),
+        update=[
+            HolidayUpdate(id=i, **h.model_dump())
+            for i, h in zip(ids[:half], make_holidays(half, close=time(13, 0)))
+        ],
+        delete=ids[half:],
+    )
+    await timed("⚡ change-set mixed", rows, trips, apply_holiday_changes(db, mixed))
+
+
+async def main(sizes):
+    dsn = os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("❌ DATABASE_URL is not set.")
+
+    db = await asyncpg.connect(dsn)
+    try:
+        await db.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+        await db.execute(f"CREATE SCHEMA {BENCH_SCHEMA}")
+        await db.execute(f"SET search_path TO {BENCH_SCHEMA}")
+        await db.execute(
+            """
+            CREATE TABLE market_holidays (
+                id SERIAL PRIMARY KEY,
+                name TEXT NOT NULL,
+                date DATE NOT NULL,
+                year INT NOT NULL,
+                close_time TIME
+            )
+            """
+        )
+        trips = RoundTrips(db)
+        for rows in sizes:
+            await bench_size(db, trips, rows)
+    finally:
+        await db.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Holiday save latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10000])
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes))
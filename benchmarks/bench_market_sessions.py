@@ -0,0 +1,103 @@
+# ============================================================
+# ✅ bench_market_sessions.py
+# 📍 Lookups/sec: precomputed session timeline vs per-call wall-clock math
+# 🧪 Usage: python -m benchmarks.bench_market_sessions --lookups 200000
+# 🔍 Pure in-process — the calendar is filled by the holiday rule generator
+# Author: Captain & Chatman
+# Version: MPA Phase II — Market Session Diagnostics
+# ============================================================
+
+import argparse
+import logging
+import random
+import time as clock
+from datetime import datetime, timezone
+
+from control_console.holiday_rules import generate_holidays, load_calendar
+from control_console.market_calendar import market_calendar
+from control_console.market_sessions import (
+    AFTER_MARKET,
+    MARKET_CLOSED,
+    MARKET_CLOSED_DAY,
+    MARKET_SESSIONS,
+    MARKET_TZ,
+    SessionTimeline,
+    market_timeline,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+def load_sample_calendar(years):
+    load_calendar(generate_holidays(years[0], years[-1]))
+
+
+# ✅ Baseline — what every status check used to compute from scratch
+def naive_status(now: datetime) -> str:
+    now = now.astimezone(MARKET_TZ)
+    today = now.date()
+    if now.weekday() >= 5 or market_calendar.is_holiday(today):
+        return MARKET_CLOSED_DAY
+    early_close = market_calendar.early_close(today)
+    status = MARKET_CLOSED
+    for start, session in MARKET_SESSIONS:
+        if session == AFTER_MARKET and early_close is not None:
+            start = early_close
+        if now.time() < start:
+            return status
+        status = session
+    return status
+
+
+def rate(fn, instants) -> float:
+    started = clock.perf_counter()
+    for ts in instants:
+        fn(ts)
+    return len(instants) / (clock.perf_counter() - started)
+
+
+def run(lookups: int, year: int):
+    load_sample_calendar(range(year - 1, year + 2))
+
+    started = clock.perf_counter()
+    timeline = SessionTimeline(year)
+    build_ms = (clock.perf_counter() - started) * 1000
+    logger.info(
+        "🗓️ %d timeline: %d transitions built in %.1f ms", year, len(timeline), build_ms
+    )
+
+    first = datetime(year, 1, 1, tzinfo=MARKET_TZ).timestamp()
+    last = datetime(year + 1, 1, 1, tzinfo=MARKET_TZ).timestamp() - 1
+    instants = [random.uniform(first, last) for _ in range(lookups)]
+    moments = [datetime.fromtimestamp(ts, timezone.utc) for ts in instants]
+
+    mismatches = sum(
+        timeline.lookup(ts)[0] != naive_status(moment)
+        for ts, moment in zip(instants[:20000], moments[:20000])
+    )
+    logger.info("🔍 %d mismatches vs per-call math (20k samples)", mismatches)
+
+    logger.info(
+        "⚡ timeline.lookup(epoch)      %12.0f lookups/s",
+        rate(timeline.lookup, instants),
+    )
+    logger.info(
+        "⚡ market_timeline.state(dt)   %12.0f lookups/s",
+        rate(market_timeline.state, moments),
+    )
+    logger.info(
+        "⚡ market_timeline.state() now %12.0f lookups/s",
+        rate(lambda _: market_timeline.state(), moments),
+    )
+    logger.info(
+        "🐢 per-call wall-clock math    %12.0f lookups/s", rate(naive_status, moments)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Session timeline lookups/sec")
+    parser.add_argument("--lookups", type=int, default=200000)
+    parser.add_argument("--year", type=int, default=datetime.now().year)
+    args = parser.parse_args()
+    run(args.lookups, args.year)
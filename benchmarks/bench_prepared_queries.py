@@ -0,0 +1,174 @@
+# ============================================================
+# ✅ bench_prepared_queries.py
+# 📍 Hot-query latency with and without prepared statements: no statement cache
+#    (parse + plan every call), lazily cached, and registry-prepared at pool init
+# 🧪 Usage: DATABASE_URL=postgresql://... python -m benchmarks.bench_prepared_queries
+# 🔍 Works in a throwaway schema (queries_bench) which is dropped afterwards
+# Author: Captain & Chatman
+# Version: MPA Phase II — Database Diagnostics
+# ============================================================
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import asyncpg
+from dotenv import load_dotenv
+
+from control_console.database import create_db_pool
+from control_console.holiday_rules import generate_holidays, write_holidays
+from control_console.queries import QueryRegistry
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+logging.getLogger("control_console.database").setLevel(logging.WARNING)
+
+BENCH_SCHEMA = "queries_bench"
+
+SCHEMA_DDL = """
+    CREATE TABLE admin_users (
+        id SERIAL PRIMARY KEY, username TEXT UNIQUE, password_hash TEXT,
+        must_reset BOOLEAN DEFAULT FALSE
+    );
+    CREATE TABLE login_attempts (
+        id SERIAL PRIMARY KEY, ip_address TEXT, attempt_time TIMESTAMP
+    );
+    CREATE INDEX ON login_attempts (ip_address, attempt_time);
+    CREATE TABLE market_holidays (
+        id SERIAL PRIMARY KEY, name TEXT, date DATE, year INT, close_time TIME
+    );
+    CREATE TABLE api_keys_table (
+        id SERIAL PRIMARY KEY, api_secret TEXT, is_active BOOLEAN,
+        priority_order INT
+    );
+"""
+
+MODES = (
+    # label, statement_cache_size, prepare at init
+    ("🐢 no statement cache", 0, False),
+    ("⚡ lazy statement cache", 100, False),
+    ("⚡ registry (init)", 100, True),
+)
+
+
+async def seed(db, users: int):
+    await db.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    await db.execute(f"CREATE SCHEMA {BENCH_SCHEMA}")
+    await db.execute(f"SET search_path TO {BENCH_SCHEMA}")
+    await db.execute(SCHEMA_DDL)
+    await db.copy_records_to_table(
+        "admin_users",
+        records=[(f"user{i}", "x" * 60, False) for i in range(users)],
+        columns=("username", "password_hash", "must_reset"),
+    )
+    now = datetime.utcnow()
+    await db.copy_records_to_table(
+        "login_attempts",
+        records=[
+            (f"10.0.{i % 250}.{i % 200}", now - timedelta(minutes=i % 120))
+            for i in range(users * 5)
+        ],
+        columns=("ip_address", "attempt_time"),
+    )
+    await db.executemany(
+        "INSERT INTO api_keys_table (api_secret, is_active, priority_order)"
+        " VALUES ($1, $2, $3)",
+        [(f"key{i}", i % 2 == 0, i) for i in range(20)],
+    )
+    await write_holidays(db, generate_holidays(2000, 2099))
+    await db.execute("ANALYZE")
+
+
+def workload(users: int):
+    """One login-shaped request: rate-limit check, user lookup, plus the others."""
+    ip = f"10.0.{random.randrange(250)}.{random.randrange(200)}"
+    cutoff = datetime.utcnow() - timedelta(minutes=30)
+    return (
+        ("login_attempts_recent", (ip, cutoff, 6)),
+        ("admin_user_by_username", (f"user{random.randrange(users)}",)),
+        ("admin_user_count", ()),
+        ("active_api_key", ()),
+    )
+
+
+async def run(dsn, label, cache_size, prepare, clients, rounds, users):
+    registry = QueryRegistry()
+    overrides = {"statement_cache_size": cache_size}
+    if prepare:
+        overrides["init"] = registry.init_connection
+    else:
+        overrides["init"] = None
+    pool = await create_db_pool(
+        dsn,
+        min_size=clients,
+        max_size=clients,
+        server_settings={"search_path": BENCH_SCHEMA},
+        **overrides,
+    )
+    first_calls = []
+
+    async def client():
+        async with pool.acquire() as db:
+            first = True
+            for _ in range(rounds):
+                for name, args in workload(users):
+                    started = time.perf_counter()
+                    await registry.fetch(db, name, *args)
+                    if first:
+                        first_calls.append(time.perf_counter() - started)
+                        first = False
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    await pool.close()
+
+    summary = registry.summary()
+    total = sum(s["calls"] for s in summary.values())
+    logger.info(
+        "%-24s %8.0f queries/s | first call p50 %6.3f ms | %s",
+        label,
+        total / elapsed,
+        statistics.median(first_calls) * 1000,
+        "  ".join(
+            f"{name.split('_', 1)[1][:14]} p50 {s['p50_ms']:.3f}"
+            for name, s in summary.items()
+            if s["calls"]
+        ),
+    )
+
+
+async def main(args):
+    dsn = os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("❌ DATABASE_URL is not set.")
+    db = await asyncpg.connect(dsn)
+    try:
+        await seed(db, args.users)
+        for label, cache_size, prepare in MODES:
+            await run(
+                dsn,
+                label,
+                cache_size,
+                prepare,
+                args.clients,
+                args.rounds,
+                args.users,
+            )
+    finally:
+        await db.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prepared hot-query latency")
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--users", type=int, default=20000)
+    asyncio.run(main(parser.parse_args()))
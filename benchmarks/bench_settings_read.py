@@ -0,0 +1,75 @@
+# ============================================================
+# ✅ bench_settings_read.py
+# 📍 Cost of reading one global setting: a pool query per read (the old router's
+#    shape, minus SQLAlchemy's threadpool hop) vs the in-memory snapshot
+# 🧪 Usage: DATABASE_URL=postgresql://... python -m benchmarks.bench_settings_read
+# 🔍 Works in a throwaway schema (settings_bench) which is dropped afterwards
+# Author: Captain & Chatman
+# Version: MPA Phase II — Database Diagnostics
+# ============================================================
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import time
+
+import asyncpg
+from dotenv import load_dotenv
+
+from control_console.database import create_db_pool
+from control_console.settings import SettingsService, ensure_settings_table
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+logging.getLogger("control_console").setLevel(logging.WARNING)
+
+BENCH_SCHEMA = "settings_bench"
+SELECT_ONE = "SELECT setting_value FROM global_settings WHERE setting_key = $1"
+
+
+async def main(args):
+    dsn = os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("❌ DATABASE_URL is not set.")
+    admin = await asyncpg.connect(dsn)
+    await admin.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+    await admin.execute(f"CREATE SCHEMA {BENCH_SCHEMA}")
+    pool = await create_db_pool(
+        dsn, min_size=4, max_size=4, server_settings={"search_path": BENCH_SCHEMA}
+    )
+    try:
+        service = SettingsService()
+        async with pool.acquire() as db:
+            await ensure_settings_table(db)
+            for i in range(args.keys):
+                await service.upsert(db, f"setting_{i}", str(i))
+            await service.reload(db)
+        keys = [f"setting_{random.randrange(args.keys)}" for _ in range(args.reads)]
+
+        started = time.perf_counter()
+        for key in keys:
+            await pool.fetchval(SELECT_ONE, key)
+        per_query = (time.perf_counter() - started) / len(keys)
+
+        started = time.perf_counter()
+        for key in keys:
+            service.get(key)
+        per_lookup = (time.perf_counter() - started) / len(keys)
+
+        logger.info("🐢 pool query per read   %9.2f µs", per_query * 1e6)
+        logger.info("⚡ snapshot lookup       %9.3f µs", per_lookup * 1e6)
+        logger.info("   → %.0fx faster", per_query / per_lookup)
+    finally:
+        await pool.close()
+        await admin.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE")
+        await admin.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Settings read cost")
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--reads", type=int, default=5000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,112 @@
+# ============================================================
+# ✅ bench_trading_days.py
+# 📍 Trading-day arithmetic: NumPy busday calendar vs a per-date Python loop
+# 🧪 Usage: python -m benchmarks.bench_trading_days --sizes 1000 10000 100000
+# 🔍 Pure in-process — holidays come from the rule generator (2000–2099)
+# Author: Captain & Chatman
+# Version: MPA Phase II — Market Calendar Diagnostics
+# ============================================================
+
+import argparse
+import logging
+import random
+import time as clock
+from datetime import date, timedelta
+
+from control_console.holiday_rules import generate_holidays, load_calendar
+from control_console.market_calendar import market_calendar
+from control_console.trading_days import TradingDays, iso
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+SHIFT = 5
+SPAN = 90
+
+
+# ✅ Baseline — one date at a time, walking the calendar day by day
+def naive_is_trading(day: date) -> bool:
+    return day.weekday() < 5 and not market_calendar.is_holiday(day)
+
+
+def naive_shift(day: date, n: int) -> date:
+    step = 1 if n > 0 else -1
+    while n:
+        day += timedelta(days=step)
+        if naive_is_trading(day):
+            n -= step
+    return day
+
+
+def naive_count(start: date, end: date) -> int:
+    count, day = 0, start
+    while day < end:
+        count += naive_is_trading(day)
+        day += timedelta(days=1)
+    return count
+
+
+def timed(fn):
+    started = clock.perf_counter()
+    result = fn()
+    return result, (clock.perf_counter() - started) * 1000
+
+
+def run(size: int, service: TradingDays):
+    first = date(2001, 1, 1)
+    days = [first + timedelta(days=random.randrange(365 * 97)) for _ in range(size)]
+    until = [d + timedelta(days=SPAN) for d in days]
+    strings = [d.isoformat() for d in days]  # What the API receives
+
+    cases = (
+        (
+            "is_trading_day",
+            lambda: [naive_is_trading(d) for d in days],
+            lambda: service.is_trading_day(strings).tolist(),
+        ),
+        (
+            f"shift +{SHIFT}",
+            lambda: [naive_shift(d, SHIFT).isoformat() for d in days],
+            lambda: iso(service.shift(strings, SHIFT)),
+        ),
+        (
+            f"shift -{SHIFT}",
+            lambda: [naive_shift(d, -SHIFT).isoformat() for d in days],
+            lambda: iso(service.shift(strings, -SHIFT)),
+        ),
+        (
+            f"count {SPAN}d",
+            lambda: [naive_count(d, u) for d, u in zip(days, until)],
+            lambda: service.count(strings, [u.isoformat() for u in until]).tolist(),
+        ),
+    )
+    for label, naive, vectorized in cases:
+        expected, naive_ms = timed(naive)
+        actual, fast_ms = timed(vectorized)
+        logger.info(
+            "%7d dates %-15s 🐢 %9.2f ms  ⚡ %8.2f ms  ×%-7.1f %s",
+            size,
+            label,
+            naive_ms,
+            fast_ms,
+            naive_ms / fast_ms,
+            "✅" if actual == expected else "❌ MISMATCH",
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Trading-day arithmetic speed")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    load_calendar(generate_holidays(2000, 2099))
+    trading = TradingDays()
+    _, build_ms = timed(lambda: trading.busdays)
+    _, table_ms = timed(lambda: iso(trading.shift(["2026-01-02"], 0)))
+    logger.info(
+        "🗓️ busday calendar (2000–2099) built in %.1f ms, ISO table in %.1f ms",
+        build_ms,
+        table_ms,
+    )
+    for count in args.sizes:
+        run(count, trading)
@@ -11,7 +11,11 @@ import bcrypt
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
-router = APIRouter()
+from control_console.cache_bus import cache_bus
+from control_console.queries import query_registry
+from control_console.utils.db import DB, DB_READ
+
+router = APIRouter(dependencies=[DB])
 
 # ✅ Setup Logging
 logging.basicConfig(level=logging.INFO)
@@ -52,7 +56,7 @@ def validate_phone_number(phone_number: str) -> bool:
 
 
 # ✅ GET All Admin Users
-@router.get("/", tags=["admin"])
+@router.get("/", tags=["admin"], dependencies=[DB_READ])
 async def get_admin_users(request: Request):
     db = request.state.db
     logging.info("🔍 Fetching all admin users")
@@ -66,6 +70,28 @@ async def get_admin_users(request: Request):
     return users
 
 
+# ✅ GET Live connection pool stats (in-use / idle / acquire waits / timeouts)
+@router.get("/db-pool", tags=["admin"])
+async def get_db_pool_stats(request: Request):
+    read_pool = getattr(request.app.state, "db_read_pool", None)
+    return {
+        **request.app.state.db_pool.stats(),
+        "read_pool": read_pool.stats() if read_pool is not None else None,
+    }
+
+
+# ✅ GET Cross-worker invalidation bus state (connection, messages, resyncs)
+@router.get("/cache-bus", tags=["admin"])
+async def get_cache_bus_stats():
+    return cache_bus.stats()
+
+
+# ✅ GET Per-statement call counts and latency for the prepared hot queries
+@router.get("/queries", tags=["admin"])
+async def get_query_stats():
+    return query_registry.summary()
+
+
 # ✅ ADD New Admin User
 @router.post("/", tags=["admin"])
 async def add_admin_user(user: AdminUser, request: Request):
@@ -13,7 +13,9 @@ import bcrypt
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
-router = APIRouter(prefix="/api/users")
+from control_console.utils.db import DB
+
+router = APIRouter(prefix="/api/users", dependencies=[DB])
 
 # ✅ Configure logging
 logger = logging.getLogger(__name__)
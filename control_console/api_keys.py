@@ -9,7 +9,11 @@ import logging
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
-router = APIRouter()
+from control_console.cache_bus import API_KEYS, cache_bus
+from control_console.key_scheduler import key_scheduler
+from control_console.utils.db import DB, DB_READ
+
+router = APIRouter(dependencies=[DB])
 logging.basicConfig(level=logging.INFO)
 
 
@@ -39,7 +43,7 @@ class APIKey(BaseModel):
 
 
 # ✅ GET all API keys
-@router.get("/", tags=["api_keys"])
+@router.get("/", tags=["api_keys"], dependencies=[DB_READ])
 async def get_all_api_keys(request: Request):
     db = request.state.db
     try:
@@ -59,6 +63,12 @@ async def get_all_api_keys(request: Request):
         raise HTTPException(status_code=500, detail="Error retrieving API keys") from e
 
 
+# ✅ GET live usage per key (in-process scheduler counters)
+@router.get("/usage", tags=["api_keys"])
+async def get_api_key_usage():
+    return key_scheduler.stats()
+
+
 # ✅ ADD API Key
 @router.post("/", tags=["api_keys"])
 async def add_api_key(api_key: APIKey, request: Request):
@@ -97,6 +107,8 @@ async def add_api_key(api_key: APIKey, request: Request):
             identifier,
         )
 
+        key_scheduler.invalidate()
+        await cache_bus.publish_committed(db, API_KEYS)
         logging.info("✅ Added API key label: %s", api_key.key_label)
         return {"message": "API key added successfully"}
     except Exception as e:
@@ -112,6 +124,8 @@ async def delete_api_key(key_id: int, request: Request):
         result = await db.execute("DELETE FROM api_keys_table WHERE id = $1", key_id)
         if result == "DELETE 0":
             raise HTTPException(status_code=404, detail="API key not found")
+        key_scheduler.invalidate()
+        await cache_bus.publish_committed(db, API_KEYS, [key_id])
         logging.info("🗑️ Deleted API key ID %s", key_id)
         return {"message": "API key deleted successfully"}
     except Exception as e:
@@ -165,6 +179,8 @@ async def update_api_key(key_id: int, api_key: APIKey, request: Request):
 
         if result == "UPDATE 0":
             raise HTTPException(status_code=404, detail="API key not found")
+        key_scheduler.invalidate()
+        await cache_bus.publish_committed(db, API_KEYS, [key_id])
         logging.info("✅ Updated API key ID %s", key_id)
         return {"message": "API key updated successfully"}
     except Exception as e:
@@ -15,10 +15,12 @@ from fastapi.templating import Jinja2Templates
 from passlib.hash import bcrypt
 from starlette.status import HTTP_302_FOUND
 
+from control_console.queries import query_registry
 from control_console.rate_limiter import is_rate_limited, record_attempt
+from control_console.utils.db import DB
 from control_console.utils.email_sender import send_reset_email
 
-router = APIRouter()
+router = APIRouter(dependencies=[DB])
 templates = Jinja2Templates(directory="templates")
 
 
@@ -43,10 +45,7 @@ async def login(request: Request, username: str = Form(...), password: str = For
         )
 
     db = request.state.db
-    user = await db.fetchrow(
-        "SELECT id, password_hash, must_reset FROM admin_users WHERE username = $1",
-        username.strip(),
-    )
+    user = await query_registry.fetchrow(db, "admin_user_by_username", username.strip())
 
     if user and bcrypt.verify(password, user["password_hash"]):
         request.session["user_id"] = str(user["id"])
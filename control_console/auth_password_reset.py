@@ -14,9 +14,10 @@ from fastapi.templating import Jinja2Templates
 from passlib.hash import bcrypt
 from starlette.status import HTTP_302_FOUND
 
+from control_console.utils.db import DB
 from control_console.utils.email_sender import send_reset_email
 
-router = APIRouter()
+router = APIRouter(dependencies=[DB])
 templates = Jinja2Templates(directory="templates")
 
 
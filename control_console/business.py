@@ -4,30 +4,32 @@
 # 🛠️ STATUS: Active (MPA Phase I) — Author: Captain & Chatman
 # ==========================================================
 
-from datetime import datetime
+from control_console.key_health import key_health
+from control_console.key_scheduler import key_scheduler
+from control_console.market_calendar import market_calendar
+from control_console.market_sessions import SessionState, market_timeline
+from control_console.queries import query_registry
 
 
 # ✅ GET Active API Key
 async def get_active_api_key(db):
-    query = """
-        SELECT api_secret
-        FROM api_keys_table
-        WHERE is_active = TRUE
-        ORDER BY priority_order ASC
-        LIMIT 1
-    """
-    row = await db.fetchrow(query)
+    row = await query_registry.fetchrow(db, "active_api_key")
     return row["api_secret"] if row else None
 
 
-# ✅ Mark API Key as Failed
-async def mark_api_key_failed(db, api_key: str):
+# ✅ Mark API Key as Failed (trips its circuit breaker — never deactivates)
+async def mark_api_key_failed(db, api_key: str, error_code: str = "Failed"):
+    key_id = key_scheduler.key_id_for(api_key)
+    if key_id is not None:
+        key_health.record_failure(key_id, error_code)  # DB stamped by the flusher
+        return
+
     query = """
         UPDATE api_keys_table
-        SET is_active = FALSE, last_used = NOW(), error_code = 'Failed'
+        SET last_used = NOW(), error_code = $2
         WHERE api_secret = $1
     """
-    await db.execute(query, api_key)
+    await db.execute(query, api_key, error_code)
 
 
 # ✅ Check Role-Based Access
@@ -43,29 +45,20 @@ async def user_has_access(db, admin_id: int, tab_name: str) -> bool:
 
 # ✅ Market Status Helper
 async def get_market_status(db):
-    now = datetime.utcnow()
-    current_date = now.date()
-    current_hour = now.hour
-    current_minute = now.minute
-
-    # Check for holiday
-    query = "SELECT date FROM market_holidays WHERE date = $1"
-    holiday = await db.fetchrow(query, current_date)
-
-    is_holiday = holiday is not None
-    is_weekend = now.weekday() in [5, 6]  # Sat/Sun
-
-    if is_holiday or is_weekend:
-        return "Market Closed (Holiday or Weekend)"
-    if current_hour < 4:
-        return "Market Closed"
-    if current_hour < 9 or (current_hour == 9 and current_minute < 30):
-        return "Pre-Market Trading"
-    if current_hour < 16:
-        return "Market Open"
-    if current_hour < 20:
-        return "After-Market Trading"
-    return "Market Closed"
+    status, _ = await get_market_session(db)
+    return status
+
+
+# ✅ Current session + when it ends — a bisect into the precomputed yearly
+#    timeline. Holidays come from the in-memory calendar: `db` only loads it.
+async def get_market_state(db=None, now=None) -> SessionState:
+    await market_calendar.ensure_loaded(db)
+    return market_timeline.state(now)
+
+
+async def get_market_session(db=None, now=None):
+    state = await get_market_state(db, now)
+    return state.status, state.ends_at
 
 
 # ✅ Log Admin Actions
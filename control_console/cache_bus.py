@@ -0,0 +1,242 @@
+# ==========================================================
+# ✅ FILE: control_console/cache_bus.py
+# 📌 PURPOSE: Cross-worker cache invalidation over Postgres LISTEN/NOTIFY
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+from uuid import uuid4
+
+import asyncpg
+
+from control_console.config import (
+    CACHE_BUS_CHANNEL,
+    CACHE_BUS_ENABLED,
+    CACHE_BUS_PING_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+# ✅ Topics — one per in-process cache
+HOLIDAYS = "holidays"
+API_KEYS = "api_keys"
+PERMISSIONS = "permissions"
+SETTINGS = "settings"
+TOPICS = (HOLIDAYS, API_KEYS, PERMISSIONS, SETTINGS)
+
+MAX_PAYLOAD = 7500  # NOTIFY caps payloads at 8000 bytes; larger → "everything"
+RECONNECT_BACKOFF = (1.0, 30.0)
+CONNECT_WAIT = 5.0  # How long start() waits for the first LISTEN
+
+# handler(db_pool, keys) — keys == () means "drop / reload everything"
+Handler = Callable[[object, Tuple[str, ...]], Awaitable[None]]
+
+
+class Invalidation(NamedTuple):
+    topic: str
+    keys: Tuple[str, ...]
+    origin: str  # Publishing worker
+    seq: int  # Per-origin sequence number (gap detection)
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            {"t": self.topic, "k": self.keys, "o": self.origin, "s": self.seq},
+            separators=(",", ":"),
+        )
+        if len(payload) > MAX_PAYLOAD:
+            return self._replace(keys=()).encode()
+        return payload
+
+    @classmethod
+    def decode(cls, payload: str) -> "Invalidation":
+        data = json.loads(payload)
+        return cls(data["t"], tuple(data["k"]), data["o"], data["s"])
+
+
+class CacheBus:
+    def __init__(
+        self, channel: str = CACHE_BUS_CHANNEL, enabled: bool = CACHE_BUS_ENABLED
+    ):
+        self.channel = channel
+        self.enabled = enabled
+        self.origin = uuid4().hex[:12]
+        self._seq = 0
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._last_seq: Dict[str, int] = {}  # origin → highest seq seen
+        self._queue: "asyncio.Queue[Optional[Invalidation]]" = asyncio.Queue()
+        self._db_pool = None
+        self._dsn: Optional[str] = None
+        self._connection: Optional[asyncpg.Connection] = None
+        self._connected = asyncio.Event()
+        self._resync_on_connect = False
+        self._listen_task = None
+        self._dispatch_task = None
+        self.counters = {
+            "published": 0,
+            "received": 0,
+            "handled": 0,
+            "handler_errors": 0,
+            "publish_errors": 0,
+            "gaps": 0,
+            "resyncs": 0,
+            "reconnects": 0,
+        }
+
+    def subscribe(self, topic: str, handler: Handler):
+        self._handlers.setdefault(topic, []).append(handler)
+
+    # ✅ Publish — on the writer's own connection. Inside a transaction NOTIFY is
+    #    only delivered at COMMIT (and dropped on rollback), so "after commit" holds.
+    async def publish(self, db, topic: str, keys=()) -> Invalidation:
+        self._seq += 1
+        message = Invalidation(
+            topic, tuple(str(k) for k in keys), self.origin, self._seq
+        )
+        if self.enabled:
+            await db.execute("SELECT pg_notify($1, $2)", self.channel, message.encode())
+            self.counters["published"] += 1
+        return message
+
+    # ✅ For writes that already committed — a lost NOTIFY only delays the other
+    #    workers (their TTLs / next resync catch up), so it must never fail the
+    #    request that made the change
+    async def publish_committed(self, db, topic: str, keys=()) -> bool:
+        try:
+            await self.publish(db, topic, keys)
+            return True
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.counters["publish_errors"] += 1
+            logger.error("❌ Cache bus publish for %s failed: %s", topic, e)
+            return False
+
+    # ✅ Lifecycle — dedicated listener connection (never a pool slot)
+    async def start(self, db_pool, dsn: str):
+        if not self.enabled:
+            return
+        self._db_pool = db_pool
+        self._dsn = dsn
+        self._dispatch_task = asyncio.create_task(
+            self._dispatch(), name="cache-bus-dispatch"
+        )
+        self._listen_task = asyncio.create_task(self._listen(), name="cache-bus-listen")
+        try:
+            # Listening before the caches load means nothing slips in between
+            await asyncio.wait_for(self._connected.wait(), CONNECT_WAIT)
+        except asyncio.TimeoutError:
+            logger.warning("⚠ Cache bus not connected yet — will resync once it is")
+            self._resync_on_connect = True
+
+    async def stop(self):
+        for task in (self._listen_task, self._dispatch_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._listen_task = self._dispatch_task = None
+        await self._close()
+
+    async def _close(self):
+        connection, self._connection = self._connection, None
+        self._connected.clear()
+        if connection is not None and not connection.is_closed():
+            await connection.close(timeout=2)
+
+    async def _listen(self):
+        backoff = RECONNECT_BACKOFF[0]
+        while True:
+            try:
+                lost = asyncio.Event()
+                self._connection = await asyncpg.connect(self._dsn)
+                self._connection.add_termination_listener(lambda _c: lost.set())
+                await self._connection.add_listener(self.channel, self._on_notify)
+                logger.info("📣 Cache bus listening on '%s'", self.channel)
+                self._connected.set()
+                backoff = RECONNECT_BACKOFF[0]
+
+                if self._resync_on_connect:
+                    self._queue.put_nowait(None)  # Anything sent while away is lost
+                self._resync_on_connect = True
+
+                # Server-side closes end the wait at once; a ping catches a
+                # silently dropped socket
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), CACHE_BUS_PING_INTERVAL)
+                    except asyncio.TimeoutError:
+                        await asyncio.wait_for(
+                            self._connection.execute("SELECT 1"),
+                            CACHE_BUS_PING_INTERVAL,
+                        )
+                raise ConnectionError("listener connection closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("⚠ Cache bus connection lost: %s", e)
+                self.counters["reconnects"] += 1
+            finally:
+                await self._close()
+            await asyncio.sleep(backoff)
+            backoff = min(RECONNECT_BACKOFF[1], backoff * 2)
+
+    def _on_notify(self, _connection, _pid, _channel, payload: str):
+        try:
+            message = Invalidation.decode(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("⚠ Ignoring malformed cache bus payload: %.200s", payload)
+            return
+        self.counters["received"] += 1
+        if message.origin == self.origin:
+            return  # Writers update their own caches directly
+
+        last = self._last_seq.get(message.origin)
+        self._last_seq[message.origin] = max(last or 0, message.seq)
+        if last is not None and message.seq > last + 1:
+            # Missed (or rolled-back) messages from that worker — play it safe
+            self.counters["gaps"] += 1
+            self._queue.put_nowait(None)
+        self._queue.put_nowait(message)
+
+    # ✅ Handlers run one at a time, in arrival order; None = resync everything
+    async def _dispatch(self):
+        while True:
+            message = await self._queue.get()
+            if message is None:
+                await self.resync()
+            else:
+                await self._handle(message.topic, message.keys)
+
+    async def resync(self):
+        self.counters["resyncs"] += 1
+        logger.info("🔄 Cache bus resync — reloading every subscribed cache")
+        for topic in self._handlers:
+            await self._handle(topic, ())
+
+    async def _handle(self, topic: str, keys: Tuple[str, ...]):
+        for handler in self._handlers.get(topic, ()):
+            try:
+                await handler(self._db_pool, keys)
+                self.counters["handled"] += 1
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.counters["handler_errors"] += 1
+                logger.error("❌ Cache bus handler for %s failed: %s", topic, e)
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "connected": self._connected.is_set(),
+            "channel": self.channel,
+            "origin": self.origin,
+            "topics": {t: len(h) for t, h in self._handlers.items()},
+            "peers": len(self._last_seq),
+            "queued": self._queue.qsize(),
+            **self.counters,
+        }
+
+
+# ✅ Shared instance
+cache_bus = CacheBus()
@@ -25,6 +25,30 @@ def build_database_url():
     return f"postgresql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}?sslmode={DB_SSL}"
 
 
+# === Connection Pool (database.create_db_pool) ===
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE") or 2)
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE") or 10)
+DB_POOL_ACQUIRE_TIMEOUT = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT") or 10)  # 0 = wait
+DB_MAX_INACTIVE_LIFETIME = float(os.getenv("DB_MAX_INACTIVE_LIFETIME") or 300)
+# Prepared statements cached per connection; set 0 behind PgBouncer (transaction mode)
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE") or 100)
+
+# === Read Replica (optional — unset = everything on the primary) ===
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+# After a write, that session reads from the primary this long (covers replica lag)
+DB_READ_YOUR_WRITES_WINDOW = float(os.getenv("DB_READ_YOUR_WRITES_WINDOW") or 5)
+
+# === Cross-worker Cache Invalidation (cache_bus.py — LISTEN/NOTIFY) ===
+CACHE_BUS_ENABLED = os.getenv("CACHE_BUS_ENABLED", "true").lower() == "true"
+CACHE_BUS_CHANNEL = os.getenv("CACHE_BUS_CHANNEL", "cache_invalidation")
+# LISTEN needs a session connection — point this past PgBouncer (transaction mode)
+CACHE_BUS_URL = os.getenv("CACHE_BUS_URL")  # Unset = DATABASE_URL
+CACHE_BUS_PING_INTERVAL = float(os.getenv("CACHE_BUS_PING_INTERVAL") or 30)
+# Per-user tab access (user_management.py) — backstop if an invalidation is missed
+PERMISSIONS_CACHE_TTL = float(os.getenv("PERMISSIONS_CACHE_TTL") or 60)  # 0 = off
+PERMISSIONS_CACHE_MAX_USERS = int(os.getenv("PERMISSIONS_CACHE_MAX_USERS") or 1000)
+
+
 # === Session Management ===
 SESSION_PREFIX = os.getenv("SESSION_PREFIX")
 SESSION_SUFFIX = os.getenv("SESSION_SUFFIX")
@@ -49,5 +73,40 @@ DEFAULT_ADMIN_PASS = os.getenv("DEFAULT_ADMIN_PASS")
 DEFAULT_ADMIN_CODE = os.getenv("DEFAULT_ADMIN_CODE")
 DEFAULT_ADMIN_ROLE = os.getenv("DEFAULT_ADMIN_ROLE", "SuperAdmin")
 
+# === Nasdaq Halted Securities Feed (used by api/halts) ===
+NASDAQ_HALTS_URL = os.getenv(
+    "NASDAQ_HALTS_URL", "https://api.nasdaq.com/api/marketmovers/halted"
+)
+NASDAQ_API_KEY = os.getenv("NASDAQ_API_KEY")  # Fallback when no DB key is active
+MARKET_CALENDAR_TTL = float(os.getenv("MARKET_CALENDAR_TTL") or 3600)  # 0 = never
+HALT_POLL_INTERVAL = float(os.getenv("HALT_POLL_INTERVAL") or 15)  # Regular session
+HALT_POLL_INTERVAL_EXTENDED = float(os.getenv("HALT_POLL_INTERVAL_EXTENDED") or 60)
+HALT_POLL_TIMEOUT = float(os.getenv("HALT_POLL_TIMEOUT") or 5)
+HALT_POLLER_ENABLED = os.getenv("HALT_POLLER_ENABLED", "true").lower() == "true"
+HALT_STREAM_QUEUE_SIZE = int(os.getenv("HALT_STREAM_QUEUE_SIZE") or 32)
+HALT_STREAM_HEARTBEAT = float(os.getenv("HALT_STREAM_HEARTBEAT") or 15)
+HALT_HISTORY_ENABLED = os.getenv("HALT_HISTORY_ENABLED", "true").lower() == "true"
+HALT_HISTORY_BATCH_SIZE = int(os.getenv("HALT_HISTORY_BATCH_SIZE") or 500)
+HALT_HISTORY_FLUSH_INTERVAL = float(os.getenv("HALT_HISTORY_FLUSH_INTERVAL") or 2)
+HALT_HISTORY_MAX_BUFFER = int(os.getenv("HALT_HISTORY_MAX_BUFFER") or 50000)
+
+# === Shared Upstream HTTP Client (utils/http_client.py) ===
+UPSTREAM_MAX_CONNECTIONS = int(os.getenv("UPSTREAM_MAX_CONNECTIONS") or 20)
+UPSTREAM_MAX_KEEPALIVE = int(os.getenv("UPSTREAM_MAX_KEEPALIVE") or 10)
+UPSTREAM_KEEPALIVE_EXPIRY = float(os.getenv("UPSTREAM_KEEPALIVE_EXPIRY") or 60)
+UPSTREAM_CONNECT_TIMEOUT = float(os.getenv("UPSTREAM_CONNECT_TIMEOUT") or 3)
+UPSTREAM_READ_TIMEOUT = float(os.getenv("UPSTREAM_READ_TIMEOUT") or 10)
+
+# === Upstream API Key Scheduling (key_scheduler.py) ===
+# Fraction of each api_keys_table limit this process may spend (1 / workers)
+KEY_BUDGET_SHARE = float(os.getenv("KEY_BUDGET_SHARE") or 1.0)
+KEY_REFRESH_INTERVAL = float(os.getenv("KEY_REFRESH_INTERVAL") or 60)
+
+# === Upstream API Key Circuit Breakers (key_health.py) ===
+KEY_BREAKER_THRESHOLD = int(os.getenv("KEY_BREAKER_THRESHOLD") or 3)
+KEY_BREAKER_BASE_BACKOFF = float(os.getenv("KEY_BREAKER_BASE_BACKOFF") or 5)
+KEY_BREAKER_MAX_BACKOFF = float(os.getenv("KEY_BREAKER_MAX_BACKOFF") or 900)
+KEY_HEALTH_FLUSH_INTERVAL = float(os.getenv("KEY_HEALTH_FLUSH_INTERVAL") or 5)
+
 # === Jinja2 Templates Engine (for HTML pages) ===
 templates = Jinja2Templates(directory="templates")
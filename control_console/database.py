@@ -1,47 +1,185 @@
 # ==========================================================
 # ✅ FILE: control_console/database.py
-# 📌 PURPOSE: Establish asyncpg DB connection pool
-# 🛠️ STATUS: Active (MPA Phase I) — Author: Captain & Chatman
+# 📌 PURPOSE: The one asyncpg pool factory (env-tuned) + live pool statistics
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
 # ==========================================================
 
+import asyncio
 import logging
 import os
+import time
+from bisect import bisect_left
+from typing import Optional
 
 import asyncpg
 
+from control_console.config import (
+    DB_MAX_INACTIVE_LIFETIME,
+    DB_POOL_ACQUIRE_TIMEOUT,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MIN_SIZE,
+    DB_STATEMENT_CACHE_SIZE,
+    DATABASE_READ_URL,
+    build_database_url,
+)
+from control_console.queries import RegistryConnection, query_registry
+
 # ✅ Setup logging
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
+# Acquire-wait histogram bucket bounds (ms); the last bucket is "+Inf"
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
 
-# ✅ Build DATABASE_URL from individual parts (for local dev)
-def build_database_url():
-    user = os.getenv("DB_USER")
-    password = os.getenv("DB_PASS")
-    host = os.getenv("DB_HOST")
-    port = os.getenv("DB_PORT", "5432")
-    dbname = os.getenv("DB_NAME")
-    sslmode = os.getenv("DB_SSL", "require")
 
-    if not all([user, password, host, dbname]):
-        raise EnvironmentError(
-            "❌ Missing one or more required DB environment variables for fallback URL."
-        )
+# ✅ Resolve DATABASE_URL from environment or fallback (local dev parts)
+def database_url() -> str:
+    return os.getenv("DATABASE_URL") or build_database_url()
+
+
+# ✅ Acquire-wait histogram + counters
+class PoolMetrics:
+    def __init__(self):
+        self.acquires = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def observe(self, seconds: float):
+        self.acquires += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+        self.buckets[bisect_left(WAIT_BUCKETS_MS, seconds * 1000)] += 1
+
+    def histogram(self) -> dict:
+        """Cumulative counts per upper bound (ms), Prometheus-style."""
+        labels = [str(b) for b in WAIT_BUCKETS_MS] + ["+Inf"]
+        running, out = 0, {}
+        for label, count in zip(labels, self.buckets):
+            running += count
+            out[label] = running
+        return out
+
+
+# ✅ asyncpg.Pool with every acquire timed — same acquire()/release() surface
+class InstrumentedPool:
+    def __init__(self, pool: asyncpg.Pool, acquire_timeout: Optional[float] = None):
+        self.pool = pool
+        self.acquire_timeout = acquire_timeout
+        self.metrics = PoolMetrics()
+
+    def acquire(self, *, timeout: Optional[float] = None):
+        return _PoolAcquire(self, timeout or self.acquire_timeout)
+
+    async def _acquire(self, timeout: Optional[float]):
+        started = time.perf_counter()
+        try:
+            return await self.pool.acquire(timeout=timeout)
+        except asyncio.TimeoutError:
+            self.metrics.timeouts += 1
+            logger.warning("⏳ DB pool acquire timed out after %ss", timeout)
+            raise
+        finally:
+            self.metrics.observe(time.perf_counter() - started)
+
+    async def release(self, connection, *, timeout: Optional[float] = None):
+        await self.pool.release(connection, timeout=timeout)
+
+    async def close(self):
+        await self.pool.close()
+
+    # Pool-level shortcuts go through acquire() so they are counted too
+    async def execute(self, query: str, *args, **kwargs):
+        async with self.acquire() as db:
+            return await db.execute(query, *args, **kwargs)
 
-    return f"postgresql://{user}:{password}@{host}:{port}/{dbname}?sslmode={sslmode}"
+    async def fetch(self, query: str, *args, **kwargs):
+        async with self.acquire() as db:
+            return await db.fetch(query, *args, **kwargs)
 
+    async def fetchrow(self, query: str, *args, **kwargs):
+        async with self.acquire() as db:
+            return await db.fetchrow(query, *args, **kwargs)
 
-# ✅ Resolve DATABASE_URL from environment or fallback
-DATABASE_URL = os.getenv("DATABASE_URL") or build_database_url()
+    async def fetchval(self, query: str, *args, **kwargs):
+        async with self.acquire() as db:
+            return await db.fetchval(query, *args, **kwargs)
 
+    def get_size(self) -> int:
+        return self.pool.get_size()
 
-# ✅ Create and return an asyncpg connection pool
-async def create_db_pool():
+    def get_idle_size(self) -> int:
+        return self.pool.get_idle_size()
+
+    def stats(self) -> dict:
+        size, idle = self.pool.get_size(), self.pool.get_idle_size()
+        s = self.metrics
+        return {
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "min_size": self.pool.get_min_size(),
+            "max_size": self.pool.get_max_size(),
+            "acquires": s.acquires,
+            "timeouts": s.timeouts,
+            "wait_avg_ms": (
+                round(s.wait_total / s.acquires * 1000, 3) if s.acquires else 0.0
+            ),
+            "wait_max_ms": round(s.wait_max * 1000, 3),
+            "wait_histogram_ms": s.histogram(),
+        }
+
+
+class _PoolAcquire:
+    """`async with pool.acquire()` or `await pool.acquire()`, like asyncpg."""
+
+    def __init__(self, pool: InstrumentedPool, timeout: Optional[float]):
+        self._pool = pool
+        self._timeout = timeout
+        self._connection = None
+
+    def __await__(self):
+        return self._pool._acquire(self._timeout).__await__()
+
+    async def __aenter__(self):
+        self._connection = await self._pool._acquire(self._timeout)
+        return self._connection
+
+    async def __aexit__(self, *exc_info):
+        connection, self._connection = self._connection, None
+        await self._pool.release(connection)
+
+
+# ✅ Create and return the app-wide pool (sizes / timeouts / cache from env)
+async def create_db_pool(dsn: Optional[str] = None, **overrides) -> InstrumentedPool:
+    options = {
+        "min_size": DB_POOL_MIN_SIZE,
+        "max_size": DB_POOL_MAX_SIZE,
+        "max_inactive_connection_lifetime": DB_MAX_INACTIVE_LIFETIME,
+        "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        # Hot statements are prepared once per connection (control_console/queries.py)
+        "connection_class": RegistryConnection,
+        "init": query_registry.init_connection,
+        **overrides,
+    }
+    acquire_timeout = options.pop("acquire_timeout", DB_POOL_ACQUIRE_TIMEOUT) or None
     try:
-        logger.info("📡 Connecting to PostgreSQL...")
-        pool = await asyncpg.create_pool(DATABASE_URL)
+        logger.info(
+            "📡 Connecting to PostgreSQL (pool %d–%d)...",
+            options["min_size"],
+            options["max_size"],
+        )
+        pool = await asyncpg.create_pool(dsn or database_url(), **options)
         logger.info("✅ Database connection pool created successfully")
-        return pool
+        return InstrumentedPool(pool, acquire_timeout)
     except Exception as e:
         logger.error("❌ Failed to create DB pool: %s", e)
         raise
+
+
+# ✅ Optional read-replica pool (DATABASE_READ_URL) — None when not configured
+async def create_read_pool(**overrides) -> Optional[InstrumentedPool]:
+    if not DATABASE_READ_URL:
+        return None
+    logger.info("📖 Read replica configured — read-only routes use a second pool")
+    return await create_db_pool(DATABASE_READ_URL, **overrides)
@@ -19,8 +19,9 @@ from control_console.config import (
     DEFAULT_ADMIN_USER,
     DEV_RESET_TOKEN,
 )
+from control_console.utils.db import DB
 
-router = APIRouter()
+router = APIRouter(dependencies=[DB])
 
 # ✅ Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,214 @@
+# ==========================================================
+# ✅ FILE: control_console/holiday_rules.py
+# 📌 PURPOSE: Rule-based NYSE / Nasdaq holiday + early-close generator (bulk load)
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+import argparse
+import asyncio
+import logging
+import os
+import time as clock
+from datetime import date, time, timedelta
+from typing import Iterable, List, NamedTuple, Optional
+
+from control_console.market_calendar import MarketCalendar, market_calendar
+
+logger = logging.getLogger(__name__)
+
+RULES_SINCE = 1998  # First year every current rule but Juneteenth applies (MLK Day)
+MAX_YEARS = 500
+EARLY_CLOSE = time(13, 0)
+
+MON, TUE, WED, THU, FRI, SAT, SUN = range(7)
+
+
+class HolidayRow(NamedTuple):
+    name: str
+    date: date
+    year: int
+    close_time: Optional[time]  # None → full-day closure
+
+
+# ✅ Date rules
+def easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 19 * l) // 433
+    month = (h + l - 7 * m + 90) // 25
+    return date(year, month, (h + l - 7 * m + 33 * month + 19) % 32)
+
+
+def nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def last_weekday(year: int, month: int, weekday: int) -> date:
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def observed(day: date) -> Optional[date]:
+    """Saturday → Friday, Sunday → Monday; never moved into the previous year."""
+    if day.weekday() == SAT:
+        friday = day - timedelta(days=1)
+        return friday if friday.year == day.year else None
+    if day.weekday() == SUN:
+        return day + timedelta(days=1)
+    return day
+
+
+# ✅ One year of closures, sorted by date
+def year_holidays(year: int) -> List[HolidayRow]:
+    fixed = [
+        ("New Year's Day", date(year, 1, 1)),
+        ("Independence Day", date(year, 7, 4)),
+        ("Christmas Day", date(year, 12, 25)),
+    ]
+    if year >= 2022:
+        fixed.append(("Juneteenth National Independence Day", date(year, 6, 19)))
+
+    closures = [(name, observed(day)) for name, day in fixed]
+    closures += [
+        ("Martin Luther King Jr. Day", nth_weekday(year, 1, MON, 3)),
+        ("Washington's Birthday", nth_weekday(year, 2, MON, 3)),
+        ("Good Friday", easter(year) - timedelta(days=2)),
+        ("Memorial Day", last_weekday(year, 5, MON)),
+        ("Labor Day", nth_weekday(year, 9, MON, 1)),
+        ("Thanksgiving Day", nth_weekday(year, 11, THU, 4)),
+    ]
+    rows = [HolidayRow(name, day, year, None) for name, day in closures if day]
+
+    # Early closes: 13:00 on the eve of July 4th / Christmas when that eve is a
+    # Mon–Thu trading day, and always on the day after Thanksgiving
+    early = [
+        ("Day After Thanksgiving", nth_weekday(year, 11, THU, 4) + timedelta(days=1))
+    ]
+    for name, eve in (
+        ("Independence Day Eve", date(year, 7, 3)),
+        ("Christmas Eve", date(year, 12, 24)),
+    ):
+        if eve.weekday() <= THU:
+            early.append((name, eve))
+    rows += [HolidayRow(name, day, year, EARLY_CLOSE) for name, day in early]
+
+    rows.sort(key=lambda r: r.date)
+    return rows
+
+
+def generate_holidays(start_year: int, end_year: int) -> List[HolidayRow]:
+    """Closures for start_year..end_year inclusive."""
+    if start_year < RULES_SINCE:
+        raise ValueError(f"Holiday rules start in {RULES_SINCE}")
+    if end_year < start_year or end_year - start_year >= MAX_YEARS:
+        raise ValueError(f"Year range must be 1–{MAX_YEARS} years")
+    rows: List[HolidayRow] = []
+    for year in range(start_year, end_year + 1):
+        rows += year_holidays(year)
+    return rows
+
+
+# ✅ Feed generated rows straight into a calendar cache (no database)
+def load_calendar(
+    rows: Iterable[HolidayRow], calendar: MarketCalendar = market_calendar
+):
+    return calendar.load({"id": None, **r._asdict()} for r in rows)
+
+
+# ✅ Bulk write — binary COPY into a stage table, then one merge keyed on date
+STAGE_DDL = """
+    CREATE TEMP TABLE IF NOT EXISTS market_holidays_stage (
+        name TEXT,
+        date DATE,
+        year INTEGER,
+        close_time TIME
+    ) ON COMMIT DELETE ROWS
+"""
+
+# Sub-statements share one snapshot, so the INSERT still sees the pre-merge
+# table and skips dates the UPDATE handled (no unique constraint needed)
+MERGE_SQL = """
+    WITH updated AS (
+        UPDATE market_holidays AS h
+        SET name = s.name, year = s.year, close_time = s.close_time
+        FROM market_holidays_stage AS s
+        WHERE h.date = s.date
+          AND (h.name, h.year, h.close_time)
+              IS DISTINCT FROM (s.name, s.year, s.close_time)
+        RETURNING h.id
+    ), inserted AS (
+        INSERT INTO market_holidays (name, date, year, close_time)
+        SELECT s.name, s.date, s.year, s.close_time
+        FROM market_holidays_stage AS s
+        WHERE NOT EXISTS (SELECT 1 FROM market_holidays h WHERE h.date = s.date)
+        RETURNING id
+    )
+    SELECT (SELECT COUNT(*) FROM inserted) AS inserted,
+           (SELECT COUNT(*) FROM updated) AS updated
+"""
+
+
+async def write_holidays(db, rows: List[HolidayRow]) -> dict:
+    """Upserts generated rows; returns {"inserted": n, "updated": n}."""
+    async with db.transaction():
+        await db.execute("LOCK TABLE market_holidays IN SHARE ROW EXCLUSIVE MODE")
+        await db.execute(STAGE_DDL)
+        await db.copy_records_to_table(
+            "market_holidays_stage", records=rows, columns=HolidayRow._fields
+        )
+        result = await db.fetchrow(MERGE_SQL)
+    return dict(result)
+
+
+# ✅ CLI — preview, or write to DATABASE_URL and report timings
+async def _main(start_year: int, end_year: int, write: bool):
+    started = clock.perf_counter()
+    rows = generate_holidays(start_year, end_year)
+    logger.info(
+        "🗓️ %d closures for %d–%d generated in %.1f ms",
+        len(rows),
+        start_year,
+        end_year,
+        (clock.perf_counter() - started) * 1000,
+    )
+    if not write:
+        for row in rows:
+            close = row.close_time.strftime("%H:%M") if row.close_time else "closed"
+            logger.info("%s  %-7s %s", row.date, close, row.name)
+        return
+
+    import asyncpg  # pylint: disable=import-outside-toplevel
+    from dotenv import load_dotenv  # pylint: disable=import-outside-toplevel
+
+    load_dotenv()
+    dsn = os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("❌ DATABASE_URL is not set.")
+    db = await asyncpg.connect(dsn)
+    try:
+        started = clock.perf_counter()
+        result = await write_holidays(db, rows)
+        logger.info(
+            "✅ market_holidays: %d inserted, %d updated in %.1f ms",
+            result["inserted"],
+            result["updated"],
+            (clock.perf_counter() - started) * 1000,
+        )
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    parser = argparse.ArgumentParser(description="Generate NYSE/Nasdaq holidays")
+    parser.add_argument("start", type=int)
+    parser.add_argument("end", type=int)
+    parser.add_argument("--write", action="store_true", help="upsert into the DB")
+    args = parser.parse_args()
+    asyncio.run(_main(args.start, args.end, args.write))
@@ -4,21 +4,99 @@
 # 🛠️ STATUS: Active (MPA Phase I) — Author: Captain & Chatman
 # ===================================================
 
+import json
 import logging
 import traceback
-from datetime import datetime
-from typing import List
+import zlib
+from collections import OrderedDict
+from datetime import date, time
+from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Path, Request
+from fastapi import APIRouter, HTTPException, Path, Query, Request
+from fastapi.responses import Response
 from pydantic import BaseModel
 
-router = APIRouter()
+from control_console.cache_bus import HOLIDAYS, cache_bus
+from control_console.holiday_rules import generate_holidays, write_holidays
+from control_console.market_calendar import market_calendar
+from control_console.market_sessions import market_today
+from control_console.utils.db import DB
+from control_console.utils.etag import not_modified
+
+router = APIRouter(dependencies=[DB])
 
 # ✅ Configure logger
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
+# ✅ One holiday row as the API returns it (status relative to exchange "today")
+def holiday_item(row, today: date) -> dict:
+    holiday = dict(row)
+    holiday_date = holiday["date"]
+
+    holiday["close_time"] = (
+        holiday["close_time"].strftime("%H:%M") if holiday.get("close_time") else None
+    )
+
+    if holiday_date == today:
+        status = "Closed Today"
+    elif holiday_date > today:
+        status = "Upcoming"
+    else:
+        status = "Passed"
+
+    holiday["status"] = status
+    return holiday
+
+
+# ✅ Pre-serialized range responses: (from, to, today, calendar version) → (etag, body)
+RANGE_CACHE_SIZE = 64
+MAX_RANGE_DAYS = 366 * 100
+_range_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
+def _encode_range(start: date, end: date, today: date):
+    key = (start, end, today, market_calendar.version)
+    cached = _range_cache.get(key)
+    if cached is not None:
+        _range_cache.move_to_end(key)
+        return cached
+
+    items = [holiday_item(r, today) for r in market_calendar.between(start, end)]
+    body = json.dumps(items, default=str, separators=(",", ":")).encode("utf-8")
+    cached = (f'"{zlib.crc32(body):08x}"', body)
+    _range_cache[key] = cached
+    while len(_range_cache) > RANGE_CACHE_SIZE:
+        _range_cache.popitem(last=False)
+    return cached
+
+
+# ✅ GET Holidays in a date range (defaults: this year + next year)
+@router.get("", tags=["holidays"])
+async def get_holidays(
+    request: Request,
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+):
+    today = market_today()
+    start = start or date(today.year, 1, 1)
+    end = end or date(today.year + 1, 12, 31)
+    if end < start:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    if (end - start).days > MAX_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail="Range is limited to 100 years")
+
+    await market_calendar.ensure_fresh(request.app.state.db_pool)
+    etag, body = _encode_range(start, end, today)
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    cached = not_modified(request, etag, headers)
+    if cached is not None:
+        return cached
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # ✅ GET Holidays by Year
 @router.get("/year/{year}", response_model=list, tags=["holidays"])
 async def get_holidays_by_year(
@@ -27,46 +105,21 @@ async def get_holidays_by_year(
 ):
     try:
         logger.info("🔍 Fetching holidays for %s", year)
-        db = request.state.db
-
-        query = """
-            SELECT id, name, date, year, close_time
-            FROM market_holidays
-            WHERE year = $1
-            ORDER BY date;
-        """
-        rows = await db.fetch(query, year)
+        await market_calendar.ensure_fresh(request.app.state.db_pool)
+        rows = market_calendar.year(year)
 
         if not rows:
             logger.warning("⚠ No holidays found for %s", year)
             raise HTTPException(status_code=404, detail=f"No holidays found for {year}")
 
-        today = datetime.utcnow().date()
-        holidays = []
-
-        for row in rows:
-            holiday = dict(row)
-            holiday_date = holiday["date"]
-
-            holiday["close_time"] = (
-                holiday["close_time"].strftime("%H:%M")
-                if holiday.get("close_time")
-                else None
-            )
-
-            if holiday_date == today:
-                status = "Closed Today"
-            elif holiday_date > today:
-                status = "Upcoming"
-            else:
-                status = "Passed"
-
-            holiday["status"] = status
-            holidays.append(holiday)
+        today = market_today()
+        holidays = [holiday_item(row, today) for row in rows]
 
         logger.info("✅ Found %d holidays for %s", len(holidays), year)
         return holidays
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("❌ Database error: %s", e)
         logger.debug(traceback.format_exc())
@@ -74,35 +127,175 @@ async def get_holidays_by_year(
 
 
 # ✅ POST Save Edited Holidays
-class HolidayUpdate(BaseModel):
-    id: int
+class HolidayCreate(BaseModel):
     name: str
-    date: str
-    close_time: str
+    date: date
+    close_time: Optional[time] = None  # None → full-day closure
 
 
-@router.post("/save", tags=["holidays"])
-async def save_holidays(request: Request, holidays: List[HolidayUpdate]):
-    try:
-        db = request.state.db
-        async with db.transaction():
-            for h in holidays:
-                await db.execute(
-                    """
-                    UPDATE market_holidays
-                    SET name = $1, date = $2, close_time = $3
-                    WHERE id = $4
-                    """,
-                    h.name,
-                    h.date,
-                    h.close_time,
-                    h.id,
+class HolidayUpdate(HolidayCreate):
+    id: int
+
+
+class HolidayChangeSet(BaseModel):
+    create: List[HolidayCreate] = []
+    update: List[HolidayUpdate] = []
+    delete: List[int] = []
+
+
+# ✅ One statement per operation type — round-trips stay constant for any batch size
+DELETE_HOLIDAYS_SQL = """
+    DELETE FROM market_holidays
+    WHERE id = ANY($1::int[])
+    RETURNING id
+"""
+
+UPDATE_HOLIDAYS_SQL = """
+    UPDATE market_holidays AS h
+    SET name = u.name, date = u.date, close_time = u.close_time,
+        year = EXTRACT(YEAR FROM u.date)::int
+    FROM unnest($1::int[], $2::text[], $3::date[], $4::time[])
+        AS u(id, name, date, close_time)
+    WHERE h.id = u.id
+    RETURNING h.id, h.name, h.date, h.year, h.close_time
+"""
+
+INSERT_HOLIDAYS_SQL = """
+    INSERT INTO market_holidays (name, date, year, close_time)
+    SELECT u.name, u.date, EXTRACT(YEAR FROM u.date)::int, u.close_time
+    FROM unnest($1::text[], $2::date[], $3::time[]) AS u(name, date, close_time)
+    RETURNING id, name, date, year, close_time
+"""
+
+
+def _missing(requested, found) -> List[int]:
+    return sorted(set(requested) - set(found))
+
+
+async def apply_holiday_changes(db, changes: HolidayChangeSet) -> dict:
+    """Delete → update → create in one transaction; unknown ids roll it all back."""
+    update_ids = [h.id for h in changes.update]
+    if len(set(update_ids)) != len(update_ids):
+        raise HTTPException(status_code=400, detail="Duplicate ids in 'update'")
+    if set(update_ids) & set(changes.delete):
+        raise HTTPException(
+            status_code=400, detail="An id cannot be both updated and deleted"
+        )
+
+    deleted, updated, created = [], [], []
+    async with db.transaction():
+        if changes.delete:
+            rows = await db.fetch(DELETE_HOLIDAYS_SQL, changes.delete)
+            deleted = [r["id"] for r in rows]
+            missing = _missing(changes.delete, deleted)
+            if missing:
+                raise HTTPException(
+                    status_code=404, detail=f"Unknown holiday ids: {missing}"
                 )
 
-        logger.info("✅ %d holidays updated successfully", len(holidays))
-        return {"message": f"{len(holidays)} holidays updated successfully."}
+        if changes.update:
+            updated = await db.fetch(
+                UPDATE_HOLIDAYS_SQL,
+                update_ids,
+                [h.name for h in changes.update],
+                [h.date for h in changes.update],
+                [h.close_time for h in changes.update],
+            )
+            missing = _missing(update_ids, [r["id"] for r in updated])
+            if missing:
+                raise HTTPException(
+                    status_code=404, detail=f"Unknown holiday ids: {missing}"
+                )
+
+        if changes.create:
+            created = await db.fetch(
+                INSERT_HOLIDAYS_SQL,
+                [h.name for h in changes.create],
+                [h.date for h in changes.create],
+                [h.close_time for h in changes.create],
+            )
+
+    return {"created": created, "updated": updated, "deleted": sorted(deleted)}
 
+
+# ✅ Write-through: reload the calendar only once the change is committed,
+#    then tell the other workers to do the same. The change is saved either
+#    way — a failure here is logged and left to the next read, never a 500.
+async def _refresh_calendar(db):
+    try:
+        await market_calendar.reload(db)
+    except Exception as e:
+        logger.error("❌ Calendar reload after save failed: %s", e)
+        logger.debug(traceback.format_exc())
+        market_calendar.invalidate()
+    await cache_bus.publish_committed(db, HOLIDAYS)
+
+
+async def _save(request: Request, changes: HolidayChangeSet) -> dict:
+    db = request.state.db
+    try:
+        result = await apply_holiday_changes(db, changes)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("❌ Save error: %s", e)
         logger.debug(traceback.format_exc())
         raise HTTPException(status_code=500, detail="Failed to save holidays.")
+
+    await _refresh_calendar(db)
+
+    today = market_today()
+    logger.info(
+        "✅ Holidays saved: %d created, %d updated, %d deleted",
+        len(result["created"]),
+        len(result["updated"]),
+        len(result["deleted"]),
+    )
+    return {
+        "created": [holiday_item(r, today) for r in result["created"]],
+        "updated": [holiday_item(r, today) for r in result["updated"]],
+        "deleted": result["deleted"],
+    }
+
+
+@router.post("/save", tags=["holidays"])
+async def save_holidays(request: Request, holidays: List[HolidayUpdate]):
+    await _save(request, HolidayChangeSet(update=holidays))
+    return {"message": f"{len(holidays)} holidays updated successfully."}
+
+
+# ✅ POST Bulk change-set (create / update / delete) — returns the resulting rows
+@router.post("/changes", tags=["holidays"])
+async def apply_changes(request: Request, changes: HolidayChangeSet):
+    return await _save(request, changes)
+
+
+# ✅ POST Generate holidays from exchange rules (upsert by date, then reload)
+@router.post("/generate", tags=["holidays"])
+async def generate(
+    request: Request,
+    start_year: int = Query(..., alias="from"),
+    end_year: int = Query(..., alias="to"),
+):
+    try:
+        rows = generate_holidays(start_year, end_year)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    db = request.state.db
+    try:
+        result = await write_holidays(db, rows)
+    except Exception as e:
+        logger.error("❌ Generate error: %s", e)
+        logger.debug(traceback.format_exc())
+        raise HTTPException(status_code=500, detail="Failed to generate holidays.")
+
+    await _refresh_calendar(db)
+    logger.info(
+        "✅ Holidays %d–%d generated: %d inserted, %d updated",
+        start_year,
+        end_year,
+        result["inserted"],
+        result["updated"],
+    )
+    return {"generated": len(rows), **result}
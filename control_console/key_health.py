@@ -0,0 +1,229 @@
+# ==========================================================
+# ✅ FILE: control_console/key_health.py
+# 📌 PURPOSE: Per-key circuit breakers + latency/error stats for upstream API keys
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+from control_console.config import (
+    KEY_BREAKER_BASE_BACKOFF,
+    KEY_BREAKER_MAX_BACKOFF,
+    KEY_BREAKER_THRESHOLD,
+    KEY_HEALTH_FLUSH_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+EWMA_ALPHA = 0.2
+
+
+# ✅ Breaker for one key — all state lives in memory
+class KeyBreaker:
+    __slots__ = (
+        "key_id",
+        "state",
+        "failures",
+        "backoff",
+        "open_until",
+        "probe_started",
+        "calls",
+        "errors",
+        "latency_ms",
+        "error_rate",
+        "last_error",
+    )
+
+    def __init__(self, key_id: int):
+        self.key_id = key_id
+        self.state = CLOSED
+        self.failures = 0
+        self.backoff = 0.0
+        self.open_until = 0.0
+        self.probe_started = None
+        self.calls = 0
+        self.errors = 0
+        self.latency_ms = None
+        self.error_rate = 0.0
+        self.last_error = None
+
+    def observe(self, latency: Optional[float], failed: bool):
+        self.calls += 1
+        self.errors += int(failed)
+        self.error_rate += EWMA_ALPHA * (float(failed) - self.error_rate)
+        if latency is not None:
+            ms = latency * 1000
+            self.latency_ms = (
+                ms
+                if self.latency_ms is None
+                else self.latency_ms + EWMA_ALPHA * (ms - self.latency_ms)
+            )
+
+    def as_dict(self, now: float) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "retry_in_seconds": (
+                round(max(0.0, self.open_until - now), 1) if self.state == OPEN else 0
+            ),
+            "calls": self.calls,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate, 3),
+            "latency_ms": round(self.latency_ms, 1) if self.latency_ms else None,
+            "last_error": self.last_error,
+        }
+
+
+# ✅ Registry — scheduler asks allow(); callers report outcomes
+class KeyHealth:
+    def __init__(
+        self,
+        threshold: int = KEY_BREAKER_THRESHOLD,
+        base_backoff: float = KEY_BREAKER_BASE_BACKOFF,
+        max_backoff: float = KEY_BREAKER_MAX_BACKOFF,
+        flush_interval: float = KEY_HEALTH_FLUSH_INTERVAL,
+    ):
+        self.threshold = threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.flush_interval = flush_interval
+        self._breakers: Dict[int, KeyBreaker] = {}
+        self._dirty: Dict[int, Optional[str]] = {}
+        self._db_pool = None
+        self._flush_task = None
+
+    def breaker(self, key_id: int) -> KeyBreaker:
+        breaker = self._breakers.get(key_id)
+        if breaker is None:
+            breaker = self._breakers[key_id] = KeyBreaker(key_id)
+        return breaker
+
+    # ✅ Gate — closed passes, open waits out its backoff, half-open allows one probe
+    def allow(self, key_id: int, now: Optional[float] = None) -> bool:
+        breaker = self._breakers.get(key_id)
+        if breaker is None or breaker.state == CLOSED:
+            return True
+
+        now = time.monotonic() if now is None else now
+        if breaker.state == OPEN:
+            if now < breaker.open_until:
+                return False
+            self._transition(breaker, HALF_OPEN)
+
+        # Half-open: one probe at a time (a lost probe expires after one backoff)
+        if breaker.probe_started is not None and (
+            now - breaker.probe_started < max(breaker.backoff, self.base_backoff)
+        ):
+            return False
+        breaker.probe_started = now
+        return True
+
+    def retry_in(self, key_id: int, now: float) -> float:
+        """Seconds until allow() could pass again for this key."""
+        breaker = self._breakers.get(key_id)
+        if breaker is None or breaker.state == CLOSED:
+            return 0.0
+        if breaker.state == OPEN:
+            return max(0.0, breaker.open_until - now)
+        window = max(breaker.backoff, self.base_backoff)
+        return max(0.0, (breaker.probe_started or now) + window - now)
+
+    def record_success(self, key_id: int, latency: Optional[float] = None):
+        breaker = self.breaker(key_id)
+        breaker.observe(latency, failed=False)
+        breaker.failures = 0
+        breaker.probe_started = None
+        if breaker.state != CLOSED:
+            breaker.backoff = 0.0
+            self._transition(breaker, CLOSED)
+            logger.info("✅ API key %s recovered", key_id)
+
+    def record_failure(
+        self, key_id: int, error: str = "Failed", latency: Optional[float] = None
+    ):
+        breaker = self.breaker(key_id)
+        breaker.observe(latency, failed=True)
+        breaker.failures += 1
+        breaker.last_error = error
+        breaker.probe_started = None
+
+        if breaker.state == HALF_OPEN or breaker.failures >= self.threshold:
+            # Exponential backoff between probes, capped
+            breaker.backoff = min(
+                self.max_backoff, max(self.base_backoff, breaker.backoff * 2)
+            )
+            breaker.open_until = time.monotonic() + breaker.backoff
+            if breaker.state != OPEN:
+                self._transition(breaker, OPEN)
+            logger.warning(
+                "⚡ API key %s circuit open for %.0fs (%s)",
+                key_id,
+                breaker.backoff,
+                error,
+            )
+
+    def _transition(self, breaker: KeyBreaker, state: str):
+        breaker.state = state
+        if state == CLOSED:
+            self._dirty[breaker.key_id] = None
+        else:
+            self._dirty[breaker.key_id] = f"Circuit {state}: {breaker.last_error}"[:255]
+
+    def stats(self, key_id: int) -> dict:
+        return self.breaker(key_id).as_dict(time.monotonic())
+
+    # ✅ Async flush of state changes — never on the request hot path
+    def start(self, db_pool):
+        self._db_pool = db_pool
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(
+                self._run_flusher(), name="key-health-flush"
+            )
+
+    async def stop(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def _run_flusher(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.error("❌ Key health flush failed: %s", e)
+
+    async def flush(self):
+        if not self._dirty or self._db_pool is None:
+            return
+        pending, self._dirty = self._dirty, {}
+        try:
+            async with self._db_pool.acquire() as db:
+                await db.executemany(
+                    """
+                    UPDATE api_keys_table
+                    SET error_code = $2, last_used = NOW()
+                    WHERE id = $1
+                    """,
+                    list(pending.items()),
+                )
+        except Exception:
+            for key_id, error_code in pending.items():
+                self._dirty.setdefault(key_id, error_code)  # Retry next round
+            raise
+
+
+# ✅ Shared instance
+key_health = KeyHealth()
@@ -0,0 +1,238 @@
+# ==========================================================
+# ✅ FILE: control_console/key_scheduler.py
+# 📌 PURPOSE: Enforce api_keys_table usage limits and route calls by priority
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+import asyncio
+import logging
+import math
+import time
+from typing import List, Optional
+
+from control_console.cache_bus import API_KEYS, cache_bus
+from control_console.config import KEY_BUDGET_SHARE, KEY_REFRESH_INTERVAL
+from control_console.key_health import KeyHealth, key_health
+
+logger = logging.getLogger(__name__)
+
+# ✅ api_keys_table column → window length in seconds
+USAGE_WINDOWS = (
+    ("usage_limit_sec", 1),
+    ("usage_limit_min", 60),
+    ("usage_limit_5min", 300),
+    ("usage_limit_10min", 600),
+    ("usage_limit_15min", 900),
+    ("usage_limit_hour", 3600),
+    ("usage_limit_day", 86400),
+)
+
+
+# ✅ O(1) sliding window: two fixed buckets, previous one weighted by overlap
+class SlidingWindowCounter:
+    __slots__ = ("window", "limit", "bucket_start", "current", "previous")
+
+    def __init__(self, window: float, limit: float):
+        self.window = window
+        self.limit = limit
+        self.bucket_start = 0.0
+        self.current = 0
+        self.previous = 0
+
+    def _roll(self, now: float):
+        elapsed_buckets = int((now - self.bucket_start) // self.window)
+        if elapsed_buckets >= 1:
+            self.previous = self.current if elapsed_buckets == 1 else 0
+            self.current = 0
+            self.bucket_start += elapsed_buckets * self.window
+
+    def estimate(self, now: float) -> float:
+        self._roll(now)
+        overlap = 1 - (now - self.bucket_start) / self.window
+        return self.previous * overlap + self.current
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one more call fits in this window (0 if it fits now)."""
+        if self.estimate(now) + 1 <= self.limit:
+            return 0.0
+
+        into_bucket = now - self.bucket_start
+        headroom = self.limit - 1 - self.current
+        if headroom >= 0 and self.previous:
+            # Still inside this bucket: wait for the previous bucket to fade
+            return max(0.0, self.window * (1 - headroom / self.previous) - into_bucket)
+
+        # Current bucket alone is full: wait for it to become "previous" and fade
+        fade = self.window * (1 - (self.limit - 1) / self.current)
+        return (self.window - into_bucket) + max(0.0, fade)
+
+    def record(self, now: float):
+        self._roll(now)
+        self.current += 1
+
+
+# ✅ All seven windows for one key
+class KeyBudget:
+    __slots__ = ("key_id", "api_secret", "priority", "counters", "calls")
+
+    def __init__(self, row, share: float = 1.0):
+        self.key_id = row["id"]
+        self.api_secret = row["api_secret"]
+        self.priority = row["priority_order"] or 0
+        self.calls = 0
+        self.counters = []
+        self.configure(row, share)
+
+    def configure(self, row, share: float):
+        now = time.monotonic()
+        previous = {c.window: c for c in self.counters}
+        self.api_secret = row["api_secret"]
+        self.priority = row["priority_order"] or 0
+        self.counters = []
+        for column, window in USAGE_WINDOWS:
+            limit = row[column]
+            if not limit or limit <= 0:
+                continue  # 0 / NULL → no limit for this window
+            counter = previous.get(window) or SlidingWindowCounter(window, 0)
+            counter.limit = max(1, math.floor(limit * share))
+            if counter.bucket_start == 0.0:
+                counter.bucket_start = now
+            self.counters.append(counter)
+
+    def wait_time(self, now: float) -> float:
+        return max((c.wait_time(now) for c in self.counters), default=0.0)
+
+    def record(self, now: float):
+        self.calls += 1
+        for counter in self.counters:
+            counter.record(now)
+
+
+# ✅ Scheduler — highest-priority healthy key with budget wins, otherwise wait
+class KeyScheduler:
+    def __init__(
+        self,
+        share: float = KEY_BUDGET_SHARE,
+        refresh_interval: float = KEY_REFRESH_INTERVAL,
+        health: KeyHealth = key_health,
+    ):
+        self.share = share
+        self.refresh_interval = refresh_interval
+        self.health = health
+        self._budgets: List[KeyBudget] = []
+        self._loaded_at = None
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def has_keys(self) -> bool:
+        return bool(self._budgets)
+
+    def key_id_for(self, api_secret: str) -> Optional[int]:
+        for budget in self._budgets:
+            if budget.api_secret == api_secret:
+                return budget.key_id
+        return None
+
+    def invalidate(self):
+        """Force a reload from api_keys_table on the next acquire."""
+        self._loaded_at = None
+
+    async def refresh(self, db):
+        rows = await db.fetch(
+            """
+            SELECT id, api_secret, priority_order,
+                   usage_limit_sec, usage_limit_min, usage_limit_5min,
+                   usage_limit_10min, usage_limit_15min, usage_limit_hour,
+                   usage_limit_day
+            FROM api_keys_table
+            WHERE is_active = TRUE
+            ORDER BY priority_order ASC
+            """
+        )
+        existing = {b.key_id: b for b in self._budgets}
+        budgets = []
+        for row in rows:
+            budget = existing.get(row["id"])
+            if budget is None:
+                budget = KeyBudget(row, self.share)
+            else:
+                budget.configure(row, self.share)  # Keep live counters
+            budgets.append(budget)
+
+        budgets.sort(key=lambda b: b.priority)
+        self._budgets = budgets
+        self._loaded_at = time.monotonic()
+        logger.info("🔑 Key scheduler loaded %d active keys", len(budgets))
+
+    async def _ensure_fresh(self, db_pool):
+        stale = self._loaded_at is None or (
+            time.monotonic() - self._loaded_at > self.refresh_interval
+        )
+        if not stale or db_pool is None:
+            return
+        async with self._refresh_lock:
+            if self._loaded_at is None or (
+                time.monotonic() - self._loaded_at > self.refresh_interval
+            ):
+                async with db_pool.acquire() as db:
+                    await self.refresh(db)
+
+    def try_acquire(self, now: Optional[float] = None):
+        """
+        Returns (budget, 0.0) for the best key with budget and a closed (or
+        probing) circuit, or (None, seconds_to_retry) when none is usable.
+        """
+        now = time.monotonic() if now is None else now
+        soonest = math.inf
+        for budget in self._budgets:
+            wait = budget.wait_time(now)
+            if wait <= 0 and self.health.allow(budget.key_id, now):
+                budget.record(now)
+                return budget, 0.0
+            soonest = min(soonest, max(wait, self.health.retry_in(budget.key_id, now)))
+        return None, soonest
+
+    async def acquire(self, db_pool=None, max_wait: float = 0.0) -> Optional[KeyBudget]:
+        """
+        Reserves one upstream call. Waits (spreading callers out) up to
+        `max_wait` seconds for budget; returns None if no key is usable.
+        Report the outcome through `self.health` with the budget's key_id.
+        """
+        await self._ensure_fresh(db_pool)
+        deadline = time.monotonic() + max_wait
+        while True:
+            budget, wait = self.try_acquire()
+            if budget is not None:
+                return budget
+            if wait is math.inf or time.monotonic() + wait > deadline:
+                return None
+            await asyncio.sleep(wait)
+
+    def stats(self) -> list:
+        now = time.monotonic()
+        return [
+            {
+                "id": b.key_id,
+                "priority_order": b.priority,
+                "calls": b.calls,
+                "wait_seconds": round(b.wait_time(now), 3),
+                "health": self.health.stats(b.key_id),
+                "windows": {
+                    int(c.window): {"used": round(c.estimate(now), 2), "limit": c.limit}
+                    for c in b.counters
+                },
+            }
+            for b in self._budgets
+        ]
+
+
+# ✅ Shared instance for outbound upstream calls
+key_scheduler = KeyScheduler()
+
+
+# ✅ Another worker changed api_keys_table — reload on the next acquire
+async def _on_api_keys_changed(_db_pool, _keys):
+    key_scheduler.invalidate()
+
+
+cache_bus.subscribe(API_KEYS, _on_api_keys_changed)
@@ -10,7 +10,9 @@ import logging
 from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
 
-router = APIRouter()
+from control_console.utils.db import DB, DB_READ
+
+router = APIRouter(dependencies=[DB])
 
 # ✅ Configure logging
 logger = logging.getLogger(__name__)
@@ -25,7 +27,7 @@ class LogEntry(BaseModel):
 
 
 # ✅ GET All Logs (Optional Filtering)
-@router.get("/", tags=["logs"])
+@router.get("/", tags=["logs"], dependencies=[DB_READ])
 async def get_logs(
     request: Request,
     admin_id: int = Query(None),
@@ -0,0 +1,134 @@
+# ==========================================================
+# ✅ FILE: control_console/market.py
+# 📌 PURPOSE: Market status (cached to the next transition) + trading-day arithmetic
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+import json
+import math
+import time
+import zlib
+from datetime import date
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
+from pydantic import BaseModel, Field
+
+from control_console.business import get_market_state
+from control_console.market_calendar import market_calendar
+from control_console.market_sessions import MARKET_OPEN, SessionState, market_today
+from control_console.trading_days import iso, trading_days
+from control_console.utils.etag import not_modified
+
+router = APIRouter()
+
+MAX_TRADING_DAYS_BATCH = 100000
+MAX_TRADING_DAYS_RANGE = 366 * 100
+MAX_TRADING_DAYS_SHIFT = 253 * 100  # Trading days in 100 years, rounded up
+
+_encoded = {}  # SessionState → (etag, body); one entry per session interval
+
+
+# ✅ Encode a session once — the body only changes at a transition
+def _encode_state(state: SessionState):
+    cached = _encoded.get(state)
+    if cached is None:
+        body = json.dumps(
+            {
+                "status": state.status,
+                "is_open": state.status == MARKET_OPEN,
+                "session_start": state.starts_at.isoformat(),
+                "next_transition": state.ends_at.isoformat(),
+                "early_close": state.early_close,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        cached = (f'"{zlib.crc32(body):08x}"', body)
+        _encoded.clear()  # Only the current interval is ever asked for
+        _encoded[state] = cached
+    return cached
+
+
+# ✅ GET Market Status
+@router.get("/status", tags=["market"])
+async def market_status(request: Request):
+    await market_calendar.ensure_fresh(request.app.state.db_pool)
+    state = await get_market_state()
+    etag, body = _encode_state(state)
+    # Until the body changes — a closed stretch relabels at midnight before it ends
+    max_age = max(0, math.floor(state.valid_until.timestamp() - time.time()))
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+    cached = not_modified(request, etag, headers)
+    if cached is not None:
+        return cached
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# ✅ GET Trading days in [start, end] (defaults to the current year)
+@router.get("/trading-days", tags=["market"])
+async def trading_days_between(
+    request: Request,
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+):
+    today = market_today()
+    start = start or date(today.year, 1, 1)
+    end = end or date(today.year, 12, 31)
+    if end < start:
+        raise HTTPException(status_code=400, detail="'end' must not be before 'start'")
+    if (end - start).days > MAX_TRADING_DAYS_RANGE:
+        raise HTTPException(status_code=400, detail="Range is limited to 100 years")
+
+    await market_calendar.ensure_fresh(request.app.state.db_pool)
+    days = iso(trading_days.between(start, end))
+    body = json.dumps(
+        {"start": str(start), "end": str(end), "count": len(days), "days": days},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    etag = f'"{zlib.crc32(body):08x}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    cached = not_modified(request, etag, headers)
+    if cached is not None:
+        return cached
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# ✅ POST Batched trading-day arithmetic — one vectorized pass per operation
+class TradingDaysBatch(BaseModel):
+    dates: List[str] = Field(..., max_length=MAX_TRADING_DAYS_BATCH)
+    n: Optional[Union[int, List[int]]] = None  # Shift by n trading days
+    until: Optional[Union[str, List[str]]] = None  # Count trading days [date, until)
+
+
+def _validate_batch(batch: TradingDaysBatch):
+    # Checked here, not left to NumPy — it would broadcast a 1-item list
+    for name in ("n", "until"):
+        value = getattr(batch, name)
+        if isinstance(value, list) and len(value) != len(batch.dates):
+            raise HTTPException(
+                status_code=400,
+                detail=f"'{name}' must be a single value or match 'dates' in length",
+            )
+    shifts = batch.n if isinstance(batch.n, list) else [batch.n or 0]
+    if any(abs(n) > MAX_TRADING_DAYS_SHIFT for n in shifts):
+        raise HTTPException(status_code=400, detail="Range is limited to 100 years")
+
+
+@router.post("/trading-days", tags=["market"])
+async def trading_days_batch(request: Request, batch: TradingDaysBatch):
+    _validate_batch(batch)
+    await market_calendar.ensure_fresh(request.app.state.db_pool)
+    try:
+        result = {"is_trading_day": trading_days.is_trading_day(batch.dates).tolist()}
+        if batch.n is not None:
+            result["shifted"] = iso(trading_days.shift(batch.dates, batch.n))
+        if batch.until is not None:
+            result["count"] = trading_days.count(batch.dates, batch.until).tolist()
+    except ValueError as e:
+        # Unparseable date
+        raise HTTPException(status_code=400, detail=str(e))
+    body = json.dumps(result, separators=(",", ":"))
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,133 @@
+# ==========================================================
+# ✅ FILE: control_console/market_calendar.py
+# 📌 PURPOSE: Process-wide market_holidays cache (holiday / early-close lookups)
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+import asyncio
+import logging
+import time as clock
+from bisect import bisect_left, bisect_right
+from datetime import date, time
+from typing import Dict, List, Optional, Tuple
+
+from control_console.cache_bus import HOLIDAYS, cache_bus
+from control_console.config import MARKET_CALENDAR_TTL
+from control_console.queries import query_registry
+
+logger = logging.getLogger(__name__)
+
+
+# ✅ Immutable view of the table — swapped wholesale on reload
+class CalendarSnapshot:
+    __slots__ = ("rows", "dates", "close_times", "by_year", "version")
+
+    def __init__(self, rows=(), version: int = 0):
+        self.rows: Tuple[dict, ...] = tuple(dict(r) for r in rows)
+        self.dates: List[date] = [r["date"] for r in self.rows]  # Sorted
+        # date → early close time, or None for a full-day closure
+        self.close_times: Dict[date, Optional[time]] = {
+            r["date"]: r["close_time"] for r in self.rows
+        }
+        by_year: Dict[int, list] = {}
+        for row in self.rows:
+            by_year.setdefault(row["year"], []).append(row)
+        self.by_year = {y: tuple(r) for y, r in by_year.items()}
+        self.version = version
+
+
+class MarketCalendar:
+    def __init__(self, ttl: float = MARKET_CALENDAR_TTL):
+        self.ttl = ttl
+        self._snapshot = CalendarSnapshot()
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def snapshot(self) -> CalendarSnapshot:
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    # ✅ Load / reload — one SELECT, then an atomic reference swap
+    async def reload(self, db) -> CalendarSnapshot:
+        async with self._lock:
+            rows = await query_registry.fetch(db, "market_holidays_all")
+            self._snapshot = CalendarSnapshot(rows, self._snapshot.version + 1)
+            self._loaded_at = clock.monotonic()
+        logger.info("📅 Market calendar loaded (%d holidays)", len(rows))
+        return self._snapshot
+
+    def load(self, rows) -> CalendarSnapshot:
+        """Swap in rows from memory (e.g. the rule generator) — no database."""
+        rows = sorted(rows, key=lambda r: r["date"])
+        self._snapshot = CalendarSnapshot(rows, self._snapshot.version + 1)
+        self._loaded_at = clock.monotonic()
+        return self._snapshot
+
+    def invalidate(self):
+        """Next ensure_loaded() reloads; current answers stay valid until then."""
+        self._loaded_at = None
+
+    @property
+    def stale(self) -> bool:
+        return self._loaded_at is None or bool(
+            self.ttl and clock.monotonic() - self._loaded_at > self.ttl
+        )
+
+    async def ensure_loaded(self, db=None) -> CalendarSnapshot:
+        if self.stale and db is not None:
+            return await self.reload(db)
+        return self._snapshot
+
+    async def ensure_fresh(self, db_pool) -> CalendarSnapshot:
+        """Like ensure_loaded(), but only takes a pool connection when stale."""
+        if self.stale and db_pool is not None:
+            async with db_pool.acquire() as db:
+                return await self.ensure_loaded(db)
+        return self._snapshot
+
+    # ✅ Lookups — no I/O
+    def is_holiday(self, day: date) -> bool:
+        """Full-day closure (a row without close_time)."""
+        return day in self._snapshot.close_times and (
+            self._snapshot.close_times[day] is None
+        )
+
+    def early_close(self, day: date) -> Optional[time]:
+        return self._snapshot.close_times.get(day)
+
+    def next_holiday(self, day: date) -> Optional[dict]:
+        """First holiday row on or after `day`."""
+        snapshot = self._snapshot
+        i = bisect_left(snapshot.dates, day)
+        return snapshot.rows[i] if i < len(snapshot.rows) else None
+
+    def between(self, start: date, end: date) -> Tuple[dict, ...]:
+        """Holiday rows with start <= date <= end (bisect, no scan)."""
+        snapshot = self._snapshot
+        lo = bisect_left(snapshot.dates, start)
+        hi = bisect_right(snapshot.dates, end)
+        return snapshot.rows[lo:hi]
+
+    def year(self, year: int) -> Tuple[dict, ...]:
+        return self._snapshot.by_year.get(year, ())
+
+
+# ✅ Shared instance
+market_calendar = MarketCalendar()
+
+
+# ✅ Another worker changed market_holidays — reload now rather than at TTL expiry
+async def _on_holidays_changed(db_pool, _keys):
+    market_calendar.invalidate()
+    await market_calendar.ensure_fresh(db_pool)
+
+
+cache_bus.subscribe(HOLIDAYS, _on_holidays_changed)
@@ -0,0 +1,186 @@
+# ==========================================================
+# ✅ FILE: control_console/market_sessions.py
+# 📌 PURPOSE: Precomputed yearly session timeline (DST + early closes), bisect lookups
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+import time as clock
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from control_console.market_calendar import MarketCalendar, market_calendar
+
+MARKET_TZ = ZoneInfo("America/New_York")
+
+MARKET_OPEN = "Market Open"
+PRE_MARKET = "Pre-Market Trading"
+AFTER_MARKET = "After-Market Trading"
+MARKET_CLOSED = "Market Closed"
+MARKET_CLOSED_DAY = "Market Closed (Holiday or Weekend)"
+CLOSED_STATUSES = frozenset((MARKET_CLOSED, MARKET_CLOSED_DAY))
+
+# ✅ Session start times (exchange wall clock) — each one is a transition
+MARKET_SESSIONS = (
+    (time(4, 0), PRE_MARKET),
+    (time(9, 30), MARKET_OPEN),
+    (time(16, 0), AFTER_MARKET),
+    (time(20, 0), MARKET_CLOSED),
+)
+
+
+class SessionState(NamedTuple):
+    status: str
+    starts_at: datetime
+    ends_at: datetime  # Next transition (aware, America/New_York)
+    early_close: bool
+    valid_until: datetime  # Next label change (<= ends_at) — cache bodies until then
+
+
+def _epoch(day: date, wall: time) -> float:
+    # zoneinfo resolves the wall time with that day's UTC offset (DST-correct)
+    return datetime.combine(day, wall, tzinfo=MARKET_TZ).timestamp()
+
+
+def day_sessions(day: date, calendar: MarketCalendar = market_calendar):
+    """(wall time, status, early_close) boundaries for one exchange day."""
+    if day.weekday() >= 5 or calendar.is_holiday(day):
+        return [(time(0, 0), MARKET_CLOSED_DAY, False)]
+    close = calendar.early_close(day)
+    early = close is not None
+    boundaries = [(time(0, 0), MARKET_CLOSED, early)]
+    for start, status in MARKET_SESSIONS:
+        if status == AFTER_MARKET and early:
+            start = close  # Regular session ends early
+        boundaries.append((start, status, early))
+    return boundaries
+
+
+# ✅ One calendar year as sorted instants → the session that starts there
+class SessionTimeline:
+    __slots__ = ("year", "instants", "statuses", "early", "ends", "end")
+
+    def __init__(self, year: int, calendar: MarketCalendar = market_calendar):
+        self.year = year
+        instants = array("d")
+        statuses: List[str] = []
+        early: List[bool] = []
+
+        day = date(year, 1, 1)
+        while day.year == year:
+            for wall, status, is_early in day_sessions(day, calendar):
+                if statuses and statuses[-1] == status and early[-1] == is_early:
+                    continue  # Same session across midnight — not a transition
+                instants.append(_epoch(day, wall))
+                statuses.append(status)
+                early.append(is_early)
+            day += timedelta(days=1)
+
+        self.instants = instants
+        self.statuses = tuple(statuses)
+        self.early = tuple(early)
+        self.end = _epoch(date(year + 1, 1, 1), time(0, 0))
+
+        # ✅ Next real transition per entry. A closed stretch (Friday night →
+        #    weekend → holiday) changes label and early flag, not state — it ends
+        #    at the next session that trades (self.end if that is next year).
+        ends = array("d", instants)
+        next_open = self.end
+        for i in range(len(instants) - 1, -1, -1):
+            if statuses[i] in CLOSED_STATUSES:
+                ends[i] = next_open
+            else:
+                ends[i] = instants[i + 1] if i + 1 < len(instants) else self.end
+                next_open = instants[i]
+        self.ends = ends
+
+    def __len__(self) -> int:
+        return len(self.instants)
+
+    def index(self, ts: float) -> int:
+        return bisect_right(self.instants, ts) - 1
+
+    def lookup(self, ts: float) -> Tuple[str, float, float, bool]:
+        """(status, starts_at, ends_at, early_close) as epochs, O(log n)."""
+        i = self.index(ts)
+        return self.statuses[i], self.instants[i], self.ends[i], self.early[i]
+
+    def label_end(self, ts: float) -> float:
+        """When the entry covering ts gives way to the next one (label included)."""
+        i = self.index(ts) + 1
+        return self.instants[i] if i < len(self.instants) else self.end
+
+    def first_open(self) -> float:
+        """The year's first trading-session start (self.end if none)."""
+        return self.ends[0] if self.statuses[0] in CLOSED_STATUSES else self.instants[0]
+
+
+# ✅ Timelines per year, rebuilt whenever the holiday calendar reloads
+class MarketTimeline:
+    def __init__(self, calendar: MarketCalendar = market_calendar):
+        self.calendar = calendar
+        self._years: Dict[int, SessionTimeline] = {}
+        self._calendar_version: Optional[int] = None
+        self._last: Optional[Tuple[float, float, SessionState]] = None
+
+    def for_year(self, year: int) -> SessionTimeline:
+        if self._calendar_version != self.calendar.version:
+            self._years = {}
+            self._last = None
+            self._calendar_version = self.calendar.version
+        timeline = self._years.get(year)
+        if timeline is None:
+            timeline = self._years[year] = SessionTimeline(year, self.calendar)
+        return timeline
+
+    def state(self, now: Optional[datetime] = None) -> SessionState:
+        ts = now.timestamp() if now else clock.time()
+        last = self._last
+        if (
+            last is not None
+            and last[0] <= ts < last[1]
+            and self._calendar_version == self.calendar.version
+        ):
+            return last[2]  # Still inside the last resolved session
+
+        year = datetime.fromtimestamp(ts, MARKET_TZ).year
+        timeline = self.for_year(year)
+        status, starts_at, ends_at, early = timeline.lookup(ts)
+        valid_until = min(ends_at, timeline.label_end(ts))
+        if ends_at == timeline.end:
+            # Session runs into next year: its end is next year's first change
+            following = self.for_year(year + 1)
+            if status in CLOSED_STATUSES:
+                ends_at = following.first_open()
+            elif following.statuses[0] == status and len(following) > 1:
+                ends_at = following.instants[1]
+
+        state = SessionState(
+            status,
+            datetime.fromtimestamp(starts_at, MARKET_TZ),
+            datetime.fromtimestamp(ends_at, MARKET_TZ),
+            early,
+            datetime.fromtimestamp(valid_until, MARKET_TZ),
+        )
+        # Re-resolve at the next label change, even inside one closed stretch
+        self._last = (starts_at, valid_until, state)
+        return state
+
+
+# ✅ Exchange-local "today", recomputed only when New York passes midnight
+_today = (date.min, 0.0)  # (date, valid until epoch)
+
+
+def market_today() -> date:
+    global _today  # pylint: disable=global-statement
+    now = clock.time()
+    if now >= _today[1]:
+        today = datetime.fromtimestamp(now, MARKET_TZ).date()
+        _today = (today, _epoch(today + timedelta(days=1), time(0, 0)))
+    return _today[0]
+
+
+# ✅ Shared instance
+market_timeline = MarketTimeline()
@@ -0,0 +1,312 @@
+# ==========================================================
+# ✅ FILE: control_console/migrations.py
+# 📌 PURPOSE: Versioned, idempotent schema migrations (tables + hot-path indexes)
+# 🧪 Usage: python -m control_console.migrations [--status]
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+import argparse
+import asyncio
+import logging
+from typing import List, NamedTuple, Optional, Tuple
+
+import asyncpg
+
+from control_console.database import database_url
+
+logger = logging.getLogger(__name__)
+
+# Any constant works — it only has to be the same for every worker
+MIGRATION_LOCK_ID = 72_010_025
+
+SCHEMA_MIGRATIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+"""
+
+# ✅ Tables — IF NOT EXISTS throughout, so an existing database is adopted as-is
+ADMIN_USERS_DDL = """
+    CREATE TABLE IF NOT EXISTS admin_users (
+        id TEXT PRIMARY KEY DEFAULT gen_random_uuid()::text,
+        first_name TEXT,
+        last_name TEXT,
+        email TEXT,
+        phone_number TEXT,
+        address TEXT,
+        username TEXT NOT NULL,
+        password_hash TEXT NOT NULL,
+        must_reset BOOLEAN NOT NULL DEFAULT FALSE,
+        role TEXT,
+        access_code TEXT,
+        is_2fa_enabled BOOLEAN NOT NULL DEFAULT FALSE,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+"""
+
+ADMIN_PERMISSIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS admin_permissions (
+        id SERIAL PRIMARY KEY,
+        user_id TEXT NOT NULL,  -- No FK: adopts admin_users whatever its id type
+        tab_name TEXT NOT NULL,
+        has_access BOOLEAN NOT NULL DEFAULT TRUE
+    )
+"""
+
+LOGIN_ATTEMPTS_DDL = """
+    CREATE TABLE IF NOT EXISTS login_attempts (
+        id BIGSERIAL PRIMARY KEY,
+        ip_address TEXT NOT NULL,
+        attempt_time TIMESTAMP NOT NULL DEFAULT (NOW() AT TIME ZONE 'utc')
+    )
+"""
+
+SYSTEM_LOGS_DDL = """
+    CREATE TABLE IF NOT EXISTS system_logs (
+        id BIGSERIAL PRIMARY KEY,
+        admin_id INT,  -- logs.LogEntry / business.log_admin_action bind ints
+        action TEXT NOT NULL,
+        details TEXT,
+        timestamp TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+"""
+
+MARKET_HOLIDAYS_DDL = """
+    CREATE TABLE IF NOT EXISTS market_holidays (
+        id SERIAL PRIMARY KEY,
+        name TEXT NOT NULL,
+        date DATE NOT NULL,
+        year INT NOT NULL,
+        close_time TIME
+    )
+"""
+
+API_KEYS_DDL = """
+    CREATE TABLE IF NOT EXISTS api_keys_table (
+        id SERIAL PRIMARY KEY,
+        key_label TEXT,
+        provider TEXT,
+        api_secret TEXT NOT NULL,
+        api_key_identifier TEXT,
+        is_active BOOLEAN NOT NULL DEFAULT TRUE,
+        key_type TEXT,
+        billing_interval TEXT,
+        cost_per_month NUMERIC(10, 2),
+        cost_per_year NUMERIC(10, 2),
+        usage_limit_sec INT,
+        usage_limit_min INT,
+        usage_limit_5min INT,
+        usage_limit_10min INT,
+        usage_limit_15min INT,
+        usage_limit_hour INT,
+        usage_limit_day INT,
+        priority_order INT NOT NULL DEFAULT 0,
+        last_used TIMESTAMPTZ,
+        error_code TEXT
+    )
+"""
+
+SETTINGS_DDL = """
+    CREATE TABLE IF NOT EXISTS global_settings (
+        id SERIAL PRIMARY KEY,
+        setting_key TEXT NOT NULL,
+        setting_value TEXT
+    )
+"""
+
+# ON CONFLICT (setting_key) needs a unique index to target
+SETTINGS_KEY_INDEX = """
+    CREATE UNIQUE INDEX IF NOT EXISTS global_settings_key_uidx
+    ON global_settings (setting_key)
+"""
+
+HALT_EVENTS_DDL = """
+    CREATE TABLE IF NOT EXISTS halt_events (
+        id BIGSERIAL PRIMARY KEY,
+        symbol TEXT NOT NULL,
+        halt_time TIMESTAMPTZ NOT NULL,
+        name TEXT,
+        market TEXT,
+        reason_code TEXT,
+        resume_quote_time TIMESTAMPTZ,
+        resume_trade_time TIMESTAMPTZ,
+        pause_threshold_price TEXT,
+        first_seen TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        last_seen TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        UNIQUE (symbol, halt_time)
+    )
+"""
+
+# ✅ Covering indexes for the halt history API — every predicate + keyset order,
+#    with the returned columns INCLUDEd so pages come from index-only scans
+HALT_EVENTS_INDEXES = (
+    """
+    CREATE INDEX IF NOT EXISTS halt_events_time_idx
+        ON halt_events (halt_time, id)
+        INCLUDE (symbol, market, reason_code, resume_quote_time, resume_trade_time)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS halt_events_symbol_time_idx
+        ON halt_events (symbol, halt_time, id)
+        INCLUDE (market, reason_code, resume_quote_time, resume_trade_time)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS halt_events_reason_time_idx
+        ON halt_events (reason_code, halt_time, id)
+        INCLUDE (symbol, market, resume_quote_time, resume_trade_time)
+    """,
+)
+
+# ✅ Hot-path indexes — one per registered query predicate (control_console/queries.py)
+HOT_PATH_INDEXES = (
+    # rate_limiter: WHERE ip_address = $1 AND attempt_time > $2 ORDER BY attempt_time
+    """
+    CREATE INDEX IF NOT EXISTS login_attempts_ip_time_idx
+        ON login_attempts (ip_address, attempt_time)
+    """,
+    # login: WHERE username = $1 (also keeps usernames unique)
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS admin_users_username_key
+        ON admin_users (username)
+    """,
+    # get_user_access / set_user_permissions / delete_user: WHERE user_id = $1
+    """
+    CREATE INDEX IF NOT EXISTS admin_permissions_user_idx
+        ON admin_permissions (user_id)
+    """,
+    # logs: timestamp range filters and cleanup
+    """
+    CREATE INDEX IF NOT EXISTS system_logs_timestamp_idx
+        ON system_logs (timestamp)
+    """,
+    # by-year lookups and the generator's merge on date
+    """
+    CREATE INDEX IF NOT EXISTS market_holidays_year_date_idx
+        ON market_holidays (year, date)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS market_holidays_date_idx
+        ON market_holidays (date)
+    """,
+    # active key lookup: WHERE is_active ORDER BY priority_order LIMIT 1
+    """
+    CREATE INDEX IF NOT EXISTS api_keys_active_priority_idx
+        ON api_keys_table (priority_order) WHERE is_active
+    """,
+)
+
+
+# ✅ Databases that ran 001 while it still declared admin_id TEXT — every writer
+#    and the admin_id filter bind ints. Non-numeric leftovers become NULL.
+SYSTEM_LOGS_ADMIN_ID_INT = r"""
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = current_schema()
+              AND table_name = 'system_logs'
+              AND column_name = 'admin_id'
+              AND data_type = 'text'
+        ) THEN
+            ALTER TABLE system_logs ALTER COLUMN admin_id TYPE INT
+                USING CASE WHEN admin_id ~ '^\d{1,9}$' THEN admin_id::int END;
+        END IF;
+    END
+    $$
+"""
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    statements: Tuple[str, ...]
+
+
+# ✅ Append only — never edit or renumber an applied migration
+MIGRATIONS: Tuple[Migration, ...] = (
+    Migration(
+        1,
+        "core_tables",
+        (
+            ADMIN_USERS_DDL,
+            ADMIN_PERMISSIONS_DDL,
+            LOGIN_ATTEMPTS_DDL,
+            SYSTEM_LOGS_DDL,
+            MARKET_HOLIDAYS_DDL,
+            API_KEYS_DDL,
+            SETTINGS_DDL,
+            SETTINGS_KEY_INDEX,
+        ),
+    ),
+    Migration(2, "halt_events", (HALT_EVENTS_DDL, *HALT_EVENTS_INDEXES)),
+    Migration(3, "hot_path_indexes", HOT_PATH_INDEXES),
+    Migration(4, "system_logs_admin_id_int", (SYSTEM_LOGS_ADMIN_ID_INT,)),
+)
+
+
+async def applied_versions(db) -> List[int]:
+    await db.execute(SCHEMA_MIGRATIONS_DDL)
+    rows = await db.fetch("SELECT version FROM schema_migrations ORDER BY version")
+    return [r["version"] for r in rows]
+
+
+# ✅ Apply everything pending — each migration in its own transaction, and an
+#    advisory lock so workers starting together don't race each other
+async def migrate(db, migrations=MIGRATIONS) -> List[int]:
+    applied = []
+    await db.execute("SELECT pg_advisory_lock($1)", MIGRATION_LOCK_ID)
+    try:
+        done = set(await applied_versions(db))
+        for migration in sorted(migrations, key=lambda m: m.version):
+            if migration.version in done:
+                continue
+            async with db.transaction():
+                for statement in migration.statements:
+                    await db.execute(statement)
+                await db.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES ($1, $2)",
+                    migration.version,
+                    migration.name,
+                )
+            logger.info(
+                "🧱 Migration %03d_%s applied", migration.version, migration.name
+            )
+            applied.append(migration.version)
+    finally:
+        await db.execute("SELECT pg_advisory_unlock($1)", MIGRATION_LOCK_ID)
+    if not applied:
+        logger.info("🧱 Schema up to date (version %d)", max(done, default=0))
+    return applied
+
+
+# ✅ On a dedicated connection — run before the pool exists, so every pooled
+#    connection's statement warmup (control_console/queries.py) finds its tables
+async def migrate_database(dsn: Optional[str] = None) -> List[int]:
+    db = await asyncpg.connect(dsn or database_url())
+    try:
+        return await migrate(db)
+    finally:
+        await db.close()
+
+
+async def _main(args):
+    if not args.status:
+        await migrate_database()
+        return
+    db = await asyncpg.connect(database_url())
+    try:
+        done = set(await applied_versions(db))
+        for m in MIGRATIONS:
+            mark = "✅" if m.version in done else "⏳"
+            logger.info("%s %03d_%s", mark, m.version, m.name)
+    finally:
+        await db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    parser = argparse.ArgumentParser(description="Apply schema migrations")
+    parser.add_argument("--status", action="store_true", help="list, don't apply")
+    asyncio.run(_main(parser.parse_args()))
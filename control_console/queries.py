@@ -0,0 +1,174 @@
+# ==========================================================
+# ✅ FILE: control_console/queries.py
+# 📌 PURPOSE: Named hot-path statements, prepared once per pooled connection + stats
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+import logging
+import time
+from collections import deque
+from typing import Dict
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+SAMPLES_PER_STATEMENT = 1024
+
+# ✅ The hot statements — handlers call these by name
+QUERIES: Dict[str, str] = {
+    "admin_user_count": "SELECT COUNT(*) FROM admin_users",
+    "admin_access_by_user": """
+        SELECT tab_name FROM admin_permissions WHERE user_id = $1
+    """,
+    "admin_user_by_username": """
+        SELECT id, password_hash, must_reset FROM admin_users WHERE username = $1
+    """,
+    "login_attempts_recent": """
+        SELECT attempt_time FROM login_attempts
+        WHERE ip_address = $1 AND attempt_time > $2
+        ORDER BY attempt_time ASC
+        LIMIT $3
+    """,
+    "login_attempt_insert": """
+        INSERT INTO login_attempts (ip_address, attempt_time) VALUES ($1, $2)
+    """,
+    "market_holidays_all": """
+        SELECT id, name, date, year, close_time
+        FROM market_holidays
+        ORDER BY date
+    """,
+    "global_settings_all": """
+        SELECT id, setting_key, setting_value FROM global_settings ORDER BY setting_key
+    """,
+    "active_api_key": """
+        SELECT api_secret
+        FROM api_keys_table
+        WHERE is_active = TRUE
+        ORDER BY priority_order ASC
+        LIMIT 1
+    """,
+}
+
+# Whole-table reads by design (small tables, loaded once into a cache or
+# counted) — the only registered queries allowed a Seq Scan (test_query_plans.py)
+FULL_TABLE_READS = frozenset(
+    ("admin_user_count", "market_holidays_all", "global_settings_all")
+)
+
+
+# ✅ Pool connection class that can prepare a query into its own statement cache.
+#    PreparedStatement handles die when a connection returns to the pool; asyncpg's
+#    per-connection cache (what fetch()/execute() look up by query text) does not.
+#    Filling it uses asyncpg internals (_get_statement, _stmt_cache_enabled), checked
+#    against the asyncpg pinned in requirements.txt — if a release changes them,
+#    warmup switches itself off (logged once) and queries prepare on first use.
+class RegistryConnection(asyncpg.Connection):
+    __slots__ = ()
+
+    warmup_supported = True
+
+    async def warm_statement(self, query: str) -> bool:
+        cache_enabled = getattr(self, "_stmt_cache_enabled", None)
+        get_statement = getattr(self, "_get_statement", None)
+        if not RegistryConnection.warmup_supported:
+            return False
+        if cache_enabled is None or get_statement is None:
+            return self._disable_warmup("asyncpg internals not found")
+        if not cache_enabled:
+            return False  # statement_cache_size=0 (e.g. behind PgBouncer)
+        try:
+            await get_statement(query, None)
+        except TypeError as e:  # Signature changed
+            return self._disable_warmup(e)
+        return True
+
+    @staticmethod
+    def _disable_warmup(reason) -> bool:
+        RegistryConnection.warmup_supported = False
+        logger.warning(
+            "⚠ Statement warmup disabled (asyncpg %s): %s", asyncpg.__version__, reason
+        )
+        return False
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[rank]
+
+
+class StatementStats:
+    __slots__ = ("calls", "errors", "total", "samples")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=SAMPLES_PER_STATEMENT)
+
+    def observe(self, seconds: float, failed: bool):
+        self.calls += 1
+        self.errors += failed
+        self.total += seconds
+        self.samples.append(seconds)
+
+    def summary(self) -> dict:
+        values = sorted(self.samples)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.total / self.calls * 1000, 3) if self.calls else 0.0,
+            "p50_ms": round(percentile(values, 50) * 1000, 3),
+            "p99_ms": round(percentile(values, 99) * 1000, 3),
+            "max_ms": round(values[-1] * 1000, 3) if values else 0.0,
+        }
+
+
+class QueryRegistry:
+    def __init__(self, queries: Dict[str, str] = QUERIES):
+        self.queries = dict(queries)
+        self.stats: Dict[str, StatementStats] = {n: StatementStats() for n in queries}
+
+    # ✅ Pool init hook — runs once per new connection (Parse + plan happen here)
+    async def init_connection(self, connection):
+        if not isinstance(connection, RegistryConnection):
+            return
+        for name, query in self.queries.items():
+            try:
+                if not await connection.warm_statement(query):
+                    return
+            except asyncpg.PostgresError as e:
+                # e.g. table not migrated yet — prepared on first call instead
+                logger.warning("⚠ Could not prepare %s: %s", name, e)
+
+    async def _run(self, db, name: str, method: str, args):
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await getattr(db, method)(self.queries[name], *args)
+            failed = False
+            return result
+        finally:
+            self.stats[name].observe(time.perf_counter() - started, failed)
+
+    # ✅ Call by name
+    async def fetch(self, db, name: str, *args):
+        return await self._run(db, name, "fetch", args)
+
+    async def fetchrow(self, db, name: str, *args):
+        return await self._run(db, name, "fetchrow", args)
+
+    async def fetchval(self, db, name: str, *args):
+        return await self._run(db, name, "fetchval", args)
+
+    async def execute(self, db, name: str, *args) -> str:
+        return await self._run(db, name, "execute", args)
+
+    def summary(self) -> Dict[str, dict]:
+        return {name: stats.summary() for name, stats in self.stats.items()}
+
+
+# ✅ Shared instance
+query_registry = QueryRegistry()
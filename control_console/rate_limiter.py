@@ -8,6 +8,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import Tuple
 
+from control_console.queries import query_registry
+
 # ✅ Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -25,14 +27,10 @@ async def is_rate_limited(db, ip_address: str) -> Tuple[bool, int]:
     """
     cutoff_time = datetime.utcnow() - timedelta(minutes=WINDOW_MINUTES)
 
-    query = """
-        SELECT attempt_time FROM login_attempts
-        WHERE ip_address = $1 AND attempt_time > $2
-        ORDER BY attempt_time ASC
-        LIMIT $3
-    """
     try:
-        rows = await db.fetch(query, ip_address, cutoff_time, MAX_ATTEMPTS)
+        rows = await query_registry.fetch(
+            db, "login_attempts_recent", ip_address, cutoff_time, MAX_ATTEMPTS
+        )
 
         if len(rows) >= MAX_ATTEMPTS:
             oldest_attempt = rows[0]["attempt_time"]
@@ -56,11 +54,9 @@ async def record_attempt(db, ip_address: str):
     """
     Records a failed login attempt for the given IP address.
     """
-    query = """
-        INSERT INTO login_attempts (ip_address, attempt_time)
-        VALUES ($1, $2)
-    """
     try:
-        await db.execute(query, ip_address, datetime.utcnow())
+        await query_registry.execute(
+            db, "login_attempt_insert", ip_address, datetime.utcnow()
+        )
     except Exception as e:
         logger.error("❌ Error recording login attempt for IP %s: %s", ip_address, e)
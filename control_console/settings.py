@@ -1,25 +1,157 @@
 # ===================================================
 # ✅ FILE: settings.py
 # 🧠 Author: Captain & Chatman
-# 🛠️ Purpose: Manage global system settings from the database
+# 🛠️ Purpose: Global system settings — in-memory snapshot, upserted via asyncpg
 # ===================================================
 
+import asyncio
 import logging
+from types import MappingProxyType
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
+import asyncpg
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
-from sqlalchemy import text, create_engine
-from sqlalchemy.orm import sessionmaker
 
-from control_console.database import engine  # ✅ Confirm engine is properly defined
+from control_console.cache_bus import SETTINGS, cache_bus
+from control_console.migrations import SETTINGS_DDL, SETTINGS_KEY_INDEX
+from control_console.queries import query_registry
+from control_console.utils.db import DB
 
-router = APIRouter()
+router = APIRouter()  # Mounted at prefix="/api/settings"
+logger = logging.getLogger(__name__)
 
-# ✅ Setup Logging
-logging.basicConfig(level=logging.INFO)
+UPSERT_SETTING_SQL = """
+    INSERT INTO global_settings (setting_key, setting_value)
+    VALUES ($1, $2)
+    ON CONFLICT (setting_key) DO UPDATE SET setting_value = EXCLUDED.setting_value
+    RETURNING id, setting_key, setting_value
+"""
 
-# ✅ SQLAlchemy Session
-Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+DELETE_SETTING_SQL = "DELETE FROM global_settings WHERE setting_key = $1 RETURNING id"
+
+SELECT_SETTINGS_SQL = """
+    SELECT id, setting_key, setting_value FROM global_settings
+    WHERE setting_key = ANY($1::text[])
+"""
+
+TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+
+
+# ✅ Table + upsert index (also migration 001 — for scripts that skip migrate())
+async def ensure_settings_table(db):
+    await db.execute(SETTINGS_DDL)
+    await db.execute(SETTINGS_KEY_INDEX)
+
+
+# ✅ Immutable view of the table — swapped wholesale on every change
+class SettingsSnapshot:
+    __slots__ = ("rows", "values", "version")
+
+    def __init__(self, rows=(), version: int = 0):
+        rows = sorted((dict(r) for r in rows), key=lambda r: r["setting_key"])
+        self.rows = MappingProxyType({r["setting_key"]: r for r in rows})
+        self.values = MappingProxyType(
+            {key: row["setting_value"] for key, row in self.rows.items()}
+        )
+        self.version = version
+
+
+class SettingsService:
+    def __init__(self):
+        self._snapshot = SettingsSnapshot()
+        self._lock = asyncio.Lock()  # Orders reloads and writes in this process
+
+    @property
+    def snapshot(self) -> SettingsSnapshot:
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    # ✅ Load / reload — one SELECT, then an atomic reference swap
+    async def reload(self, db) -> SettingsSnapshot:
+        async with self._lock:
+            rows = await query_registry.fetch(db, "global_settings_all")
+            self._snapshot = SettingsSnapshot(rows, self._snapshot.version + 1)
+        logger.info("⚙️ Settings loaded (%d keys)", len(rows))
+        return self._snapshot
+
+    async def refresh(self, db, keys=()) -> SettingsSnapshot:
+        """Re-read just `keys` (missing → removed); no keys = full reload."""
+        if not keys:
+            return await self.reload(db)
+        async with self._lock:
+            found = await db.fetch(SELECT_SETTINGS_SQL, list(keys))
+            rows = dict(self._snapshot.rows)
+            for key in keys:
+                rows.pop(key, None)
+            rows.update((r["setting_key"], r) for r in found)
+            self._snapshot = SettingsSnapshot(rows.values(), self._snapshot.version + 1)
+        return self._snapshot
+
+    # ✅ Writes — one upsert / delete, swap a copy with the row changed, then
+    #    tell the other workers
+    async def upsert(self, db, key: str, value: Optional[str]) -> dict:
+        async with self._lock:
+            row = dict(await db.fetchrow(UPSERT_SETTING_SQL, key, value))
+            rows = dict(self._snapshot.rows)
+            rows[key] = row
+            self._snapshot = SettingsSnapshot(rows.values(), self._snapshot.version + 1)
+            await cache_bus.publish_committed(db, SETTINGS, [key])
+        return row
+
+    async def delete(self, db, key: str) -> bool:
+        async with self._lock:
+            if await db.fetchval(DELETE_SETTING_SQL, key) is None:
+                return False
+            rows = dict(self._snapshot.rows)
+            rows.pop(key, None)
+            self._snapshot = SettingsSnapshot(rows.values(), self._snapshot.version + 1)
+            await cache_bus.publish_committed(db, SETTINGS, [key])
+        return True
+
+    # ✅ Lookups — no I/O
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self._snapshot.values.get(key, default)
+
+    def get_int(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        try:
+            return int(self._snapshot.values[key])
+        except (KeyError, TypeError, ValueError):
+            return default
+
+    def get_float(self, key: str, default: Optional[float] = None) -> Optional[float]:
+        try:
+            return float(self._snapshot.values[key])
+        except (KeyError, TypeError, ValueError):
+            return default
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        value = self._snapshot.values.get(key)
+        if value is None:
+            return default
+        return value.strip().lower() in TRUE_VALUES
+
+    def row(self, key: str) -> Optional[dict]:
+        return self._snapshot.rows.get(key)
+
+    def all(self) -> Tuple[dict, ...]:
+        return tuple(self._snapshot.rows.values())
+
+
+# ✅ Shared instance
+settings_service = SettingsService()
+
+
+# ✅ Another worker wrote settings — re-read only the keys it touched
+async def _on_settings_changed(db_pool, keys):
+    async with db_pool.acquire() as db:
+        await settings_service.refresh(db, keys)
+
+
+cache_bus.subscribe(SETTINGS, _on_settings_changed)
 
 
 # ✅ Setting Schema
@@ -28,112 +160,55 @@ class Setting(BaseModel):
     setting_value: str
 
 
-# ✅ GET All Settings
+# ✅ GET All Settings (from memory)
 @router.get("/", tags=["settings"])
-def get_all_settings():
-    session = Session()
-    try:
-        result = session.execute(
-            text(
-                "SELECT id, setting_key, setting_value FROM global_settings ORDER BY setting_key"
-            )
-        )
-        settings = [dict(row) for row in result.mappings()]
-        if not settings:
-            raise HTTPException(status_code=404, detail="No settings found")
-        return settings
-    except Exception as e:
-        logging.error(f"❌ Error fetching settings: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        session.close()
-
-
-# ✅ GET a Specific Setting
+async def get_all_settings():
+    settings = settings_service.all()
+    if not settings:
+        raise HTTPException(status_code=404, detail="No settings found")
+    return settings
+
+
+# ✅ GET a Specific Setting (from memory)
 @router.get("/{setting_key}", tags=["settings"])
-def get_setting(setting_key: str):
-    session = Session()
-    try:
-        result = session.execute(
-            text(
-                "SELECT id, setting_key, setting_value FROM global_settings WHERE setting_key = :setting_key"
-            ),
-            {"setting_key": setting_key},
+async def get_setting(setting_key: str):
+    setting = settings_service.row(setting_key)
+    if setting is None:
+        raise HTTPException(
+            status_code=404, detail=f"Setting '{setting_key}' not found"
         )
-        setting = result.mappings().first()
-        if not setting:
-            raise HTTPException(
-                status_code=404, detail=f"Setting '{setting_key}' not found"
-            )
-        return setting
-    except Exception as e:
-        logging.error(f"❌ Error fetching setting '{setting_key}': {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        session.close()
+    return setting
 
 
 # ✅ ADD or UPDATE a Setting
-@router.post("/", tags=["settings"])
-def add_or_update_setting(setting: Setting):
-    session = Session()
+@router.post("/", tags=["settings"], dependencies=[DB])
+async def add_or_update_setting(setting: Setting, request: Request):
     try:
-        result = session.execute(
-            text("SELECT id FROM global_settings WHERE setting_key = :setting_key"),
-            {"setting_key": setting.setting_key},
+        await settings_service.upsert(
+            request.state.db, setting.setting_key, setting.setting_value
+        )
+    except asyncpg.PostgresError as e:
+        logger.error(
+            "❌ Error adding/updating setting '%s': %s", setting.setting_key, e
         )
-        existing = result.fetchone()
-
-        if existing:
-            session.execute(
-                text(
-                    "UPDATE global_settings SET setting_value = :setting_value WHERE setting_key = :setting_key"
-                ),
-                {
-                    "setting_key": setting.setting_key,
-                    "setting_value": setting.setting_value,
-                },
-            )
-        else:
-            session.execute(
-                text(
-                    "INSERT INTO global_settings (setting_key, setting_value) VALUES (:setting_key, :setting_value)"
-                ),
-                {
-                    "setting_key": setting.setting_key,
-                    "setting_value": setting.setting_value,
-                },
-            )
-
-        session.commit()
-        logging.info(f"➕ Setting '{setting.setting_key}' updated/added successfully")
-        return {"message": f"Setting '{setting.setting_key}' updated successfully"}
-    except Exception as e:
-        logging.error(f"❌ Error adding/updating setting '{setting.setting_key}': {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        session.close()
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+    logger.info("➕ Setting '%s' updated/added successfully", setting.setting_key)
+    return {"message": f"Setting '{setting.setting_key}' updated successfully"}
 
 
 # ✅ DELETE a Setting
-@router.delete("/{setting_key}", tags=["settings"])
-def delete_setting(setting_key: str):
-    session = Session()
+@router.delete("/{setting_key}", tags=["settings"], dependencies=[DB])
+async def delete_setting(setting_key: str, request: Request):
     try:
-        result = session.execute(
-            text("DELETE FROM global_settings WHERE setting_key = :setting_key"),
-            {"setting_key": setting_key},
+        deleted = await settings_service.delete(request.state.db, setting_key)
+    except asyncpg.PostgresError as e:
+        logger.error("❌ Error deleting setting '%s': %s", setting_key, e)
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+    if not deleted:
+        raise HTTPException(
+            status_code=404, detail=f"Setting '{setting_key}' not found"
         )
-        session.commit()
-        if result.rowcount == 0:
-            raise HTTPException(
-                status_code=404, detail=f"Setting '{setting_key}' not found"
-            )
-
-        logging.info(f"🗑️ Setting '{setting_key}' deleted successfully")
-        return {"message": f"Setting '{setting_key}' deleted successfully"}
-    except Exception as e:
-        logging.error(f"❌ Error deleting setting '{setting_key}': {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-    finally:
-        session.close()
+    logger.info("🗑️ Setting '%s' deleted successfully", setting_key)
+    return {"message": f"Setting '{setting_key}' deleted successfully"}
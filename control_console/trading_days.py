@@ -0,0 +1,93 @@
+# ==========================================================
+# ✅ FILE: control_console/trading_days.py
+# 📌 PURPOSE: Vectorized trading-day arithmetic on a NumPy business-day calendar
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+from typing import Optional
+
+import numpy as np
+
+from control_console.market_calendar import MarketCalendar, market_calendar
+
+WEEKMASK = "1111100"  # Mon–Fri
+
+
+def as_days(values) -> np.ndarray:
+    """ISO strings / dates → datetime64[D] (ValueError on a bad date)."""
+    days = np.asarray(values, dtype="datetime64[D]")
+    if np.isnat(days).any():  # "" and "NaT" parse without complaint
+        raise ValueError("Dates must be YYYY-MM-DD")
+    return days
+
+
+# ✅ Pre-formatted ISO strings — formatting, not the arithmetic, dominates big batches
+ISO_FIRST = np.datetime64("1998-01-01", "D")
+ISO_LAST = np.datetime64("2199-12-31", "D")
+_iso_table: Optional[np.ndarray] = None
+
+
+def iso(days: np.ndarray) -> list:
+    """datetime64[D] → ISO strings (table lookup inside 1998–2199)."""
+    global _iso_table  # pylint: disable=global-statement
+    days = np.asarray(days, dtype="datetime64[D]")
+    if not days.size or days.min() < ISO_FIRST or days.max() > ISO_LAST:
+        return np.datetime_as_string(days, unit="D").tolist()
+    if _iso_table is None:
+        span = np.arange(ISO_FIRST, ISO_LAST + 1, dtype="datetime64[D]")
+        _iso_table = np.array(np.datetime_as_string(span).tolist(), dtype=object)
+    return _iso_table[(days - ISO_FIRST).astype(np.int64)].tolist()
+
+
+# ✅ busdaycalendar built from full-day closures; rebuilt when the holidays reload
+class TradingDays:
+    def __init__(self, calendar: MarketCalendar = market_calendar):
+        self.calendar = calendar
+        self._busdays: Optional[np.busdaycalendar] = None
+        self._version: Optional[int] = None
+
+    @property
+    def busdays(self) -> np.busdaycalendar:
+        if self._version != self.calendar.version:
+            snapshot = self.calendar.snapshot
+            closed = [d for d, close in snapshot.close_times.items() if close is None]
+            self._busdays = np.busdaycalendar(
+                weekmask=WEEKMASK, holidays=as_days(closed)
+            )
+            self._version = snapshot.version
+        return self._busdays
+
+    def is_trading_day(self, days) -> np.ndarray:
+        return np.is_busday(as_days(days), busdaycal=self.busdays)
+
+    def shift(self, days, n=1) -> np.ndarray:
+        """
+        The n-th trading day after each date (n < 0: before). Non-trading dates
+        count from where they fall: 1 after Saturday is Monday, -1 is Friday.
+        n = 0 → the date itself if it trades, else the next trading day.
+        """
+        days, n = np.broadcast_arrays(as_days(days), np.asarray(n, dtype=np.int64))
+        out = np.empty(days.shape, dtype="datetime64[D]")
+        forward = n > 0
+        # Roll back before stepping forward (and vice versa) so a weekend or
+        # holiday start never counts as a step of its own
+        out[forward] = np.busday_offset(
+            days[forward], n[forward], roll="backward", busdaycal=self.busdays
+        )
+        out[~forward] = np.busday_offset(
+            days[~forward], n[~forward], roll="forward", busdaycal=self.busdays
+        )
+        return out
+
+    def count(self, start, end) -> np.ndarray:
+        """Trading days in [start, end) — negative when end is before start."""
+        return np.busday_count(as_days(start), as_days(end), busdaycal=self.busdays)
+
+    def between(self, start, end) -> np.ndarray:
+        """Every trading day in [start, end] inclusive."""
+        days = np.arange(as_days(start), as_days(end) + 1, dtype="datetime64[D]")
+        return days[np.is_busday(days, busdaycal=self.busdays)]
+
+
+# ✅ Shared instance
+trading_days = TradingDays()
@@ -3,13 +3,70 @@
 # 🧠 Database logic for admin users and permissions
 # ===================================================
 
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from asyncpg import Connection
 from passlib.hash import bcrypt
 
+from control_console.cache_bus import PERMISSIONS, cache_bus
+from control_console.config import PERMISSIONS_CACHE_MAX_USERS, PERMISSIONS_CACHE_TTL
+from control_console.queries import query_registry
+
+
+# ✅ user_id → tab names; filled from the primary on read, dropped by writes here
+#    and on other workers, expired after PERMISSIONS_CACHE_TTL as a backstop
+class AccessCache:
+    def __init__(
+        self,
+        ttl: float = PERMISSIONS_CACHE_TTL,
+        max_users: int = PERMISSIONS_CACHE_MAX_USERS,
+    ):
+        self.ttl = ttl
+        self.max_users = max_users
+        self._entries: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+        # Bumped on every invalidation — a read that overlapped one must not fill
+        self._generation: Dict[str, int] = {}
+        self._epoch = 0  # Bumped when everything is dropped
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._entries
+
+    def get(self, user_id: str) -> Optional[Tuple[str, ...]]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def token(self, user_id: str) -> Tuple[int, int]:
+        """Take before the read; store() only accepts an unchanged token."""
+        return self._epoch, self._generation.get(user_id, 0)
+
+    def store(self, user_id: str, token: Tuple[int, int], access: Tuple[str, ...]):
+        if self.ttl <= 0 or token != self.token(user_id):
+            return
+        self._entries.pop(user_id, None)
+        if len(self._entries) >= self.max_users:
+            del self._entries[next(iter(self._entries))]  # Oldest fill
+        self._entries[user_id] = (time.monotonic() + self.ttl, access)
+
+    def invalidate(self, user_ids=()):
+        if not user_ids:
+            self._epoch += 1
+            self._entries.clear()
+            self._generation.clear()
+        for user_id in user_ids:
+            self._generation[user_id] = self._generation.get(user_id, 0) + 1
+            self._entries.pop(user_id, None)
+
+
+access_cache = AccessCache()
+
 
 # ✅ Fetch all users
 async def fetch_all_users(db: Connection):
@@ -112,14 +169,25 @@ async def update_user(db: Connection, user_id: str, data: dict):
 async def delete_user(db: Connection, user_id: str):
     await db.execute("DELETE FROM admin_permissions WHERE user_id = $1", user_id)
     await db.execute("DELETE FROM admin_users WHERE id = $1", user_id)
+    access_cache.invalidate([str(user_id)])
+    await cache_bus.publish_committed(db, PERMISSIONS, [user_id])
 
 
 # ✅ Permissions helpers
 async def get_user_access(db: Connection, user_id: str) -> List[str]:
-    rows = await db.fetch(
-        "SELECT tab_name FROM admin_permissions WHERE user_id = $1", user_id
-    )
-    return [r["tab_name"] for r in rows]
+    key = str(user_id)
+    access = access_cache.get(key)
+    if access is not None:
+        return list(access)
+
+    token = access_cache.token(key)
+    rows = await query_registry.fetch(db, "admin_access_by_user", user_id)
+    access = tuple(r["tab_name"] for r in rows)
+    # A lagging replica (or an overlapping write — store() checks) would cache a
+    # stale list
+    if not getattr(db, "replica", False):
+        access_cache.store(key, token, access)
+    return list(access)
 
 
 async def set_user_permissions(db: Connection, user_id: str, tabs: List[str]):
@@ -130,3 +198,13 @@ async def set_user_permissions(db: Connection, user_id: str, tabs: List[str]):
             user_id,
             tab,
         )
+    access_cache.invalidate([str(user_id)])
+    await cache_bus.publish_committed(db, PERMISSIONS, [user_id])
+
+
+# ✅ Another worker changed admin_permissions — drop just those users
+async def _on_permissions_changed(_db_pool, keys):
+    access_cache.invalidate(keys)
+
+
+cache_bus.subscribe(PERMISSIONS, _on_permissions_changed)
@@ -17,12 +17,13 @@ from control_console.user_management import (
     fetch_user_by_id,
     update_user,
 )
+from control_console.utils.db import DB, DB_READ
 
-router = APIRouter()  # Mounted at prefix="/api/users"
+router = APIRouter(dependencies=[DB])  # Mounted at prefix="/api/users"
 
 
 # 🧱 GET all admin users
-@router.get("/")
+@router.get("/", dependencies=[DB_READ])
 async def get_all(request: Request):
     db: Connection = request.state.db
     return await fetch_all_users(db)
@@ -35,7 +36,7 @@ async def get_tabs():
 
 
 # 🧱 GET single user by ID
-@router.get("/{user_id}")
+@router.get("/{user_id}", dependencies=[DB_READ])
 async def get_by_id(user_id: str, request: Request):
     db: Connection = request.state.db
     user = await fetch_user_by_id(db, user_id)
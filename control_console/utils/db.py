@@ -0,0 +1,124 @@
+# ==========================================================
+# ✅ FILE: control_console/utils/db.py
+# 📌 PURPOSE: Per-route, lazily acquired DB connection (request.state.db)
+#             + read-replica routing for read-only routes
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+import inspect
+import time
+from typing import Optional
+
+from asyncpg import Connection
+from fastapi import Depends, Request
+
+from control_console.config import DB_READ_YOUR_WRITES_WINDOW
+
+SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+PRIMARY_UNTIL = "db_primary_until"  # session key: read from the primary until then
+
+
+# ✅ Stands in for a pool connection until the handler first runs a query
+class LazyConnection:
+    def __init__(self, pool):
+        self._pool = pool
+        self._connection: Optional[Connection] = None
+        self.used = False
+        self.replica = False  # Reads may lag the primary
+
+    @property
+    def acquired(self) -> bool:
+        return self._connection is not None
+
+    async def connection(self) -> Connection:
+        if self._connection is None:
+            if self._pool is None:
+                raise RuntimeError("Database pool is not available.")
+            self._connection = await self._pool.acquire()
+            self.used = True
+        return self._connection
+
+    async def release(self):
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            await self._pool.release(connection)
+
+    def route_to(self, pool):
+        """Point at the read replica pool — only before the first query."""
+        if self._connection is None and pool is not None:
+            self._pool = pool
+            self.replica = True
+
+    def transaction(self, **kwargs):
+        return _LazyTransaction(self, kwargs)
+
+    def __getattr__(self, name):
+        if self._connection is not None:
+            return getattr(self._connection, name)
+
+        method = getattr(Connection, name)
+        if not inspect.iscoroutinefunction(method):
+            raise AttributeError(f"{name} needs an acquired connection")
+
+        async def call(*args, **kwargs):
+            connection = await self.connection()
+            return await getattr(connection, name)(*args, **kwargs)
+
+        return call
+
+
+class _LazyTransaction:
+    def __init__(self, lazy: LazyConnection, kwargs: dict):
+        self._lazy = lazy
+        self._kwargs = kwargs
+        self._transaction = None
+
+    async def __aenter__(self):
+        connection = await self._lazy.connection()
+        self._transaction = connection.transaction(**self._kwargs)
+        return await self._transaction.__aenter__()
+
+    async def __aexit__(self, *exc_info):
+        return await self._transaction.__aexit__(*exc_info)
+
+
+# ✅ Read-your-writes: a session that just wrote skips the replica for a while
+def _pinned_to_primary(request: Request) -> bool:
+    if "session" not in request.scope:
+        return False
+    return request.session.get(PRIMARY_UNTIL, 0) > time.time()
+
+
+def _pin_to_primary(request: Request):
+    if "session" in request.scope:
+        request.session[PRIMARY_UNTIL] = time.time() + DB_READ_YOUR_WRITES_WINDOW
+
+
+# ✅ Dependency — yield-dependency teardown runs before the response is sent,
+#    so the slot goes back to the pool (and the session is stamped) before any
+#    streaming starts
+async def db_connection(request: Request):
+    lazy = LazyConnection(getattr(request.app.state, "db_pool", None))
+    request.state.db = lazy
+    try:
+        yield lazy
+    finally:
+        await lazy.release()
+        replica = getattr(request.app.state, "db_read_pool", None) is not None
+        if replica and lazy.used and request.method not in SAFE_METHODS:
+            _pin_to_primary(request)
+
+
+# ✅ Read-only route marker — same request.state.db, served by the replica pool
+#    when one is configured and this session has not written recently
+async def db_read_connection(
+    request: Request, lazy: LazyConnection = Depends(db_connection)
+):
+    if not _pinned_to_primary(request):
+        lazy.route_to(getattr(request.app.state, "db_read_pool", None))
+    return lazy
+
+
+# ✅ For APIRouter(dependencies=...) / route dependencies
+DB = Depends(db_connection)
+DB_READ = Depends(db_read_connection)
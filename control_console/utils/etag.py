@@ -0,0 +1,31 @@
+# ==========================================================
+# ✅ FILE: control_console/utils/etag.py
+# 📌 PURPOSE: Small helpers for ETag / If-None-Match handling
+# 🛠️ STATUS: Active — Author: Captain & Chatman
+# ==========================================================
+
+from typing import Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+# ✅ Does the client's If-None-Match header cover this ETag?
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    bare = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        if candidate.strip().removeprefix("W/") == bare:
+            return True
+    return False
+
+
+# ✅ Return a bodyless 304 when the request already holds this ETag
+def not_modified(request: Request, etag: str, headers: Optional[dict] = None):
+    if not etag_matches(request.headers.get("if-none-match"), etag):
+        return None
+    return Response(status_code=304, headers={"ETag": etag, **(headers or {})})
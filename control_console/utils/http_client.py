@@ -0,0 +1,131 @@
+# ==========================================================
+# ✅ FILE: control_console/utils/http_client.py
+# 📌 PURPOSE: One app-wide async HTTP client for upstream calls (+ single-flight)
+# 🛠️ STATUS: Active (MPA Phase II) — Author: Captain & Chatman
+# ==========================================================
+
+import asyncio
+import logging
+import os
+from typing import Dict, Optional
+
+import httpx
+
+from control_console.config import (
+    UPSTREAM_CONNECT_TIMEOUT,
+    UPSTREAM_KEEPALIVE_EXPIRY,
+    UPSTREAM_MAX_CONNECTIONS,
+    UPSTREAM_MAX_KEEPALIVE,
+    UPSTREAM_READ_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def upstream_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=UPSTREAM_MAX_CONNECTIONS,
+        max_keepalive_connections=UPSTREAM_MAX_KEEPALIVE,
+        keepalive_expiry=UPSTREAM_KEEPALIVE_EXPIRY,
+    )
+
+
+# ✅ Same rule as the diagnostics kit: proxy only when both variables are set.
+#    Mounted transports ignore AsyncClient(limits=...) — pass them in here too.
+def proxy_mounts(limits: httpx.Limits) -> Optional[dict]:
+    http_proxy = os.getenv("HTTP_PROXY")
+    https_proxy = os.getenv("HTTPS_PROXY")
+    if not (http_proxy and https_proxy):
+        return None
+    return {
+        "http://": httpx.AsyncHTTPTransport(proxy=http_proxy, limits=limits),
+        "https://": httpx.AsyncHTTPTransport(proxy=https_proxy, limits=limits),
+    }
+
+
+def build_http_client() -> httpx.AsyncClient:
+    limits = upstream_limits()
+    return httpx.AsyncClient(
+        limits=limits,
+        timeout=httpx.Timeout(
+            UPSTREAM_READ_TIMEOUT,
+            connect=UPSTREAM_CONNECT_TIMEOUT,
+            pool=UPSTREAM_CONNECT_TIMEOUT,
+        ),
+        mounts=proxy_mounts(limits),
+        trust_env=False,  # Proxies come from proxy_mounts() only
+        headers={"User-Agent": "IonaBrand-Backend/1.1"},
+    )
+
+
+# ✅ Single-flight — concurrent identical calls share one in-flight request
+class SingleFlight:
+    def __init__(self):
+        self._calls: Dict[tuple, asyncio.Task] = {}
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: tuple, factory):
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._calls[key] = task
+            task.add_done_callback(lambda _t: self._calls.pop(key, None))
+        else:
+            self.coalesced += 1
+        # shield: one caller being cancelled must not cancel everybody's call
+        return await asyncio.shield(task)
+
+
+# ✅ Application-wide client (created / closed in main.lifespan)
+class UpstreamHTTP:
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._flight = SingleFlight()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = build_http_client()
+        return self._client
+
+    async def start(self):
+        _ = self.client
+        logger.info("🌐 Upstream HTTP client ready")
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        headers = headers or {}
+        key = (
+            "GET",
+            url,
+            tuple(sorted((params or {}).items())),
+            tuple(sorted(headers.items())),
+        )
+        kwargs = {"headers": headers, "params": params}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return await self._flight.do(key, lambda: self.client.get(url, **kwargs))
+
+    def stats(self) -> dict:
+        return {
+            "coalesced": self._flight.coalesced,
+            "in_flight": self._flight.in_flight,
+        }
+
+
+# ✅ Shared instance
+upstream_http = UpstreamHTTP()
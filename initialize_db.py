@@ -1,22 +1,28 @@
-# import sqlite3
-#
-# # Initialize Secure Database
-# def init_secure_db():
-#     connection = sqlite3.connect("IonaBrandsecure.db")
-#     cursor = connection.cursor()
-#
-#     # Create a placeholder table for API keys
-#     cursor.execute("""
-#     CREATE TABLE IF NOT EXISTS api_keys (
-#         id INTEGER PRIMARY KEY,
-#         name TEXT NOT NULL,
-#         key TEXT NOT NULL,
-#         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-#     )
-#     """)
-#
-#     connection.commit()
-#     connection.close()
-#
-# if __name__ == "__main__":
-#     init_secure_db()
+# ============================================================
+# ✅ initialize_db.py
+# 📍 Bootstrap / upgrade the PostgreSQL schema (all tables + hot-path indexes)
+# 🧪 Usage: DATABASE_URL=postgresql://... python initialize_db.py
+# 🔍 Same runner main.lifespan calls on startup — safe to re-run
+# Author: Captain & Chatman
+# Version: MPA Phase II — Schema Migrations
+# ============================================================
+
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from control_console.migrations import migrate_database  # noqa: E402 (reads env)
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+async def init_db():
+    applied = await migrate_database()
+    logging.info("✅ Applied %d migration(s): %s", len(applied), applied or "none")
+
+
+if __name__ == "__main__":
+    asyncio.run(init_db())
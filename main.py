@@ -8,9 +8,9 @@
 
 import logging
 import os
+from contextlib import asynccontextmanager
 
 import uvicorn
-import asyncpg
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -28,12 +28,27 @@ from control_console.api_keys import router as api_keys_router
 from control_console.api_keys_page import router as api_keys_page_router
 from control_console.auth_login_register import router as login_register_router
 from control_console.auth_password_reset import router as password_reset_router
-from control_console.config import SESSION_SECRET
+from control_console.cache_bus import cache_bus
+from control_console.config import (
+    CACHE_BUS_URL,
+    HALT_HISTORY_ENABLED,
+    HALT_POLLER_ENABLED,
+    SESSION_SECRET,
+)
+from control_console.database import create_db_pool, create_read_pool, database_url
 from control_console.dev_reset import router as dev_reset_router
 from control_console.holidays import router as holidays_router
+from control_console.key_health import key_health
+from control_console.market import router as market_router
+from control_console.market_calendar import market_calendar
 from control_console.market_holidays_page import router as market_holidays_page_router
+from control_console.migrations import migrate_database
+from control_console.queries import query_registry
+from control_console.settings import router as settings_router, settings_service
 from control_console.user_management_page import router as user_management_page_router
 from control_console.user_management_routes import router as admin_users_router
+from control_console.utils.db import DB
+from control_console.utils.http_client import upstream_http
 from control_console.stores_thinkscripts_page import (
     router as stores_thinkscripts_page_router,
 )
@@ -41,9 +56,60 @@ from control_console.stores_thinkscripts_page import (
 # 📦 Stores Routers
 from api.stores import thinkscripts
 
+# 📦 Halts Routers + Ingestion
+from api.halts import haltdetails
+from api.halts.halt_history import HaltHistoryWriter
+from api.halts.halt_poller import HaltPoller
+from api.halts.halt_stream import halt_broadcaster
+
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
 
+
+# ✅ Lifespan (startup → yield → shutdown)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Tables + hot-path indexes first (control_console/migrations.py), so the
+    # pool's per-connection statement warmup finds them
+    await migrate_database()
+    app.state.db_pool = await create_db_pool()
+    app.state.db_read_pool = await create_read_pool()
+    await upstream_http.start()
+    # Listen before the caches load so no invalidation falls in between
+    await cache_bus.start(app.state.db_pool, CACHE_BUS_URL or database_url())
+
+    async with app.state.db_pool.acquire() as db:
+        await market_calendar.reload(db)
+        await settings_service.reload(db)
+
+    halt_broadcaster.start()
+    key_health.start(app.state.db_pool)
+
+    app.state.halt_history = None
+    if HALT_HISTORY_ENABLED:
+        app.state.halt_history = HaltHistoryWriter(app.state.db_pool)
+        app.state.halt_history.start()
+
+    app.state.halt_poller = None
+    if HALT_POLLER_ENABLED:
+        app.state.halt_poller = HaltPoller(app.state.db_pool)
+        app.state.halt_poller.start()
+
+    yield
+
+    if app.state.halt_poller is not None:
+        await app.state.halt_poller.stop()
+    if app.state.halt_history is not None:
+        await app.state.halt_history.stop()
+    await halt_broadcaster.stop()
+    await key_health.stop()
+    await cache_bus.stop()
+    await upstream_http.aclose()
+    if app.state.db_read_pool is not None:
+        await app.state.db_read_pool.close()
+    await app.state.db_pool.close()
+
+
 # ✅ Create FastAPI App
 app = FastAPI(
     title="IonaBrand API",
@@ -51,6 +117,7 @@ app = FastAPI(
     version="1.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
     middleware=[
         Middleware(SessionMiddleware, secret_key=SESSION_SECRET),
         Middleware(
@@ -82,36 +149,11 @@ env = Environment(
 templates = Jinja2Templates(env=env)
 
 
-# ✅ Startup Events
-@app.on_event("startup")
-async def startup():
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise ValueError("DATABASE_URL not set in environment variables.")
-
-    app.state.db_pool = await asyncpg.create_pool(dsn=database_url)
-
-
-# ✅ Middleware
-@app.middleware("http")
-async def db_middleware(request: Request, call_next):
-    if getattr(app.state, "db_pool", None) is None:
-        response = await call_next(request)
-        return response
-
-    async with app.state.db_pool.acquire() as connection:
-        request.state.db = connection
-        response = await call_next(request)
-        return response
-
-
 # ✅ Routes
-@app.get("/")
+@app.get("/", dependencies=[DB])
 async def admin_ui(request: Request):
     try:
-        user_count = await request.state.db.fetchval(
-            "SELECT COUNT(*) FROM admin_users;"
-        )
+        user_count = await query_registry.fetchval(request.state.db, "admin_user_count")
         user_count = user_count if user_count is not None else 0
     except Exception:  # nosec pylint: disable=broad-exception-caught
         logging.error("🚨 Database error in admin_ui route")
@@ -133,23 +175,15 @@ async def root_head():
     return Response(status_code=200)
 
 
-@app.head("/api/haltdetails")
-async def head_halted_stocks():
-    return Response(status_code=200)
-
-
-@app.get("/api/haltdetails")
-async def get_halted_stocks():
-    return []
-
-
 # ✅ Admin Console Routers
 app.include_router(password_reset_router, prefix="/auth")
 app.include_router(login_register_router, prefix="/auth")
 app.include_router(holidays_router, prefix="/api/holidays")
+app.include_router(market_router, prefix="/api/market")
 app.include_router(admin_router, prefix="/api/admin")
 app.include_router(api_keys_router, prefix="/api/api-keys")
 app.include_router(admin_users_router, prefix="/api/users")
+app.include_router(settings_router, prefix="/api/settings")
 app.include_router(dev_reset_router)
 
 app.include_router(market_holidays_page_router)
@@ -160,6 +194,14 @@ app.include_router(stores_thinkscripts_page_router)
 # ✅ Stores Routers
 app.include_router(thinkscripts.router)
 
+# ✅ Halts Routers
+app.include_router(haltdetails.router)
+
 # ✅ Server Start
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", "8000")))
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        timeout_graceful_shutdown=5,  # Open SSE streams never finish on their own
+    )
@@ -15,7 +15,12 @@
   async function loadMarketHolidays() {
     console.log("📥 loadMarketHolidays() called");
     try {
-      const response = await fetch("/api/holidays/year/2025");
+      // This year + next year in one cached request (no hard-coded year)
+      const year = new Date().getFullYear();
+      const response = await fetch(
+        `/api/holidays?from=${year}-01-01&to=${year + 1}-12-31`
+      );
+      if (!response.ok) throw new Error("Holidays fetch failed");
       const holidays = await response.json();
       console.log("✅ Holidays fetched:", holidays);
 
@@ -3,7 +3,7 @@
 // 📍 LOCATION: static/frontend/core/main.js
 // 🎯 PURPOSE: Global frontend logic for Admin Panel — market status + ticker
 // ✍️ AUTHOR: Captain & Chatman
-// 🔖 VERSION: MPA Core v1.2 — Debug Logs for Market Status
+// 🔖 VERSION: MPA Core v1.3 — Market Status from /api/market/status
 // ============================================================================
 
 document.addEventListener("DOMContentLoaded", function () {
@@ -13,64 +13,58 @@ document.addEventListener("DOMContentLoaded", function () {
   loadHolidayTicker(); // ✅ Ticker now loads globally
 });
 
-// ✅ Market status display logic
-function updateMarketStatus() {
-  console.log("🧠 updateMarketStatus() called");
+// ✅ Market status display logic — server knows holidays, early closes and DST;
+//    the response is cacheable until the next transition, so re-check then
+const MARKET_STATUS_CLASSES = {
+  "Market Open": "market-open",
+  "Pre-Market Trading": "market-prepost",
+  "After-Market Trading": "market-prepost",
+};
 
-  const now = new Date();
-  const hours = now.getHours();
-  const minutes = now.getMinutes();
-  const dayOfWeek = now.getDay();
+async function updateMarketStatus() {
   const statusElement = document.getElementById("market-status-text");
-
-  console.log("📍 Found status element:", statusElement);
-
   if (!statusElement) {
     console.warn("❌ #market-status-text not found!");
     return;
   }
 
-  let status = "";
-  let statusClass = "";
-
-  if (dayOfWeek === 0 || dayOfWeek === 6) {
-    status = "Market Closed (Weekend)";
-    statusClass = "market-closed";
-  } else if (hours < 9 || (hours === 9 && minutes < 30)) {
-    status = "Pre-Market Trading";
-    statusClass = "market-prepost";
-  } else if (hours < 16) {
-    status = "Market Open";
-    statusClass = "market-open";
-  } else {
-    status = "After-Market Trading";
-    statusClass = "market-prepost";
+  let retryMs = 60000;
+  try {
+    const res = await fetch("/api/market/status");
+    if (!res.ok) throw new Error("Market status fetch failed");
+    const market = await res.json();
+
+    statusElement.classList.remove(
+      "market-open",
+      "market-closed",
+      "market-prepost"
+    );
+    statusElement.classList.add(
+      "market-status-text",
+      MARKET_STATUS_CLASSES[market.status] || "market-closed"
+    );
+    statusElement.innerText = market.early_close
+      ? `${market.status} (Early Close)`
+      : market.status;
+
+    retryMs = Math.max(1000, new Date(market.next_transition) - new Date() + 1000);
+    console.log("✅ Market Status Set:", market.status);
+  } catch (err) {
+    console.error("Market status failed:", err);
   }
-
-  statusElement.classList.remove(
-    "market-open",
-    "market-closed",
-    "market-prepost"
-  );
-  statusElement.classList.add("market-status-text", statusClass);
-  statusElement.innerText = status;
-
-  console.log("✅ Market Status Set:", status);
+  setTimeout(updateMarketStatus, retryMs);
 }
 
 // ✅ Holiday Ticker (now GLOBAL 🎉)
 async function loadHolidayTicker() {
   try {
-    const res = await fetch("/api/holidays/year/2025");
+    // Default range (this year + next) — one shared, cached response
+    const res = await fetch("/api/holidays");
     if (!res.ok) throw new Error("Holiday ticker fetch failed");
 
     const data = await res.json();
-    const now = new Date();
 
-    const upcoming = data
-      .filter((h) => new Date(h.date) >= now)
-      .sort((a, b) => new Date(a.date) - new Date(b.date))
-      .slice(0, 10);
+    const upcoming = data.filter((h) => h.status !== "Passed").slice(0, 10);
 
     const formatted = upcoming
       .map((h) => {
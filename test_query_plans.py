@@ -0,0 +1,156 @@
+# ============================================================
+# ✅ test_query_plans.py
+# 📍 Verifies every registered hot query (control_console/queries.py) is served
+#    by an index: EXPLAIN on seeded data must show no Seq Scan
+# 🧪 Usage: DATABASE_URL=postgresql://... python test_query_plans.py
+# 🔍 Migrates + seeds a throwaway schema (plans_check), dropped afterwards;
+#    exits 1 on any sequential scan outside queries.FULL_TABLE_READS
+# Author: Captain & Chatman
+# Version: MPA Phase II — Schema Migrations
+# ============================================================
+
+import asyncio
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+
+import asyncpg
+from dotenv import load_dotenv
+
+from control_console.holiday_rules import generate_holidays, write_holidays
+from control_console.migrations import migrate
+from control_console.queries import FULL_TABLE_READS, QUERIES
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logging.getLogger("control_console").setLevel(logging.WARNING)
+
+CHECK_SCHEMA = "plans_check"
+
+USERS = 20000
+IPS = 5000
+NOW = datetime.utcnow()
+
+# ✅ Realistic arguments for each registered query — add one per new query
+SAMPLE_ARGS = {
+    "admin_user_count": (),
+    "admin_access_by_user": ("user-4242",),
+    "admin_user_by_username": ("user4242",),
+    "login_attempts_recent": ("10.0.42.42", NOW - timedelta(minutes=30), 6),
+    "login_attempt_insert": ("10.0.42.42", NOW),
+    "market_holidays_all": (),
+    "global_settings_all": (),
+    "active_api_key": (),
+}
+
+
+async def seed(db):
+    await db.copy_records_to_table(
+        "admin_users",
+        records=[
+            (f"user-{i}", f"user{i}", "x" * 60, "First", f"Last{i}")
+            for i in range(USERS)
+        ],
+        columns=("id", "username", "password_hash", "first_name", "last_name"),
+    )
+    await db.copy_records_to_table(
+        "admin_permissions",
+        records=[
+            (f"user-{i}", tab)
+            for i in range(USERS)
+            for tab in ("Market Holidays", "API Keys", "User Management")
+        ],
+        columns=("user_id", "tab_name"),
+    )
+    await db.copy_records_to_table(
+        "login_attempts",
+        records=[
+            (f"10.0.{i % IPS // 100}.{i % 100}", NOW - timedelta(seconds=i * 7))
+            for i in range(USERS * 10)
+        ],
+        columns=("ip_address", "attempt_time"),
+    )
+    await db.copy_records_to_table(
+        "system_logs",
+        records=[
+            (i % USERS, "login", "", NOW - timedelta(minutes=i))
+            for i in range(USERS * 5)
+        ],
+        columns=("admin_id", "action", "details", "timestamp"),
+    )
+    await db.copy_records_to_table(
+        "api_keys_table",
+        records=[(f"secret{i}", i % 100 == 0, i) for i in range(2000)],
+        columns=("api_secret", "is_active", "priority_order"),
+    )
+    await db.copy_records_to_table(
+        "global_settings",
+        records=[(f"setting_{i}", str(i)) for i in range(200)],
+        columns=("setting_key", "setting_value"),
+    )
+    await write_holidays(db, generate_holidays(1998, 2199))
+    await db.execute("ANALYZE")
+
+
+def plan_nodes(node):
+    yield node
+    for child in node.get("Plans", ()):
+        yield from plan_nodes(child)
+
+
+async def check(db) -> bool:
+    ok = True
+    for name, query in QUERIES.items():
+        if name not in SAMPLE_ARGS:
+            logging.error("❌ %-24s no SAMPLE_ARGS entry — add one", name)
+            ok = False
+            continue
+        plan = json.loads(
+            await db.fetchval(f"EXPLAIN (FORMAT JSON) {query}", *SAMPLE_ARGS[name])
+        )[0]["Plan"]
+        nodes = list(plan_nodes(plan))
+        seq_scans = sorted(
+            {n["Relation Name"] for n in nodes if n["Node Type"] == "Seq Scan"}
+        )
+        access = ", ".join(
+            f"{n['Node Type']} ({n.get('Index Name') or n.get('Relation Name')})"
+            for n in nodes
+            if "Relation Name" in n or "Index Name" in n
+        )
+        if seq_scans and name not in FULL_TABLE_READS:
+            logging.error("❌ %-24s Seq Scan on %s", name, ", ".join(seq_scans))
+            ok = False
+        elif seq_scans:
+            logging.info("➖ %-24s %s (whole-table read)", name, access)
+        else:
+            logging.info("✅ %-24s %s", name, access or plan["Node Type"])
+    return ok
+
+
+async def main() -> bool:
+    dsn = os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("❌ DATABASE_URL is not set.")
+    admin = await asyncpg.connect(dsn)
+    await admin.execute(f"DROP SCHEMA IF EXISTS {CHECK_SCHEMA} CASCADE")
+    await admin.execute(f"CREATE SCHEMA {CHECK_SCHEMA}")
+    db = await asyncpg.connect(dsn, server_settings={"search_path": CHECK_SCHEMA})
+    try:
+        applied = await migrate(db)
+        again = await migrate(db)
+        logging.info("🧱 Migrations applied: %s, re-run applied: %s", applied, again)
+        if again:
+            logging.error("❌ Migrations are not idempotent")
+            return False
+        await seed(db)
+        return await check(db)
+    finally:
+        await db.close()
+        await admin.execute(f"DROP SCHEMA IF EXISTS {CHECK_SCHEMA} CASCADE")
+        await admin.close()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
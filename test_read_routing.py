@@ -0,0 +1,141 @@
+# ============================================================
+# ✅ test_read_routing.py
+# 📍 Verifies read-replica routing (control_console/utils/db.py) end to end:
+#    DB_READ GETs use the read pool, a session that just wrote reads from the
+#    primary for DB_READ_YOUR_WRITES_WINDOW, and route_to() is a no-op once a
+#    connection is held
+# 🧪 Usage: DATABASE_URL=postgresql://... DATABASE_READ_URL=postgresql://... \
+#           python test_read_routing.py
+# 🔍 Two local Postgres instances are enough; no tables are touched. Each pool
+#    tags its connections (application_name), so the server says who answered.
+#    Exits 1 on any misrouted request.
+# Author: Captain & Chatman
+# Version: MPA Phase II — Read Replica Routing
+# ============================================================
+
+import asyncio
+import logging
+import os
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from starlette.middleware.sessions import SessionMiddleware  # noqa: E402
+
+from control_console.config import DB_READ_YOUR_WRITES_WINDOW  # noqa: E402
+from control_console.database import create_db_pool, create_read_pool  # noqa: E402
+from control_console.utils.db import DB, DB_READ  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logging.getLogger("control_console").setLevel(logging.ERROR)  # No tables needed
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+PRIMARY = "routing-check-primary"
+REPLICA = "routing-check-read"
+WHO = "SELECT current_setting('application_name')"
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="routing-check")
+
+    @app.get("/read", dependencies=[DB_READ])
+    async def read(request: Request):
+        return {"pool": await request.state.db.fetchval(WHO)}
+
+    # A second route_to() after the first query must not move the connection
+    @app.get("/read-twice", dependencies=[DB_READ])
+    async def read_twice(request: Request):
+        db = request.state.db
+        first = await db.fetchval(WHO)
+        db.route_to(request.app.state.db_pool)
+        return {"pool": first, "again": await db.fetchval(WHO)}
+
+    @app.post("/write", dependencies=[DB])
+    async def write(request: Request):
+        return {"pool": await request.state.db.fetchval(WHO)}
+
+    # Never touches the database — must not pin the session
+    @app.post("/no-db", dependencies=[DB])
+    async def no_db():
+        return {}
+
+    return app
+
+
+async def run_checks(app: FastAPI) -> bool:
+    ok = True
+    transport = httpx.ASGITransport(app=app)
+
+    def expect(label: str, got, want) -> None:
+        nonlocal ok
+        if got == want:
+            logging.info("✅ %-52s %s", label, got)
+        else:
+            logging.error("❌ %-52s %s (expected %s)", label, got, want)
+            ok = False
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as a:
+        expect(
+            "DB_READ GET → read pool", (await a.get("/read")).json()["pool"], REPLICA
+        )
+
+        body = (await a.get("/read-twice")).json()
+        expect("route_to() after the first query is a no-op", body["again"], REPLICA)
+
+        await a.post("/no-db")
+        expect(
+            "POST without a query → still the read pool",
+            (await a.get("/read")).json()["pool"],
+            REPLICA,
+        )
+
+        expect("POST → primary", (await a.post("/write")).json()["pool"], PRIMARY)
+        expect(
+            f"DB_READ GET within {DB_READ_YOUR_WRITES_WINDOW:g}s of the POST → primary",
+            (await a.get("/read")).json()["pool"],
+            PRIMARY,
+        )
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as b:
+            expect(
+                "another session meanwhile → read pool",
+                (await b.get("/read")).json()["pool"],
+                REPLICA,
+            )
+
+        await asyncio.sleep(DB_READ_YOUR_WRITES_WINDOW + 0.5)
+        expect(
+            "same session after the window → read pool",
+            (await a.get("/read")).json()["pool"],
+            REPLICA,
+        )
+    return ok
+
+
+async def main() -> bool:
+    if not os.getenv("DATABASE_URL"):
+        raise ValueError("❌ DATABASE_URL is not set.")
+    if not os.getenv("DATABASE_READ_URL"):
+        raise ValueError("❌ DATABASE_READ_URL is not set.")
+
+    app = build_app()
+    app.state.db_pool = await create_db_pool(
+        min_size=1, max_size=2, server_settings={"application_name": PRIMARY}
+    )
+    app.state.db_read_pool = await create_read_pool(
+        min_size=1, max_size=2, server_settings={"application_name": REPLICA}
+    )
+    try:
+        return await run_checks(app)
+    finally:
+        await app.state.db_read_pool.close()
+        await app.state.db_pool.close()
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)